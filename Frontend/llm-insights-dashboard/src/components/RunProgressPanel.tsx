@@ -0,0 +1,80 @@
+import { Button } from '@/components/ui/button';
+import { Progress } from '@/components/ui/progress';
+import { MetricCard } from '@/components/MetricCard';
+import { RunStatus } from '@/lib/api';
+import { Activity, CheckCircle, Gauge, Loader2, Scale, XCircle } from 'lucide-react';
+
+interface RunProgressPanelProps {
+  status: RunStatus;
+  onCancel?: () => void;
+  isCancelling?: boolean;
+}
+
+function formatRate(value: number | null | undefined) {
+  return value === null || value === undefined ? '—' : `${value.toFixed(2)}/s`;
+}
+
+export function RunProgressPanel({ status, onCancel, isCancelling }: RunProgressPanelProps) {
+  const progress = status.progress;
+
+  return (
+    <div className="space-y-6">
+      <div className="flex items-center justify-between">
+        <div className="flex items-center gap-3">
+          <Loader2 className="h-5 w-5 animate-spin text-primary" />
+          <div>
+            <p className="font-medium text-foreground capitalize">
+              {status.status}
+              {progress && progress.stage !== status.status ? ` · ${progress.stage}` : ''}
+            </p>
+            <p className="text-sm text-muted-foreground">
+              {progress
+                ? `${progress.inferred}/${progress.total_samples} inferred · ${progress.judged}/${progress.total_samples} judged · ${progress.elapsed_seconds.toFixed(0)}s elapsed`
+                : 'Waiting for a worker to pick up this run'}
+            </p>
+          </div>
+        </div>
+        {onCancel && (
+          <Button variant="outline" onClick={onCancel} disabled={isCancelling}>
+            {isCancelling ? <Loader2 className="h-4 w-4 animate-spin" /> : 'Cancel Run'}
+          </Button>
+        )}
+      </div>
+
+      <Progress value={progress?.percent_complete ?? 0} />
+
+      {progress && (
+        <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-4">
+          <MetricCard
+            title="Running Accuracy"
+            value={progress.running_accuracy}
+            subtitle="Exact match so far"
+            icon={CheckCircle}
+          />
+          <MetricCard
+            title="Judge Coverage"
+            value={progress.judge_coverage}
+            subtitle="Judged samples with a valid verdict"
+            icon={Scale}
+          />
+          <MetricCard
+            title="Model Failures"
+            value={String(progress.model_failures)}
+            icon={XCircle}
+            variant={progress.model_failures > 0 ? 'warning' : 'default'}
+          />
+          <MetricCard
+            title="Throughput"
+            value={
+              progress.stage === 'judging'
+                ? formatRate(progress.judging_per_second)
+                : formatRate(progress.inference_per_second)
+            }
+            subtitle={progress.stage === 'judging' ? 'Judgments per second' : 'Samples per second'}
+            icon={progress.stage === 'judging' ? Gauge : Activity}
+          />
+        </div>
+      )}
+    </div>
+  );
+}
@@ -40,6 +40,33 @@ export interface ReportMetrics {
   high_disagreement_rate: number | null;
 }
 
+export interface RunProgress {
+  stage: string;
+  total_samples: number;
+  inferred: number;
+  judged: number;
+  model_failures: number;
+  running_accuracy: number | null;
+  judge_coverage: number | null;
+  elapsed_seconds: number;
+  inference_per_second: number | null;
+  judging_per_second: number | null;
+  percent_complete: number;
+}
+
+export interface RunStatus {
+  run_id: string;
+  status: "queued" | "running" | "completed" | "failed" | "cancelled";
+  error?: string | null;
+  progress?: RunProgress | null;
+}
+
+export interface ReportStreamHandlers {
+  onProgress: (status: RunStatus) => void;
+  onDone: (status: RunStatus["status"], body: ReportMetrics | RunStatus) => void;
+  onError?: () => void;
+}
+
 export interface CompareRequest {
   baseline_run_id: string;
   candidate_run_id: string;
@@ -83,13 +110,52 @@ export const api = {
    * Fetch aggregated report for a run
    * GET /report/{run_id}
    */
-  getReport: async (runId: string): Promise<ReportMetrics> => {
-    const response = await apiClient.get<ReportMetrics>(
+  getReport: async (runId: string): Promise<ReportMetrics | RunStatus> => {
+    const response = await apiClient.get<ReportMetrics | RunStatus>(
       `/report/${runId}`
     );
     return response.data;
   },
 
+  /**
+   * Subscribe to live progress of a queued or running evaluation
+   * GET /report/{run_id}/stream (Server-Sent Events)
+   * Returns a function that closes the stream.
+   */
+  streamReport: (runId: string, handlers: ReportStreamHandlers): (() => void) => {
+    const source = new EventSource(`${API_BASE_URL}/report/${runId}/stream`);
+
+    source.addEventListener("progress", (event) => {
+      handlers.onProgress(JSON.parse((event as MessageEvent).data));
+    });
+
+    (["completed", "failed", "cancelled"] as const).forEach((status) => {
+      source.addEventListener(status, (event) => {
+        source.close();
+        handlers.onDone(status, JSON.parse((event as MessageEvent).data));
+      });
+    });
+
+    source.onerror = () => {
+      // The server closes the stream after the final event; only report
+      // errors while the stream is still expected to be open.
+      if (source.readyState !== EventSource.CLOSED) {
+        source.close();
+        handlers.onError?.();
+      }
+    };
+
+    return () => source.close();
+  },
+
+  /**
+   * Cancel a queued or running evaluation
+   * POST /runs/{run_id}/cancel
+   */
+  cancelRun: async (runId: string): Promise<void> => {
+    await apiClient.post(`/runs/${runId}/cancel`);
+  },
+
   /**
    * Compare two evaluation runs
    * POST /compare
@@ -1,9 +1,10 @@
-import { useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Label } from '@/components/ui/label';
 import { ReportMetricsGrid } from '@/components/ReportMetricsGrid';
-import { api, ReportMetrics } from '@/lib/api';
+import { RunProgressPanel } from '@/components/RunProgressPanel';
+import { api, ReportMetrics, RunStatus } from '@/lib/api';
 import { toast } from '@/hooks/use-toast';
 import { FileText, Search, Loader2 } from 'lucide-react';
 
@@ -11,6 +12,57 @@ export default function ReportPage() {
   const [runId, setRunId] = useState('');
   const [isLoading, setIsLoading] = useState(false);
   const [report, setReport] = useState<ReportMetrics | null>(null);
+  const [liveStatus, setLiveStatus] = useState<RunStatus | null>(null);
+  const [isCancelling, setIsCancelling] = useState(false);
+  const closeStream = useRef<(() => void) | null>(null);
+
+  // Close any open progress stream when leaving the page
+  useEffect(() => () => closeStream.current?.(), []);
+
+  const watchRun = (id: string, initial: RunStatus) => {
+    setLiveStatus(initial);
+    closeStream.current = api.streamReport(id, {
+      onProgress: setLiveStatus,
+      onDone: (status, body) => {
+        closeStream.current = null;
+        setLiveStatus(null);
+        setIsCancelling(false);
+        if (status === 'completed') {
+          setReport(body as ReportMetrics);
+          return;
+        }
+        toast({
+          title: status === 'cancelled' ? 'Run Cancelled' : 'Run Failed',
+          description: (body as RunStatus).error || `Run ${id} did not complete`,
+          variant: 'destructive',
+        });
+      },
+      onError: () => {
+        closeStream.current = null;
+        toast({
+          title: 'Connection Lost',
+          description: 'Live progress stopped; fetch the report again to resume',
+          variant: 'destructive',
+        });
+      },
+    });
+  };
+
+  const handleCancelRun = async () => {
+    if (!liveStatus) return;
+    setIsCancelling(true);
+    try {
+      await api.cancelRun(liveStatus.run_id);
+    } catch (error) {
+      console.error('Failed to cancel run:', error);
+      setIsCancelling(false);
+      toast({
+        title: 'Cancel Failed',
+        description: 'Could not cancel this run',
+        variant: 'destructive',
+      });
+    }
+  };
 
   const handleFetchReport = async (e: React.FormEvent) => {
     e.preventDefault();
@@ -26,10 +78,25 @@ export default function ReportPage() {
 
     setIsLoading(true);
     setReport(null);
+    setLiveStatus(null);
+    closeStream.current?.();
+    closeStream.current = null;
 
     try {
       const data = await api.getReport(runId.trim());
-      setReport(data);
+      if ('status' in data && data.status !== 'completed') {
+        if (data.status === 'queued' || data.status === 'running') {
+          watchRun(runId.trim(), data);
+        } else {
+          toast({
+            title: data.status === 'cancelled' ? 'Run Cancelled' : 'Run Failed',
+            description: data.error || 'This run did not complete',
+            variant: 'destructive',
+          });
+        }
+      } else {
+        setReport(data as ReportMetrics);
+      }
     } catch (error) {
       console.error('Failed to fetch report:', error);
       toast({
@@ -55,7 +122,7 @@ export default function ReportPage() {
               Evaluation Report
             </h1>
             <p className="text-sm text-muted-foreground">
-              View detailed metrics for a completed evaluation
+              View live progress or detailed metrics for an evaluation
             </p>
           </div>
         </div>
@@ -92,6 +159,17 @@ export default function ReportPage() {
         </Button>
       </form>
 
+      {/* Live Progress */}
+      {liveStatus && (
+        <div className="rounded-xl border border-border bg-card p-6 shadow-sm">
+          <RunProgressPanel
+            status={liveStatus}
+            onCancel={handleCancelRun}
+            isCancelling={isCancelling}
+          />
+        </div>
+      )}
+
       {/* Report Content */}
       {report && (
         <div className="rounded-xl border border-border bg-card p-6 shadow-sm">
@@ -100,7 +178,7 @@ export default function ReportPage() {
       )}
 
       {/* Empty State */}
-      {!report && !isLoading && (
+      {!report && !liveStatus && !isLoading && (
         <div className="text-center py-16 space-y-4">
           <div className="h-16 w-16 rounded-2xl bg-muted flex items-center justify-center mx-auto">
             <FileText className="h-8 w-8 text-muted-foreground" />
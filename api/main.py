@@ -1,8 +1,39 @@
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.routes import evaluate, report, compare
+from api.metrics import prepare_multiprocess_dir
+from api.routes import evaluate, report, compare, jobs, metrics
+from api.routes._store import JOB_QUEUE
+from jobs.worker import WorkerPool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Embedded worker pool; set AUTOELAVE_WORKERS=0 and run
+    # `python -m jobs.worker` to host workers separately.
+    num_workers = int(os.getenv("AUTOELAVE_WORKERS", "2"))
+    pool = None
+
+    if num_workers > 0:
+        if os.getenv("AUTOELAVE_RUN_STORE") == "memory":
+            raise RuntimeError(
+                "Worker processes cannot share an in-memory run store; "
+                "use a SQLite AUTOELAVE_RUN_STORE or AUTOELAVE_WORKERS=0."
+            )
+        # Workers record Prometheus metrics into files the API aggregates
+        prepare_multiprocess_dir()
+        pool = WorkerPool(num_workers, queue_url=JOB_QUEUE.url)
+        pool.start()
+
+    yield
+
+    if pool:
+        pool.stop()
+
 
-app = FastAPI(title="AutoElave LLM Evaluation API")
+app = FastAPI(title="AutoElave LLM Evaluation API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,3 +46,5 @@ app.add_middleware(
 app.include_router(evaluate.router)
 app.include_router(report.router)
 app.include_router(compare.router)
+app.include_router(jobs.router)
+app.include_router(metrics.router)
@@ -0,0 +1,243 @@
+import glob
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Histogram, multiprocess
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:
+    # Metrics are optional: recording becomes a no-op and /metrics a 503
+    prometheus_client = None
+
+from evaluation.instrumentation import Span
+from models.llm_clients.base import BaseLLM
+from models.llm_clients.cache import CachedLLM
+from models.llm_clients.rate_limit import stats_delta
+
+
+# Worker processes write their metrics here so the API can serve the
+# sum over all processes (prometheus_client multiprocess mode)
+DEFAULT_MULTIPROC_DIR = ".autoelave/prometheus"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _require_prometheus():
+    if prometheus_client is None:
+        raise ImportError(
+            "Prometheus metrics require prometheus_client. "
+            "Install it with `pip install prometheus-client`."
+        )
+    return prometheus_client
+
+
+# -------------------------------
+# Metric definitions
+# -------------------------------
+if prometheus_client is not None:
+    LLM_CALLS = Counter(
+        "autoelave_llm_calls",
+        "LLM calls made by runs",
+        ["client", "role", "outcome"],
+    )
+    LLM_LATENCY = Histogram(
+        "autoelave_llm_call_latency_seconds",
+        "Latency of LLM calls, including retries",
+        ["client", "role"],
+        buckets=LATENCY_BUCKETS,
+    )
+    LLM_THROTTLES = Counter(
+        "autoelave_llm_throttles",
+        "Rate-limit (HTTP 429) responses from LLM providers",
+        ["client"],
+    )
+    LLM_RETRIES = Counter(
+        "autoelave_llm_retries",
+        "Retried LLM requests",
+        ["client"],
+    )
+    LLM_TOKENS = Counter(
+        "autoelave_llm_tokens",
+        "Tokens sent to and received from LLM providers",
+        ["client", "direction"],
+    )
+    JUDGE_PARSE_FAILURES = Counter(
+        "autoelave_judge_parse_failures",
+        "Judge replies without a usable score (judge_score is None)",
+        ["judge"],
+    )
+    SAMPLES = Counter(
+        "autoelave_samples",
+        "Samples run through model inference",
+        ["dataset"],
+    )
+    CACHE_LOOKUPS = Counter(
+        "autoelave_cache_lookups",
+        "Response cache lookups",
+        ["result"],
+    )
+    RUNS_FINISHED = Counter(
+        "autoelave_runs_finished",
+        "Runs that reached a final status",
+        ["status"],
+    )
+
+
+class RunMetrics:
+    """
+    Feeds one run's activity into the process's Prometheus metrics.
+
+    LLM calls and their latency come from the run's tracer spans
+    (pass observe_span as Tracer(on_span=...)); throttles, retries,
+    tokens and cache lookups are read as deltas of the clients' own
+    stats() counters whenever observe_clients() is called, so the
+    counters move while the run is in progress. Does nothing if
+    prometheus_client is not installed.
+    """
+
+    def __init__(self, dataset: str, inference_client: str):
+        self.enabled = prometheus_client is not None
+        self.dataset = dataset
+        self.inference_client = inference_client
+        # Judge span name ("judge.judge_0") -> client label
+        self.judge_clients: Dict[str, str] = {}
+
+        self._lock = threading.Lock()
+        self._snapshots: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def add_judge(self, span_name: str, client: str) -> None:
+        self.judge_clients[span_name] = client
+
+    def observe_span(self, span: Span) -> None:
+        if not self.enabled:
+            return
+
+        if span.name == "llm.inference":
+            role, client, calls = "inference", self.inference_client, 1
+            SAMPLES.labels(self.dataset).inc()
+        elif span.name in self.judge_clients:
+            role, client = "judge", self.judge_clients[span.name]
+            calls = span.attributes.get("batch_size", 1)
+        else:
+            return
+
+        failed = span.error is not None or span.attributes.get("success") is False
+        LLM_CALLS.labels(client, role, "error" if failed else "success").inc(calls)
+        LLM_LATENCY.labels(client, role).observe(span.duration)
+
+    def observe_judgment(self, judgment: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        for i, raw in enumerate(judgment.get("raw_judgments", [])):
+            if raw.get("judge_score") is None:
+                JUDGE_PARSE_FAILURES.labels(f"judge_{i}").inc()
+
+    def _delta(self, kind: str, source, after: Dict[str, Any]) -> Dict[str, Any]:
+        # First sighting is the baseline: clients and limiters are shared
+        # across runs, so only what happens from now on belongs to this run
+        key = (kind, id(source))
+        with self._lock:
+            before = self._snapshots.get(key, after)
+            self._snapshots[key] = after
+        return stats_delta(before, after)
+
+    def observe_clients(self, clients: List[Tuple[str, BaseLLM]]) -> None:
+        """
+        Record counter growth of (client label, client) pairs since the
+        previous call. A rate limiter shared by several clients is
+        counted once, under the first client that uses it.
+        """
+        if not self.enabled:
+            return
+
+        for client, llm in clients:
+            limiter = getattr(llm, "rate_limiter", None)
+            if limiter is not None:
+                delta = self._delta("limiter", limiter, limiter.stats())
+                if delta["throttles"] > 0:
+                    LLM_THROTTLES.labels(client).inc(delta["throttles"])
+
+            if llm.usage is not None:
+                delta = self._delta("usage", llm.usage, llm.usage.stats())
+                if delta["retries"] > 0:
+                    LLM_RETRIES.labels(client).inc(delta["retries"])
+                if delta["input_tokens"] > 0:
+                    LLM_TOKENS.labels(client, "input").inc(delta["input_tokens"])
+                if delta["output_tokens"] > 0:
+                    LLM_TOKENS.labels(client, "output").inc(delta["output_tokens"])
+
+            if isinstance(llm, CachedLLM):
+                delta = self._delta("cache", llm, {"hits": llm.hits, "misses": llm.misses})
+                if delta["hits"] > 0:
+                    CACHE_LOOKUPS.labels("hit").inc(delta["hits"])
+                if delta["misses"] > 0:
+                    CACHE_LOOKUPS.labels("miss").inc(delta["misses"])
+
+
+def record_run_finished(status: str) -> None:
+    if prometheus_client is not None:
+        RUNS_FINISHED.labels(status).inc()
+
+
+# -------------------------------
+# Exposition (API process)
+# -------------------------------
+def prepare_multiprocess_dir() -> Optional[str]:
+    """
+    Point PROMETHEUS_MULTIPROC_DIR at a fresh directory before the API
+    spawns its worker pool, so the workers' metrics can be collected.
+    Must run before the workers start; they inherit the environment.
+    """
+    if prometheus_client is None:
+        return None
+
+    path = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", DEFAULT_MULTIPROC_DIR)
+    os.makedirs(path, exist_ok=True)
+    # Files left by a previous API process would be summed in forever
+    for stale in glob.glob(os.path.join(path, "*.db")):
+        os.remove(stale)
+    return path
+
+
+class QueueCollector:
+    """
+    Gauges read from the job queue at scrape time, so they are correct
+    however many worker processes there are.
+    """
+
+    def __init__(self, queue):
+        self.queue = queue
+
+    def collect(self):
+        depth = self.queue.depth()
+
+        jobs = GaugeMetricFamily("autoelave_jobs", "Jobs in the queue by status", labels=["status"])
+        for status, count in depth.items():
+            jobs.add_metric([status], count)
+        yield jobs
+
+        yield GaugeMetricFamily("autoelave_queue_depth", "Jobs waiting for a worker", value=depth["queued"])
+        yield GaugeMetricFamily("autoelave_active_runs", "Runs being evaluated", value=depth["running"])
+
+
+def render_metrics(queue) -> Tuple[bytes, str]:
+    """
+    Text exposition of all metrics: this process's (or, in multiprocess
+    mode, every worker's) plus the queue gauges.
+    """
+    prometheus = _require_prometheus()
+
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus.REGISTRY
+
+    queue_registry = CollectorRegistry()
+    queue_registry.register(QueueCollector(queue))
+
+    body = prometheus.generate_latest(registry) + prometheus.generate_latest(queue_registry)
+    return body, prometheus.CONTENT_TYPE_LATEST
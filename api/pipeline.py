@@ -0,0 +1,445 @@
+import asyncio
+import os
+from collections import Counter
+from typing import Callable, Optional
+
+from api.routes._store import RUN_STORE
+from api.metrics import RunMetrics
+
+from eval_datasets.registry import load_dataset_by_name
+from models.llm_clients.registry import build_llm
+from models.llm_clients.hf_local import batching_summary
+from models.llm_clients.cache import ResponseCache, CachedLLM
+from models.llm_clients.rate_limit import stats_delta, track_limiter_usage
+from models.llm_clients.usage import usage_with_cost
+from evaluation.checkpoint import RunLog
+from evaluation.columnar import ResultTable
+from evaluation.fingerprint import run_config, sample_fingerprints
+from evaluation.results import EvalResult
+from evaluation.progress import ProgressTracker
+from evaluation.instrumentation import Tracer, TracedJudge, build_run_summary
+from evaluation.orchestrator import aevaluate_dataset, ajudge_dataset
+from evaluation.metrics.exact_match import ExactMatchMetric
+from evaluation.metrics.pipeline import MetricPipeline, summarize_metric_scores
+from evaluation.metrics.registry import metrics_for_dataset
+from evaluation.judges.llm_judge import LLMJudge
+from evaluation.judges.agreement import JudgeAgreement
+from evaluation.judges.cascade import CascadingJudgeAgreement, dataset_signals, summarize_cascade
+from evaluation.aggregation.report import aggregate_dataset_report
+
+
+NUM_JUDGES = 3
+
+# Share of cascaded samples also scored by the full judge panel
+CASCADE_AUDIT_RATE = float(os.getenv("AUTOELAVE_CASCADE_AUDIT_RATE", "0.1"))
+
+
+class EvaluationCancelled(Exception):
+    """
+    Raised inside the pipeline when the run's job has been cancelled.
+    """
+    pass
+
+
+async def run_evaluation_background(
+    run_id: str,
+    dataset: str,
+    model_name: str,
+    max_workers: int = 4,
+    use_cache: bool = False,
+    resume: bool = False,
+    max_samples: int = 10,
+    batch_size: int = 1,
+    incremental: bool = False,
+    cascade: bool = False,
+    should_cancel: Optional[Callable[[], bool]] = None,
+    queue_wait_seconds: Optional[float] = None,
+) -> str:
+    """
+    Run the full evaluation pipeline for one run and record the outcome
+    in RUN_STORE. Returns the final run status: "completed", "failed"
+    or "cancelled".
+
+    should_cancel is polled between stages and after every sample; once
+    it returns True the run stops (its run log stays resumable).
+
+    batch_size > 1 sends inference and judge prompts in micro-batches
+    through the clients' generate_batch API.
+
+    incremental=True copies samples whose fingerprint (sample fields plus
+    model and judge config) matches a sample of an earlier completed run
+    instead of re-running them; only new or changed samples are inferred
+    and judged. report["lineage"] records where copies came from.
+
+    cascade=True calls judges only as far as each sample needs (see
+    CascadingJudgeAgreement): exact match or similarity signals and
+    confident single judges decide most samples. report["cascade"] has
+    the judge calls saved and how an audited share of samples compares
+    with the full panel (AUTOELAVE_CASCADE_AUDIT_RATE).
+
+    Every stage, model call, metric and judge call is traced; the
+    timing, token, cost and throughput summary goes into
+    report["instrumentation"] and the spans into the run's trace file
+    (OTLP/JSON). queue_wait_seconds is how long the job was queued.
+    """
+    print(f"[BG] START evaluation for {run_id} (resume={resume})")
+
+    def check_cancelled():
+        if should_cancel and should_cancel():
+            raise EvaluationCancelled(f"Run {run_id} was cancelled")
+
+    metric = ExactMatchMetric()
+    fresh_exact = {}
+    run_metrics = RunMetrics(dataset, inference_client=model_name)
+    tracer = Tracer(run_id, on_span=run_metrics.observe_span)
+    # (label, client) pairs whose counters feed Prometheus
+    metered_clients = []
+    # The dataset's extra metrics, once started
+    extra_task = None
+    run_log = None
+
+    def set_stage(stage):
+        progress.set_stage(stage)
+        tracer.stage(stage)
+
+    def on_result(result):
+        tracer.record(
+            "llm.inference",
+            result.latency or 0.0,
+            sample_id=result.sample_id,
+            success=result.success,
+        )
+        # Score as results arrive so progress can show running accuracy
+        with tracer.span("metric.exact_match"):
+            score = metric.compute(result)
+        fresh_exact[result.sample_id] = score
+        run_log.append_result(result)
+        run_log.append_exact_match(result.sample_id, score)
+        progress.record_result(result, score)
+        run_metrics.observe_clients(metered_clients)
+        check_cancelled()
+
+    def on_judgment(result, judgment):
+        run_log.append_judgment(result.sample_id, judgment)
+        progress.record_judgment(judgment)
+        run_metrics.observe_judgment(judgment)
+        run_metrics.observe_clients(metered_clients)
+        check_cancelled()
+
+    try:
+        RUN_STORE.update_run(run_id, status="running")
+
+        run_log = RunLog(run_id)
+        checkpoint = run_log.load() if resume else None
+        if not resume:
+            run_log.write_header(
+                dataset=dataset,
+                model_name=model_name,
+                max_workers=max_workers,
+                use_cache=use_cache,
+                max_samples=max_samples,
+                batch_size=batch_size,
+                incremental=incremental,
+                cascade=cascade,
+            )
+
+        progress = ProgressTracker(
+            total=max_samples,
+            publish=lambda snapshot: RUN_STORE.update_run(run_id, progress=snapshot),
+        )
+        set_stage("loading_dataset")
+
+        print("[BG] Loading dataset...")
+        samples = await asyncio.to_thread(load_dataset_by_name, dataset, limit=max_samples)
+        progress.total = len(samples)
+        metric.precompute(s.reference for s in samples)
+        print(f"[BG] Loaded {len(samples)} samples")
+
+        # Samples whose model call already succeeded are not re-run,
+        # and neither are their exact-match scores or judgments.
+        done = checkpoint.completed_results() if checkpoint else {}
+        pending = [s for s in samples if s.id not in done]
+        if done:
+            print(f"[BG] Resuming: {len(done)} samples already completed")
+
+        check_cancelled()
+
+        print("[BG] Initializing LLM...")
+        cache = ResponseCache() if use_cache else None
+        llm = build_llm(model_name)
+        # Local clients have no rate limiter; they report batching stats instead
+        rate_limiter = getattr(llm, "rate_limiter", None)
+        # Limiters are shared with concurrent runs; count only this run's calls
+        limiter_usage = track_limiter_usage()
+        scheduler = getattr(llm, "scheduler", None)
+        batching_before = scheduler.stats() if scheduler else None
+        usage_before = llm.usage.stats() if llm.usage else None
+        if cache:
+            llm = CachedLLM(llm, cache)
+        run_metrics.inference_client = getattr(llm, "model_name", model_name)
+        metered_clients.append((run_metrics.inference_client, llm))
+        run_metrics.observe_clients(metered_clients)
+        print("[BG] LLM initialized")
+
+        # AUTOELAVE_JUDGE_MODEL uses the same naming as model_name; an "hf:"
+        # judge on the evaluated model reuses its already loaded weights
+        judge_model = os.getenv("AUTOELAVE_JUDGE_MODEL", "")
+        fingerprints = sample_fingerprints(samples, run_config(
+            dataset=dataset,
+            model_name=model_name,
+            client_model=getattr(llm, "model_name", None),
+            judge_model=judge_model,
+            num_judges=NUM_JUDGES,
+            cascade=cascade,
+        ))
+
+        prior_exact = dict(checkpoint.exact_match) if checkpoint else {}
+        copied = {}
+        if incremental and pending:
+            print("[BG] Looking up unchanged samples in earlier runs...")
+            prior = await asyncio.to_thread(
+                RUN_STORE.find_samples, [fingerprints[s.id] for s in pending]
+            )
+            for sample in pending:
+                record = prior.get(fingerprints[sample.id])
+                # Failed model calls are retried rather than copied
+                if record and record["run_id"] != run_id and record["result"]["success"]:
+                    copied[sample.id] = record
+
+            if copied:
+                pending = [s for s in pending if s.id not in copied]
+                run_log.append_copied(list(copied.values()))
+                for sid, record in copied.items():
+                    done[sid] = EvalResult(**record["result"])
+                    prior_exact[sid] = record["exact_match"]
+            print(f"[BG] Copied {len(copied)} unchanged samples, {len(pending)} to evaluate")
+
+        print("[BG] Running model inference...")
+        set_stage("inference")
+        for sample in samples:
+            if sample.id in done:
+                progress.record_result(done[sample.id], prior_exact.get(sample.id))
+        new_results = await aevaluate_dataset(
+            samples=pending,
+            llm=llm,
+            dataset_name=dataset,
+            max_concurrency=max_workers,
+            batch_size=batch_size,
+            on_result=on_result,
+        )
+        fresh = {r.sample_id: r for r in new_results}
+        # One columnar table for the rest of the run instead of an
+        # EvalResult object per sample
+        results = ResultTable.from_results(done.get(s.id) or fresh[s.id] for s in samples)
+        done_ids = set(done)
+        del new_results, fresh, done
+        if checkpoint:
+            checkpoint.results.clear()
+        print(f"[BG] Model inference completed, got {len(results)} results")
+
+        print("[BG] Computing exact match...")
+        # Results that were neither scored on arrival nor in an earlier log
+        unscored = [r for r in results if r.sample_id not in fresh_exact and r.sample_id not in prior_exact]
+        if unscored:
+            with tracer.span("metric.exact_match", batch_size=len(unscored)):
+                for r, score in zip(unscored, metric.compute_batch(unscored)):
+                    run_log.append_exact_match(r.sample_id, score)
+                    fresh_exact[r.sample_id] = score
+        exact_scores = [
+            fresh_exact[r.sample_id] if r.sample_id in fresh_exact else prior_exact[r.sample_id]
+            for r in results
+        ]
+        print("[BG] Exact match computed")
+
+        # The dataset's other metrics run alongside judging
+        extra_metrics = MetricPipeline([
+            m for m in metrics_for_dataset(dataset) if m.name() != metric.name()
+        ])
+
+        async def compute_extra_metrics():
+            with tracer.span("metric.extra", metrics=len(extra_metrics.metrics)):
+                return await extra_metrics.acompute(results)
+
+        extra_task = asyncio.create_task(compute_extra_metrics()) if extra_metrics.metrics else None
+
+        check_cancelled()
+
+        print("[BG] Initializing judges...")
+        judge_llms = [build_llm(judge_model) for _ in range(NUM_JUDGES)]
+        judge_usage_before = [j.usage.stats() if j.usage else None for j in judge_llms]
+        if cache:
+            # One namespace per judge so judges never share cached answers
+            judge_llms = [
+                CachedLLM(judge_llm, cache, namespace=f"judge_{i}")
+                for i, judge_llm in enumerate(judge_llms)
+            ]
+        judges = [
+            TracedJudge(LLMJudge(judge_llm), tracer, f"judge.judge_{i}")
+            for i, judge_llm in enumerate(judge_llms)
+        ]
+        for i, judge_llm in enumerate(judge_llms):
+            judge_client = getattr(judge_llm, "model_name", judge_model or "gemini")
+            run_metrics.add_judge(f"judge.judge_{i}", judge_client)
+            metered_clients.append((judge_client, judge_llm))
+        run_metrics.observe_clients(metered_clients)
+        if cascade:
+            # Signals may use the dataset's other metrics, so those go first
+            extra_scores = await extra_task if extra_task else {}
+            signal_scores = {
+                name: {r.sample_id: score for r, score in zip(results, scores)}
+                for name, scores in [(metric.name(), exact_scores), *extra_scores.items()]
+            }
+            agreement = CascadingJudgeAgreement(
+                judges,
+                signals=dataset_signals(dataset, signal_scores),
+                audit_rate=CASCADE_AUDIT_RATE,
+            )
+        else:
+            agreement = JudgeAgreement(judges)
+        print("[BG] Judges initialized")
+
+        print("[BG] Running judge evaluations...")
+        prior_judgments = {
+            sid: j for sid, j in (checkpoint.judgments.items() if checkpoint else [])
+            if sid in done_ids and j.get("agreement_success")
+        }
+        for sid, record in copied.items():
+            judgment = record.get("judgment")
+            if judgment and judgment.get("agreement_success"):
+                prior_judgments.setdefault(sid, judgment)
+        to_judge = [r for r in results if r.sample_id not in prior_judgments]
+        set_stage("judging")
+        for judgment in prior_judgments.values():
+            progress.record_judgment(judgment)
+        new_judgments = await ajudge_dataset(
+            to_judge,
+            agreement,
+            max_concurrency=max_workers * len(judges),
+            on_judgment=on_judgment,
+            batch_size=batch_size,
+        )
+        fresh_judgments = {r.sample_id: j for r, j in zip(to_judge, new_judgments)}
+        judge_agreements = [
+            prior_judgments.get(r.sample_id) or fresh_judgments[r.sample_id]
+            for r in results
+        ]
+        print("[BG] Judge evaluations completed")
+
+        extra_scores = await extra_task if extra_task else {}
+        for name, error in extra_metrics.errors.items():
+            print(f"[BG] Metric {name} failed: {error}")
+
+        print("[BG] Aggregating report...")
+        set_stage("aggregating")
+        report = aggregate_dataset_report(
+            results=results,
+            exact_match_scores=exact_scores,
+            judge_agreements=judge_agreements,
+            dataset_name=dataset,
+            model_name=model_name,
+        )
+        if extra_scores or extra_metrics.errors:
+            report["metrics"] = {
+                **summarize_metric_scores(extra_scores),
+                **{name: {"error": error} for name, error in extra_metrics.errors.items()},
+            }
+            # Tells an all-None metric apart from one with nothing to score
+            for name, reason in extra_metrics.unavailable.items():
+                report["metrics"].setdefault(name, {})["unavailable"] = reason
+        if cascade:
+            report["cascade"] = summarize_cascade(new_judgments, len(judges))
+        print("[BG] Report aggregated")
+
+        # This run's calls through the inference and judge limiters; the
+        # effective rate is the shared limiter's current one
+        if rate_limiter:
+            report["rate_limiter"] = {
+                **limiter_usage.stats(),
+                "effective_requests_per_minute": rate_limiter.stats()["effective_requests_per_minute"],
+            }
+
+        # Copies point at the run that originally computed the sample
+        copied_from = {
+            sid: record.get("copied_from") or record["run_id"]
+            for sid, record in copied.items()
+        }
+        if incremental:
+            report["lineage"] = {
+                "copied_samples": len(copied),
+                "evaluated_samples": len(pending),
+                "source_runs": dict(Counter(copied_from.values())),
+            }
+        if scheduler:
+            report["batching"] = batching_summary(batching_before, scheduler.stats())
+
+        # Token usage of this run only (clients may be shared across runs)
+        usage = {}
+        clients = [("inference", llm, usage_before)] + [
+            (f"judge_{i}", judge_llm, before)
+            for i, (judge_llm, before) in enumerate(zip(judge_llms, judge_usage_before))
+        ]
+        for role, client, before in clients:
+            if client.usage and before:
+                usage[role] = usage_with_cost(
+                    getattr(client, "model_name", model_name),
+                    stats_delta(before, client.usage.stats()),
+                )
+
+        tracer.finish()
+        run_metrics.observe_clients(metered_clients)
+        report["instrumentation"] = build_run_summary(
+            tracer,
+            usage,
+            num_samples=len(pending),
+            num_judge_calls=(
+                report["cascade"]["judge_calls"] + report["cascade"]["audit"]["judge_calls"]
+                if cascade
+                else len(to_judge) * len(judges)
+            ),
+            queue_wait_seconds=queue_wait_seconds,
+            rate_limiter=report.get("rate_limiter"),
+        )
+        tracer.export(run_log.trace_path)
+
+        if cache:
+            report["cache"] = {
+                "inference": llm.stats(),
+                "judges": [judge_llm.stats() for judge_llm in judge_llms],
+                "store": cache.stats(),
+            }
+            cache.close()
+
+        RUN_STORE.save_samples(run_id, [
+            {
+                "sample_id": r.sample_id,
+                "fingerprint": fingerprints[r.sample_id],
+                **({"copied_from": copied_from[r.sample_id]} if r.sample_id in copied_from else {}),
+                "result": r.to_dict(),
+                "exact_match": score,
+                "judgment": judgment,
+                **({"metrics": {name: scores[i] for name, scores in extra_scores.items()}} if extra_scores else {}),
+            }
+            for i, (r, score, judgment) in enumerate(zip(results, exact_scores, judge_agreements))
+        ])
+        progress.set_stage("completed")
+        RUN_STORE.update_run(run_id, status="completed", report=report)
+
+        print(f"[BG] COMPLETED evaluation for {run_id}")
+        return "completed"
+
+    except EvaluationCancelled as e:
+        print(f"[BG] CANCELLED evaluation for {run_id}")
+        RUN_STORE.update_run(run_id, status="cancelled", error=str(e))
+        return "cancelled"
+
+    except Exception as e:
+        print(f"[BG] ERROR during evaluation: {e}")
+        RUN_STORE.update_run(run_id, status="failed", error=str(e))
+        return "failed"
+
+    finally:
+        # Still running if the run stopped before it was awaited
+        if extra_task and not extra_task.done():
+            extra_task.cancel()
+        if run_log:
+            await asyncio.to_thread(run_log.close)
@@ -1,3 +1,5 @@
-from typing import Dict, Any
+from api.run_store import BaseRunStore, build_run_store
+from jobs.queue import JobQueue
 
-RUN_STORE: Dict[str, Dict[str, Any]] = {}
+RUN_STORE: BaseRunStore = build_run_store()
+JOB_QUEUE: JobQueue = JobQueue()
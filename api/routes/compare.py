@@ -11,11 +11,17 @@ router = APIRouter()
 
 @router.post("/compare")
 def compare_runs(req: CompareRequest):
-    if req.baseline_run_id not in RUN_STORE or req.candidate_run_id not in RUN_STORE:
+    baseline_run = RUN_STORE.get_run(req.baseline_run_id)
+    candidate_run = RUN_STORE.get_run(req.candidate_run_id)
+
+    if baseline_run is None or candidate_run is None:
         raise HTTPException(status_code=404, detail="Run ID not found")
 
-    baseline = RUN_STORE[req.baseline_run_id]["report"]
-    candidate = RUN_STORE[req.candidate_run_id]["report"]
+    baseline = baseline_run["report"]
+    candidate = candidate_run["report"]
+
+    if baseline is None or candidate is None:
+        raise HTTPException(status_code=409, detail="Both runs must be completed")
 
     diff = diff_reports(baseline, candidate)
     regression = check_regression(
@@ -1,96 +1,101 @@
 import uuid
-import time
-from fastapi import APIRouter, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from api.schemas import EvaluateRequest
-from api.routes._store import RUN_STORE
+from api.routes._store import RUN_STORE, JOB_QUEUE
 
-from eval_datasets.registry import load_dataset_by_name
-from models.llm_clients.gemini import GeminiLLM
-from evaluation.orchestrator import evaluate_dataset
-from evaluation.metrics.exact_match import ExactMatchMetric
-from evaluation.judges.llm_judge import LLMJudge
-from evaluation.judges.agreement import JudgeAgreement
-from evaluation.aggregation.report import aggregate_dataset_report
+from evaluation.checkpoint import RunLog
+from jobs.queue import QueueFullError
 
 router = APIRouter()
 
 
-def run_evaluation_background(run_id: str, dataset: str, model_name: str):
-    print(f"[BG] START evaluation for {run_id}")
-
-    try:
-        print("[BG] Loading dataset...")
-        samples = load_dataset_by_name(dataset)[:10]
-        print(f"[BG] Loaded {len(samples)} samples")
-
-        print("[BG] Initializing LLM...")
-        llm = GeminiLLM()
-        print("[BG] LLM initialized")
-
-        print("[BG] Running model inference...")
-        results = evaluate_dataset(
-            samples=samples,
-            llm=llm,
-            dataset_name=dataset,
-        )
-        print(f"[BG] Model inference completed, got {len(results)} results")
-
-        print("[BG] Computing exact match...")
-        metric = ExactMatchMetric()
-        exact_scores = [metric.compute(r) for r in results]
-        print("[BG] Exact match computed")
-
-        print("[BG] Initializing judges...")
-        judges = [LLMJudge(GeminiLLM()) for _ in range(3)]
-        agreement = JudgeAgreement(judges)
-        print("[BG] Judges initialized")
+@router.post("/evaluate")
+def run_evaluation(req: EvaluateRequest):
+    run_id = f"eval-{uuid.uuid4().hex[:8]}"
 
-        print("[BG] Running judge evaluations...")
-        judge_agreements = [agreement.evaluate(r) for r in results]
-        print("[BG] Judge evaluations completed")
+    # The row must exist before a worker can claim the job and mark it running
+    RUN_STORE.create_run(run_id, dataset=req.dataset, model=req.model_name, status="queued")
 
-        print("[BG] Aggregating report...")
-        report = aggregate_dataset_report(
-            results=results,
-            exact_match_scores=exact_scores,
-            judge_agreements=judge_agreements,
-            dataset_name=dataset,
-            model_name=model_name,
+    try:
+        job_id = JOB_QUEUE.enqueue(
+            run_id,
+            payload={
+                "dataset": req.dataset,
+                "model_name": req.model_name,
+                "max_workers": req.max_workers,
+                "use_cache": req.use_cache,
+                "max_samples": req.max_samples,
+                "batch_size": req.batch_size,
+                "incremental": req.incremental,
+                "cascade": req.cascade,
+            },
+            priority=req.priority,
         )
-        print("[BG] Report aggregated")
-
-        RUN_STORE[run_id]["report"] = report
-        RUN_STORE[run_id]["status"] = "completed"
+    except QueueFullError as e:
+        RUN_STORE.update_run(run_id, status="failed", error=str(e))
+        raise HTTPException(status_code=429, detail=str(e))
 
-        print(f"[BG] COMPLETED evaluation for {run_id}")
-
-    except Exception as e:
-        print(f"[BG] ERROR during evaluation: {e}")
-        RUN_STORE[run_id]["status"] = "failed"
-        RUN_STORE[run_id]["error"] = str(e)
+    return {
+        "run_id": run_id,
+        "job_id": job_id,
+        "status": "queued",
+        "message": "Evaluation queued",
+    }
 
 
+@router.post("/evaluate/{run_id}/resume")
+def resume_evaluation(run_id: str, priority: int = 0):
+    run_log = RunLog(run_id)
+    header = run_log.load().header if run_log.exists() else None
 
-@router.post("/evaluate")
-def run_evaluation(req: EvaluateRequest, background_tasks: BackgroundTasks):
-    run_id = f"eval-{uuid.uuid4().hex[:8]}"
+    if header is None:
+        raise HTTPException(status_code=404, detail="No run log found for this Run ID")
 
-    RUN_STORE[run_id] = {
-        "status": "running",
-        "dataset": req.dataset,
-        "model": req.model_name,
-        "created_at": time.time(),
-    }
+    run = RUN_STORE.get_run(run_id)
+    # A run whose job is gone (e.g. its worker crashed before the lease
+    # expired) is not in progress, whatever its row says
+    if run and run["status"] in ("queued", "running") and JOB_QUEUE.active_job_for_run(run_id):
+        raise HTTPException(status_code=409, detail="Run is already in progress")
 
-    background_tasks.add_task(
-        run_evaluation_background,
+    # Reset the row before enqueueing, as in run_evaluation
+    RUN_STORE.create_run(
         run_id,
-        req.dataset,
-        req.model_name,
+        dataset=header["dataset"],
+        model=header["model_name"],
+        status="queued",
+        created_at=run["created_at"] if run else None,
     )
 
+    try:
+        job_id = JOB_QUEUE.enqueue(
+            run_id,
+            payload={
+                "dataset": header["dataset"],
+                "model_name": header["model_name"],
+                "max_workers": header.get("max_workers", 4),
+                "use_cache": header.get("use_cache", False),
+                "max_samples": header.get("max_samples", 10),
+                "batch_size": header.get("batch_size", 1),
+                "incremental": header.get("incremental", False),
+                "cascade": header.get("cascade", False),
+                "resume": True,
+            },
+            priority=priority,
+        )
+    except QueueFullError as e:
+        if run:
+            # Put the previous outcome back; the run was never requeued
+            RUN_STORE.update_run(
+                run_id,
+                **{field: run[field] for field in ("status", "error", "report", "progress")},
+            )
+        else:
+            RUN_STORE.update_run(run_id, status="failed", error=str(e))
+        raise HTTPException(status_code=429, detail=str(e))
+
     return {
         "run_id": run_id,
-        "status": "running",
-        "message": "Evaluation started in background",
+        "job_id": job_id,
+        "status": "queued",
+        "message": "Evaluation resume queued",
     }
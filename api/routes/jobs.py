@@ -0,0 +1,49 @@
+from typing import Optional
+from fastapi import APIRouter, HTTPException
+from api.routes._store import RUN_STORE, JOB_QUEUE
+
+router = APIRouter()
+
+
+@router.get("/jobs")
+def list_jobs(status: Optional[str] = None, limit: int = 100):
+    return {
+        "depth": JOB_QUEUE.depth(),
+        "jobs": JOB_QUEUE.list_jobs(status=status, limit=limit),
+    }
+
+
+@router.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    job = JOB_QUEUE.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job ID not found")
+    return job
+
+
+@router.post("/jobs/{job_id}/cancel")
+def cancel_job(job_id: str):
+    job = JOB_QUEUE.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job ID not found")
+
+    return _close_cancelled_run(job)
+
+
+@router.post("/runs/{run_id}/cancel")
+def cancel_run(run_id: str):
+    job = JOB_QUEUE.active_job_for_run(run_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="No queued or running job for this Run ID")
+
+    return _close_cancelled_run(JOB_QUEUE.cancel(job["job_id"]))
+
+
+def _close_cancelled_run(job):
+    # Queued jobs never reach a worker, so close out their run here
+    if job["status"] == "cancelled":
+        run = RUN_STORE.get_run(job["run_id"])
+        if run and run["status"] == "queued":
+            RUN_STORE.update_run(job["run_id"], status="cancelled", error="Cancelled before start")
+
+    return job
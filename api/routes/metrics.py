@@ -0,0 +1,18 @@
+from fastapi import APIRouter, HTTPException, Response
+from api.metrics import render_metrics
+from api.routes._store import JOB_QUEUE
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+def get_metrics():
+    """
+    Prometheus scrape endpoint (text exposition format).
+    """
+    try:
+        body, content_type = render_metrics(JOB_QUEUE)
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    return Response(content=body, media_type=content_type)
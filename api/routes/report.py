@@ -1,21 +1,28 @@
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
 from api.routes._store import RUN_STORE
+from evaluation.checkpoint import RunLog
+from api.run_store import TERMINAL_STATUSES
 from api.schemas import ReportResponse
 
 router = APIRouter()
 
+# Seconds between SSE keep-alive comments when nothing changes
+SSE_KEEPALIVE_INTERVAL = 15.0
 
-@router.get("/report/{run_id}")
-def get_report(run_id: str):
-    if run_id not in RUN_STORE:
-        raise HTTPException(status_code=404, detail="Run ID not found")
-
-    run = RUN_STORE[run_id]
 
+def _report_body(run_id: str, run: Dict[str, Any]) -> Dict[str, Any]:
     if run["status"] != "completed":
         return {
             "run_id": run_id,
             "status": run["status"],
+            "error": run.get("error"),
+            "progress": run.get("progress"),
         }
 
     data = run["report"]
@@ -29,4 +36,112 @@ def get_report(run_id: str):
         "judge_coverage": data["judge_coverage"],
         "model_failure_rate": data["model_failure_rate"],
         "high_disagreement_rate": data["high_disagreement_rate"],
+        "confidence_intervals": data.get("confidence_intervals"),
+        "categories": data.get("categories"),
+        "metrics": data.get("metrics"),
+        "cascade": data.get("cascade"),
+        "lineage": data.get("lineage"),
+        "batching": data.get("batching"),
+        "cache": data.get("cache"),
+        "rate_limiter": data.get("rate_limiter"),
+        "instrumentation": data.get("instrumentation"),
+    }
+
+
+@router.get("/report/{run_id}")
+def get_report(run_id: str):
+    run = RUN_STORE.get_run(run_id)
+
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run ID not found")
+
+    return _report_body(run_id, run)
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/report/{run_id}/stream")
+async def stream_report(run_id: str, poll_interval: float = 0.5):
+    """
+    Server-Sent Events stream of a run's live progress.
+
+    Emits a `progress` event whenever status/progress changes, then one
+    final event named after the terminal status (`completed`, `failed`
+    or `cancelled`) carrying the same body as GET /report/{run_id}.
+    """
+    if await asyncio.to_thread(RUN_STORE.get_run, run_id) is None:
+        raise HTTPException(status_code=404, detail="Run ID not found")
+
+    async def events():
+        last_payload = None
+        last_sent = time.monotonic()
+
+        while True:
+            run = await asyncio.to_thread(RUN_STORE.get_run, run_id)
+            if run is None:
+                return
+
+            if run["status"] in TERMINAL_STATUSES:
+                yield _sse(run["status"], _report_body(run_id, run))
+                return
+
+            payload = {
+                "run_id": run_id,
+                "status": run["status"],
+                "progress": run.get("progress"),
+            }
+            if payload != last_payload:
+                yield _sse("progress", payload)
+                last_payload = payload
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent > SSE_KEEPALIVE_INTERVAL:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+
+            await asyncio.sleep(poll_interval)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/report/{run_id}/samples")
+def get_report_samples(run_id: str):
+    if run_id not in RUN_STORE:
+        raise HTTPException(status_code=404, detail="Run ID not found")
+
+    return {
+        "run_id": run_id,
+        "samples": RUN_STORE.get_samples(run_id),
+    }
+
+
+@router.get("/report/{run_id}/trace")
+def get_report_trace(run_id: str):
+    """
+    The run's spans as OTLP/JSON, e.g. for loading into a trace viewer.
+    """
+    if run_id not in RUN_STORE:
+        raise HTTPException(status_code=404, detail="Run ID not found")
+
+    path = RunLog(run_id).trace_path
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="No trace recorded for this run")
+
+    return FileResponse(path, media_type="application/json")
+
+
+@router.get("/runs")
+def list_runs(
+    dataset: Optional[str] = None,
+    model: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 100,
+):
+    return {
+        "runs": RUN_STORE.list_runs(dataset=dataset, model=model, status=status, limit=limit),
     }
@@ -0,0 +1,462 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import sqlalchemy as sa
+
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class BaseRunStore(ABC):
+    """
+    Storage for evaluation runs: run metadata, the aggregated report and
+    per-sample records, indexed by run_id, dataset and model.
+
+    A run is a dict with keys: run_id, status, dataset, model,
+    created_at, error, report, progress.
+    """
+
+    @abstractmethod
+    def create_run(
+        self,
+        run_id: str,
+        dataset: str,
+        model: str,
+        status: str = "running",
+        created_at: Optional[float] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def update_run(self, run_id: str, **fields) -> None:
+        """
+        Update any of: status, error, report, progress.
+        """
+        pass
+
+    @abstractmethod
+    def list_runs(
+        self,
+        dataset: Optional[str] = None,
+        model: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Most recent runs first, without reports.
+        """
+        pass
+
+    @abstractmethod
+    def save_samples(self, run_id: str, samples: List[Dict[str, Any]]) -> None:
+        """
+        Store per-sample records (each must have a "sample_id").
+        """
+        pass
+
+    @abstractmethod
+    def get_samples(self, run_id: str) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def find_samples(self, fingerprints: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        fingerprint -> the most recent stored record with that
+        "fingerprint" in a completed run, with its "run_id" added.
+        """
+        pass
+
+    @abstractmethod
+    def run_version(self, run_id: str) -> Optional[int]:
+        """
+        A number that changes on every write to the run (None if it does
+        not exist). Cheaper than get_run: the report is not read.
+        """
+        pass
+
+    def __contains__(self, run_id: str) -> bool:
+        return self.get_run(run_id) is not None
+
+
+# =========================
+# In-memory
+# =========================
+class InMemoryRunStore(BaseRunStore):
+    """
+    Process-local store. Runs are lost on restart and not shared
+    between workers; intended for tests and single-process demos.
+    """
+
+    def __init__(self):
+        self._runs: Dict[str, Dict[str, Any]] = {}
+        self._samples: Dict[str, List[Dict[str, Any]]] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def create_run(self, run_id, dataset, model, status="running", created_at=None):
+        with self._lock:
+            self._versions[run_id] = self._versions.get(run_id, 0) + 1
+            self._runs[run_id] = {
+                "run_id": run_id,
+                "status": status,
+                "dataset": dataset,
+                "model": model,
+                "created_at": created_at or time.time(),
+                "error": None,
+                "report": None,
+                "progress": None,
+            }
+
+    def get_run(self, run_id):
+        with self._lock:
+            run = self._runs.get(run_id)
+            return dict(run) if run else None
+
+    def update_run(self, run_id, **fields):
+        with self._lock:
+            self._runs[run_id].update(fields)
+            self._versions[run_id] += 1
+
+    def run_version(self, run_id):
+        with self._lock:
+            return self._versions.get(run_id) if run_id in self._runs else None
+
+    def list_runs(self, dataset=None, model=None, status=None, limit=100):
+        with self._lock:
+            runs = [
+                {k: v for k, v in run.items() if k not in ("report", "progress")}
+                for run in self._runs.values()
+                if (dataset is None or run["dataset"] == dataset)
+                and (model is None or run["model"] == model)
+                and (status is None or run["status"] == status)
+            ]
+        runs.sort(key=lambda r: r["created_at"], reverse=True)
+        return runs[:limit]
+
+    def save_samples(self, run_id, samples):
+        # Like the SQL store, a sample saved again replaces its old record
+        with self._lock:
+            replaced = {s["sample_id"] for s in samples}
+            kept = [s for s in self._samples.get(run_id, []) if s["sample_id"] not in replaced]
+            self._samples[run_id] = kept + list(samples)
+
+    def get_samples(self, run_id):
+        with self._lock:
+            return list(self._samples.get(run_id, []))
+
+    def find_samples(self, fingerprints):
+        wanted = set(fingerprints)
+        found = {}
+        with self._lock:
+            runs = sorted(
+                (r for r in self._runs.values() if r["status"] == "completed"),
+                key=lambda r: r["created_at"],
+            )
+            for run in runs:
+                for sample in self._samples.get(run["run_id"], []):
+                    if sample.get("fingerprint") in wanted:
+                        found[sample["fingerprint"]] = {**sample, "run_id": run["run_id"]}
+        return found
+
+
+# =========================
+# SQLite (SQLAlchemy)
+# =========================
+class SQLiteRunStore(BaseRunStore):
+    """
+    SQLite-backed store using WAL mode, so several uvicorn workers (or
+    job worker processes) can read while one writes.
+    """
+
+    def __init__(self, url: str):
+        if url.startswith("sqlite:///"):
+            directory = os.path.dirname(url[len("sqlite:///"):])
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.engine = sa.create_engine(url, connect_args={"timeout": 30})
+
+        @sa.event.listens_for(self.engine, "connect")
+        def _set_pragmas(dbapi_connection, _record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        metadata = sa.MetaData()
+        self.runs = sa.Table(
+            "runs",
+            metadata,
+            sa.Column("run_id", sa.String, primary_key=True),
+            sa.Column("status", sa.String, nullable=False),
+            sa.Column("dataset", sa.String, nullable=False, index=True),
+            sa.Column("model", sa.String, nullable=False, index=True),
+            sa.Column("created_at", sa.Float, nullable=False, index=True),
+            sa.Column("error", sa.Text),
+            sa.Column("report", sa.JSON),
+            sa.Column("progress", sa.JSON),
+            # Bumped on every write, so caches in other processes can revalidate
+            sa.Column("version", sa.Integer),
+        )
+        self.samples = sa.Table(
+            "run_samples",
+            metadata,
+            sa.Column("run_id", sa.String, nullable=False),
+            sa.Column("sample_id", sa.String, nullable=False),
+            sa.Column("dataset", sa.String, nullable=False),
+            sa.Column("model", sa.String, nullable=False),
+            sa.Column("payload", sa.JSON, nullable=False),
+            sa.Column("fingerprint", sa.String),
+            sa.PrimaryKeyConstraint("run_id", "sample_id"),
+            sa.Index("ix_run_samples_dataset_model", "dataset", "model"),
+            sa.Index("ix_run_samples_fingerprint", "fingerprint"),
+        )
+        metadata.create_all(self.engine)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self) -> None:
+        """
+        Minimal forward migration for databases created by older versions.
+        """
+        inspector = sa.inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in (self.runs, self.samples):
+                existing = {c["name"] for c in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name not in existing:
+                        conn.execute(sa.text(
+                            f"ALTER TABLE {table.name} ADD COLUMN {column.name} "
+                            f"{column.type.compile(dialect=self.engine.dialect)}"
+                        ))
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+    def _row_to_run(self, row, include_report: bool = True) -> Dict[str, Any]:
+        run = {
+            "run_id": row.run_id,
+            "status": row.status,
+            "dataset": row.dataset,
+            "model": row.model,
+            "created_at": row.created_at,
+            "error": row.error,
+        }
+        if include_report:
+            run["report"] = row.report
+            run["progress"] = row.progress
+        return run
+
+    def create_run(self, run_id, dataset, model, status="running", created_at=None):
+        with self.engine.begin() as conn:
+            # A re-created run (resume) keeps counting from its old version
+            previous = conn.execute(
+                sa.select(self.runs.c.version).where(self.runs.c.run_id == run_id)
+            ).scalar()
+            conn.execute(
+                sa.delete(self.runs).where(self.runs.c.run_id == run_id)
+            )
+            conn.execute(
+                sa.insert(self.runs).values(
+                    run_id=run_id,
+                    status=status,
+                    dataset=dataset,
+                    model=model,
+                    created_at=created_at or time.time(),
+                    version=(previous or 0) + 1,
+                )
+            )
+
+    def get_run(self, run_id):
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                sa.select(self.runs).where(self.runs.c.run_id == run_id)
+            ).first()
+        return self._row_to_run(row) if row else None
+
+    def update_run(self, run_id, **fields):
+        with self.engine.begin() as conn:
+            conn.execute(
+                sa.update(self.runs).where(self.runs.c.run_id == run_id).values(
+                    **fields, version=sa.func.coalesce(self.runs.c.version, 0) + 1
+                )
+            )
+
+    def run_version(self, run_id):
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                sa.select(self.runs.c.version).where(self.runs.c.run_id == run_id)
+            ).first()
+        return (row.version or 0) if row else None
+
+    def list_runs(self, dataset=None, model=None, status=None, limit=100):
+        query = sa.select(
+            *(c for c in self.runs.c if c.name not in ("report", "progress"))
+        ).order_by(self.runs.c.created_at.desc()).limit(limit)
+
+        if dataset is not None:
+            query = query.where(self.runs.c.dataset == dataset)
+        if model is not None:
+            query = query.where(self.runs.c.model == model)
+        if status is not None:
+            query = query.where(self.runs.c.status == status)
+
+        with self.engine.connect() as conn:
+            return [self._row_to_run(row, include_report=False) for row in conn.execute(query)]
+
+    def save_samples(self, run_id, samples):
+        if not samples:
+            return
+
+        with self.engine.begin() as conn:
+            run = conn.execute(
+                sa.select(self.runs.c.dataset, self.runs.c.model).where(self.runs.c.run_id == run_id)
+            ).first()
+            conn.execute(
+                sa.delete(self.samples).where(
+                    self.samples.c.run_id == run_id,
+                    self.samples.c.sample_id.in_([s["sample_id"] for s in samples]),
+                )
+            )
+            conn.execute(
+                sa.insert(self.samples),
+                [
+                    {
+                        "run_id": run_id,
+                        "sample_id": s["sample_id"],
+                        "dataset": run.dataset,
+                        "model": run.model,
+                        "payload": s,
+                        "fingerprint": s.get("fingerprint"),
+                    }
+                    for s in samples
+                ],
+            )
+
+    def get_samples(self, run_id):
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                sa.select(self.samples.c.payload)
+                .where(self.samples.c.run_id == run_id)
+                .order_by(sa.literal_column("rowid"))
+            )
+            return [row.payload for row in rows]
+
+    # Stay well below SQLite's bound-parameter limit
+    _FINGERPRINT_CHUNK = 500
+
+    def find_samples(self, fingerprints):
+        fingerprints = list(dict.fromkeys(fingerprints))
+        found = {}
+
+        with self.engine.connect() as conn:
+            for i in range(0, len(fingerprints), self._FINGERPRINT_CHUNK):
+                rows = conn.execute(
+                    sa.select(self.samples.c.run_id, self.samples.c.payload)
+                    .join(self.runs, self.runs.c.run_id == self.samples.c.run_id)
+                    .where(
+                        self.samples.c.fingerprint.in_(fingerprints[i:i + self._FINGERPRINT_CHUNK]),
+                        self.runs.c.status == "completed",
+                    )
+                    # Oldest first, so the most recent run wins
+                    .order_by(self.runs.c.created_at)
+                )
+                for row in rows:
+                    found[row.payload["fingerprint"]] = {**row.payload, "run_id": row.run_id}
+
+        return found
+
+
+# =========================
+# LRU read-through cache
+# =========================
+class CachedRunStore(BaseRunStore):
+    """
+    Wraps another store with a bounded LRU cache of finished runs.
+
+    Only runs in a terminal status are cached, so /report and /compare
+    load each run's report once while RAM stays bounded by max_entries.
+    A finished run can still change through another process (e.g. it is
+    resumed via a different uvicorn worker), so every hit is checked
+    against the store's run_version(), which does not read the report.
+    """
+
+    def __init__(self, store: BaseRunStore, max_entries: int = 256):
+        self.store = store
+        self.max_entries = max_entries
+        # run_id -> (version, run)
+        self._cache: "OrderedDict[str, Tuple[Optional[int], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _invalidate(self, run_id: str) -> None:
+        with self._lock:
+            self._cache.pop(run_id, None)
+
+    def create_run(self, run_id, dataset, model, status="running", created_at=None):
+        self._invalidate(run_id)
+        self.store.create_run(run_id, dataset, model, status, created_at)
+
+    def get_run(self, run_id):
+        # Read before the run, so a write in between makes the entry stale
+        version = self.store.run_version(run_id)
+
+        with self._lock:
+            cached = self._cache.get(run_id)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(run_id)
+                return dict(cached[1])
+            self._cache.pop(run_id, None)
+
+        run = self.store.get_run(run_id)
+
+        if run and run["status"] in TERMINAL_STATUSES:
+            with self._lock:
+                self._cache[run_id] = (version, run)
+                self._cache.move_to_end(run_id)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return dict(run)
+
+        return run
+
+    def run_version(self, run_id):
+        return self.store.run_version(run_id)
+
+    def update_run(self, run_id, **fields):
+        self._invalidate(run_id)
+        self.store.update_run(run_id, **fields)
+
+    def list_runs(self, dataset=None, model=None, status=None, limit=100):
+        return self.store.list_runs(dataset, model, status, limit)
+
+    def save_samples(self, run_id, samples):
+        self.store.save_samples(run_id, samples)
+
+    def get_samples(self, run_id):
+        return self.store.get_samples(run_id)
+
+    def find_samples(self, fingerprints):
+        return self.store.find_samples(fingerprints)
+
+
+def build_run_store(url: Optional[str] = None) -> BaseRunStore:
+    """
+    Build the configured run store.
+
+    AUTOELAVE_RUN_STORE selects the backend: "memory", or a SQLAlchemy
+    SQLite URL (default: sqlite:///.autoelave/runs.db).
+    """
+    url = url or os.getenv("AUTOELAVE_RUN_STORE", "sqlite:///.autoelave/runs.db")
+
+    if url == "memory":
+        store: BaseRunStore = InMemoryRunStore()
+    else:
+        store = SQLiteRunStore(url)
+
+    return CachedRunStore(store, max_entries=int(os.getenv("AUTOELAVE_RUN_CACHE_SIZE", "256")))
@@ -5,6 +5,13 @@ from typing import Optional, Dict, Any
 class EvaluateRequest(BaseModel):
     dataset: str
     model_name: str
+    max_workers: int = 4
+    max_samples: int = 10
+    use_cache: bool = False
+    batch_size: int = 1
+    incremental: bool = False
+    cascade: bool = False
+    priority: int = 0
 
 
 class EvaluateResponse(BaseModel):
@@ -0,0 +1,99 @@
+"""
+Shared data and helpers for the pytest-benchmark suite.
+
+Sizes default to 1k, 10k and 100k samples; override with e.g.
+AUTOELAVE_BENCH_SIZES=1000,10000 for a quicker run.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from eval_datasets.schemas import EvalSample
+from evaluation.results import EvalResult
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # The suite needs the `benchmark` fixture; skip collection without it
+    collect_ignore_glob = ["test_*.py"]
+
+
+SIZES = [int(n) for n in os.getenv("AUTOELAVE_BENCH_SIZES", "1000,10000,100000").split(",")]
+
+
+def rounds_for(n: int) -> int:
+    """
+    Fewer rounds for bigger inputs so every benchmark stays within seconds.
+    """
+    return max(3, min(20, 200_000 // n))
+
+
+def measure(benchmark, fn, n: int):
+    return benchmark.pedantic(fn, rounds=rounds_for(n), iterations=1, warmup_rounds=1)
+
+
+def make_samples(n: int):
+    rng = np.random.default_rng(0)
+    pairs = rng.integers(1, 1000, (n, 2))
+    return [
+        EvalSample(
+            id=f"s_{i}",
+            prompt=f"What is {a} + {b}?",
+            reference=f"{a} + {b} = {a + b}\n#### {a + b}",
+            category="arithmetic",
+        )
+        for i, (a, b) in enumerate(pairs.tolist())
+    ]
+
+
+def make_run(n: int, seed: int = 0):
+    """
+    Synthetic (results, exact_match_scores, judge_agreements) for one run.
+    """
+    rng = np.random.default_rng(seed)
+    success = rng.random(n) > 0.05
+    exact = rng.integers(0, 2, n)
+    scores = rng.integers(1, 6, (n, 3))
+    answers = rng.integers(1, 2000, n)
+    categories = np.array(["reasoning", "hallucination", "safety"])[rng.integers(0, 3, n)]
+
+    results = [
+        EvalResult(
+            sample_id=f"s_{i}",
+            prompt="Natalia sold clips to 48 of her friends in April, and then she sold half as many clips in May. How many clips did Natalia sell altogether?",
+            model_output=f"In April she sold 48 clips, in May 24, so in total 48 + 24 = {answers[i]}. The answer is {answers[i]}" if success[i] else "",
+            model_name="m",
+            dataset_name="d",
+            latency=float(rng.random()),
+            success=bool(success[i]),
+            reference=f"48 + 24 = 72\n#### {answers[i] if exact[i] else 72}",
+            category=str(categories[i]),
+        )
+        for i in range(n)
+    ]
+    exact_match_scores = [{"exact_match": int(e)} for e in exact]
+    judge_agreements = [
+        {
+            "agreement_success": True,
+            "scores": s.tolist(),
+            "high_disagreement": bool(s.max() - s.min() >= 2),
+        }
+        for s in scores
+    ]
+    return results, exact_match_scores, judge_agreements
+
+
+@pytest.fixture(scope="session")
+def runs():
+    """
+    Lazily built, cached synthetic runs keyed by size.
+    """
+    cache = {}
+
+    def get(n: int):
+        if n not in cache:
+            cache[n] = make_run(n)
+        return cache[n]
+
+    return get
@@ -0,0 +1,223 @@
+"""
+End-to-end load test: POST /evaluate against a real API + worker pool
+running on MockLLM, then report throughput, latency percentiles and
+peak memory. No Gemini quota or network is used.
+
+    python -m benchmarks.load_test --runs 20 --concurrency 5 --samples 50 \
+        --model "mock:latency=0.05,latency_distribution=lognormal,error_rate=0.01"
+
+By default the API is started as a subprocess (with its embedded worker
+pool) on temporary SQLite stores, and peak RSS of the API and worker
+processes is sampled from /proc. Pass --url to load an already running
+API instead (memory is then not measured).
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+TERMINAL = ("completed", "failed", "cancelled")
+
+
+# -------------------------------
+# Memory sampling (Linux /proc)
+# -------------------------------
+def _rss_bytes(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _descendants(pid: int) -> List[int]:
+    children = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        return []
+    return children + [d for child in children for d in _descendants(child)]
+
+
+class MemorySampler:
+    """
+    Tracks peak total RSS of a process tree in a background thread.
+    """
+
+    def __init__(self, pid: int, interval: float = 0.2):
+        self.pid = pid
+        self.interval = interval
+        self.peak_total = 0
+        self.peak_process = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            sizes = [_rss_bytes(pid) for pid in [self.pid] + _descendants(self.pid)]
+            self.peak_total = max(self.peak_total, sum(sizes))
+            self.peak_process = max(self.peak_process, max(sizes, default=0))
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+# -------------------------------
+# API server
+# -------------------------------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_api(workers: int, judge_model: str, data_dir: str) -> (subprocess.Popen, str):
+    port = _free_port()
+    env = {
+        **os.environ,
+        "AUTOELAVE_WORKERS": str(workers),
+        "AUTOELAVE_JUDGE_MODEL": judge_model,
+        "AUTOELAVE_RUN_STORE": f"sqlite:///{data_dir}/runs.db",
+        "AUTOELAVE_JOB_QUEUE": f"sqlite:///{data_dir}/jobs.db",
+        "AUTOELAVE_RUN_LOG_DIR": f"{data_dir}/runs",
+        "AUTOELAVE_MAX_QUEUED_JOBS": "0",
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("API process exited during startup")
+        try:
+            if httpx.get(f"{url}/jobs", timeout=1).status_code == 200:
+                return process, url
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("API did not start within 60s")
+
+
+# -------------------------------
+# Load
+# -------------------------------
+def run_one(client: httpx.Client, args) -> Dict[str, Any]:
+    start = time.perf_counter()
+    response = client.post("/evaluate", json={
+        "dataset": args.dataset,
+        "model_name": args.model,
+        "max_workers": args.max_workers,
+        "max_samples": args.samples,
+        "batch_size": args.batch_size,
+    })
+    submit_latency = time.perf_counter() - start
+    response.raise_for_status()
+    run_id = response.json()["run_id"]
+
+    while True:
+        status = client.get(f"/report/{run_id}").json().get("status", "completed")
+        if status in TERMINAL:
+            break
+        time.sleep(args.poll_interval)
+
+    return {
+        "run_id": run_id,
+        "status": status,
+        "submit_latency": submit_latency,
+        "run_latency": time.perf_counter() - start,
+    }
+
+
+def _percentiles(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": round(p50, 4), "p95": round(p95, 4), "p99": round(p99, 4), "max": round(max(values), 4)}
+
+
+def load_test(args) -> Dict[str, Any]:
+    process = sampler = None
+    with tempfile.TemporaryDirectory() as data_dir:
+        url = args.url
+        if not url:
+            process, url = start_api(args.workers, args.judge_model, data_dir)
+            sampler = MemorySampler(process.pid)
+            sampler.start()
+
+        try:
+            start = time.perf_counter()
+            with httpx.Client(base_url=url, timeout=60) as client:
+                with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                    runs = list(executor.map(lambda _: run_one(client, args), range(args.runs)))
+            wall = time.perf_counter() - start
+        finally:
+            if sampler:
+                sampler.stop()
+            if process:
+                process.terminate()
+                process.wait(timeout=30)
+
+    completed = [r for r in runs if r["status"] == "completed"]
+    return {
+        "runs": len(runs),
+        "completed": len(completed),
+        "failed": len(runs) - len(completed),
+        "wall_seconds": round(wall, 2),
+        "runs_per_second": round(len(completed) / wall, 3),
+        "samples_per_second": round(len(completed) * args.samples / wall, 2),
+        "submit_latency": _percentiles([r["submit_latency"] for r in runs]),
+        "run_latency": _percentiles([r["run_latency"] for r in completed]),
+        "peak_rss_mb": round(sampler.peak_total / 2 ** 20, 1) if sampler else None,
+        "peak_process_rss_mb": round(sampler.peak_process / 2 ** 20, 1) if sampler else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test POST /evaluate on a mock LLM.")
+    parser.add_argument("--url", help="Existing API base URL (default: start one)")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5, help="Runs submitted in parallel")
+    parser.add_argument("--samples", type=int, default=50, help="max_samples per run")
+    parser.add_argument("--dataset", default="synthetic")
+    parser.add_argument("--model", default="mock:latency=0.05,latency_distribution=lognormal")
+    parser.add_argument("--judge-model", default="mock:latency=0.05,latency_distribution=lognormal")
+    parser.add_argument("--workers", type=int, default=2, help="Worker processes for a started API")
+    parser.add_argument("--max-workers", type=int, default=8, help="Per-run concurrency")
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--poll-interval", type=float, default=0.25)
+    parser.add_argument("--json", help="Also write the summary to this file")
+    args = parser.parse_args()
+
+    summary = load_test(args)
+    print(json.dumps(summary, indent=2))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Fake LLM HTTP server backed by MockLLM, for exercising network clients,
+timeouts and 429 handling without a real provider.
+
+    python -m benchmarks.mock_server --port 8900 --latency 0.05 --throttle-rate 0.05
+
+POST / with {"prompt": ..., "attempt": 0} returns {"output": ...}, or
+HTTP 429 / 500 for injected throttles and errors. Point a client at it
+with MockLLM(url="http://127.0.0.1:8900/").
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from models.llm_clients.mock import MockLLM, MockThrottled
+
+
+def make_server(llm: MockLLM, host: str = "127.0.0.1", port: int = 8900) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            latency, error, output = llm.plan(body.get("prompt", ""), int(body.get("attempt", 0)))
+            time.sleep(latency)
+
+            if isinstance(error, MockThrottled):
+                self._reply(429, {"error": str(error)}, {"Retry-After": "1"})
+            elif error:
+                self._reply(500, {"error": str(error)})
+            else:
+                self._reply(200, {"output": output})
+
+        def _reply(self, status, payload, headers=None):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a fake LLM HTTP server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--latency-distribution", default="lognormal")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--quota-rpm", type=float, default=None)
+    parser.add_argument("--accuracy", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    llm = MockLLM(
+        latency=args.latency,
+        latency_distribution=args.latency_distribution,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        quota_rpm=args.quota_rpm,
+        accuracy=args.accuracy,
+        seed=args.seed,
+    )
+    server = make_server(llm, args.host, args.port)
+    print(f"Mock LLM server on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
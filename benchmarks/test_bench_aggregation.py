@@ -0,0 +1,21 @@
+import pytest
+
+from benchmarks.conftest import SIZES, measure
+from evaluation.aggregation.report import aggregate_dataset_report
+from evaluation.columnar import ResultTable
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("layout", ["list", "table"])
+def test_aggregate_dataset_report(benchmark, runs, n, layout):
+    benchmark.group = f"aggregate_{layout}"
+    results, exact, judges = runs(n)
+    data = ResultTable.from_results(results) if layout == "table" else results
+
+    report = measure(
+        benchmark,
+        lambda: aggregate_dataset_report(data, exact, judges, "d", "m", n_bootstrap=1000),
+        n,
+    )
+
+    assert report["num_samples"] == n
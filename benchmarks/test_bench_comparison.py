@@ -0,0 +1,31 @@
+import pytest
+
+from benchmarks.conftest import SIZES, make_run, measure
+from evaluation.aggregation.report import aggregate_dataset_report
+from evaluation.comparison.diff import diff_reports, diff_results
+from evaluation.comparison.regression import check_regression
+from evaluation.columnar import ResultTable
+
+
+THRESHOLDS = {"accuracy_drop": 0.01, "judge_score_drop": 0.2, "failure_rate_increase": 0.02}
+
+
+def test_diff_reports_and_check_regression(benchmark):
+    benchmark.group = "regression_check"
+    baseline = aggregate_dataset_report(*make_run(1000, seed=0), "d", "base", n_bootstrap=0)
+    candidate = aggregate_dataset_report(*make_run(1000, seed=1), "d", "cand", n_bootstrap=0)
+
+    verdict = benchmark(lambda: check_regression(diff_reports(baseline, candidate), THRESHOLDS))
+
+    assert "regression_passed" in verdict
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_diff_results(benchmark, runs, n):
+    benchmark.group = "diff_results"
+    baseline = ResultTable.from_results(runs(n)[0])
+    candidate = ResultTable.from_results(make_run(n, seed=1)[0])
+
+    diff = measure(benchmark, lambda: diff_results(baseline, candidate), n)
+
+    assert diff["num_paired"] == n
@@ -0,0 +1,34 @@
+import pytest
+
+from benchmarks.conftest import SIZES, measure
+from evaluation.judges.agreement import JudgeAgreement
+from evaluation.judges.base import BaseJudge
+
+
+class InstantJudge(BaseJudge):
+    """
+    Fake judge with no I/O, so only the agreement bookkeeping is timed.
+    """
+
+    def __init__(self, offset: int):
+        self.offset = offset
+
+    def name(self) -> str:
+        return f"instant_{self.offset}"
+
+    def judge(self, result):
+        return {
+            "judge_score": (len(result.sample_id) + self.offset) % 5 + 1,
+            "judge_explanation": "ok",
+        }
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_judge_agreement_evaluate(benchmark, runs, n):
+    benchmark.group = "judge_agreement"
+    results = runs(n)[0]
+    agreement = JudgeAgreement([InstantJudge(i) for i in range(3)])
+
+    agreements = measure(benchmark, lambda: [agreement.evaluate(r) for r in results], n)
+
+    assert all(a["agreement_success"] for a in agreements)
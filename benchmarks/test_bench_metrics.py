@@ -0,0 +1,46 @@
+import pytest
+
+from benchmarks.conftest import SIZES, measure
+from evaluation.judges.llm_judge import LLMJudge
+from evaluation.metrics.exact_match import ExactMatchMetric
+
+
+JUDGE_RESPONSES = [
+    '{"score": 4, "explanation": "Correct answer with clear reasoning."}',
+    "Score: 3\nThe reasoning is mostly right but skips a step.",
+    "I would rate this answer a 5 out of 5. The final answer 72 is correct.",
+    "The model answer is wrong; it computes 48 + 12 instead of 48 + 24.",
+]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_exact_match_compute(benchmark, runs, n):
+    benchmark.group = "exact_match"
+    results = runs(n)[0]
+    metric = ExactMatchMetric()
+
+    scores = measure(benchmark, lambda: [metric.compute(r) for r in results], n)
+
+    assert len(scores) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_exact_match_compute_many(benchmark, runs, n):
+    benchmark.group = "exact_match"
+    results = runs(n)[0]
+    metric = ExactMatchMetric()
+
+    scores = measure(benchmark, lambda: metric.compute_many(results), n)
+
+    assert len(scores) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_judge_response_parsing(benchmark, n):
+    benchmark.group = "judge_parsing"
+    judge = LLMJudge(judge_llm=None)
+    responses = [JUDGE_RESPONSES[i % len(JUDGE_RESPONSES)] for i in range(n)]
+
+    parsed = measure(benchmark, lambda: [judge._parse_response(r) for r in responses], n)
+
+    assert parsed[0]["judge_score"] == 4
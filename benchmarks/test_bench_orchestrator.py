@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from benchmarks.conftest import SIZES, make_samples, measure
+from evaluation.orchestrator import aevaluate_dataset, evaluate_dataset
+from models.llm_clients.mock import MockLLM
+
+
+# Zero-latency mock: measures orchestration overhead, not the model
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_evaluate_dataset(benchmark, n, max_workers):
+    benchmark.group = f"evaluate_dataset_workers_{max_workers}"
+    samples = make_samples(n)
+    llm = MockLLM()
+
+    results = measure(
+        benchmark, lambda: evaluate_dataset(samples, llm, "synthetic", max_workers=max_workers), n
+    )
+
+    assert len(results) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_aevaluate_dataset(benchmark, n):
+    benchmark.group = "aevaluate_dataset"
+    samples = make_samples(n)
+    llm = MockLLM()
+
+    results = measure(
+        benchmark,
+        lambda: asyncio.run(aevaluate_dataset(samples, llm, "synthetic", max_concurrency=64)),
+        n,
+    )
+
+    assert len(results) == n
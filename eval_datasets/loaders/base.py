@@ -1,13 +1,58 @@
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from eval_datasets.schemas import EvalSample
 
 class BaseDatasetLoader(ABC):
+    """
+    Base class for dataset loaders.
+
+    Subclasses provide the raw rows and a row -> EvalSample conversion;
+    the base class handles lazy iteration, offset/limit and streaming.
+    """
+
+    # Bump when the source rows or their conversion change; caches keyed
+    # by dataset version (e.g. reference embeddings) then start over.
+    version: str = "1"
 
     @abstractmethod
-    def load(self) -> List[EvalSample]:
+    def name(self) -> str:
         pass
 
     @abstractmethod
-    def name(self) -> str:
+    def _load_rows(self, streaming: bool = False) -> Iterable[Dict[str, Any]]:
+        """
+        Return the raw dataset rows. With streaming=True the rows should
+        be fetched lazily (e.g. Hugging Face streaming mode).
+        """
+        pass
+
+    @abstractmethod
+    def _to_sample(self, index: int, row: Dict[str, Any]) -> EvalSample:
+        """
+        Convert one raw row (at absolute position `index`) to an EvalSample.
+        """
         pass
+
+    def iter_samples(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        streaming: bool = True,
+    ) -> Iterator[EvalSample]:
+        """
+        Lazily yield samples, converting only rows in [offset, offset + limit).
+        Iteration stops as soon as `limit` samples have been produced.
+        """
+        stop = offset + limit if limit is not None else None
+        rows = islice(self._load_rows(streaming=streaming), offset, stop)
+
+        for index, row in enumerate(rows, start=offset):
+            yield self._to_sample(index, row)
+
+    def load(self, limit: Optional[int] = None, offset: int = 0) -> List[EvalSample]:
+        """
+        Materialize samples. Uses streaming when only a slice is needed so
+        the full dataset is never downloaded or converted.
+        """
+        return list(self.iter_samples(limit=limit, offset=offset, streaming=limit is not None))
@@ -7,19 +7,14 @@ class GSM8KLoader(BaseDatasetLoader):
     def name(self):
         return "gsm8k"
 
-    def load(self):
-        ds = load_dataset("gsm8k", "main", split="test")
-
-        samples = []
-        for i, row in enumerate(ds):
-            samples.append(
-                EvalSample(
-                    id=f"gsm8k_{i}",
-                    prompt=row["question"],
-                    reference=row["answer"],
-                    category="reasoning",
-                    metadata={"dataset": "gsm8k"}
-                )
-            )
-        return samples
+    def _load_rows(self, streaming=False):
+        return load_dataset("gsm8k", "main", split="test", streaming=streaming)
 
+    def _to_sample(self, index, row):
+        return EvalSample(
+            id=f"gsm8k_{index}",
+            prompt=row["question"],
+            reference=row["answer"],
+            category="reasoning",
+            metadata={"dataset": "gsm8k"}
+        )
@@ -7,17 +7,13 @@ class SafetyLoader(BaseDatasetLoader):
     def name(self):
         return "safety"
 
-    def load(self):
-        ds = load_dataset("allenai/real-toxicity-prompts", split="train")
+    def _load_rows(self, streaming=False):
+        return load_dataset("allenai/real-toxicity-prompts", split="train", streaming=streaming)
 
-        samples = []
-        for i, row in enumerate(ds):
-            samples.append(
-                EvalSample(
-                    id=f"safety_{i}",
-                    prompt=row["prompt"]["text"],
-                    category="safety",
-                    metadata={"toxicity": row["prompt"]["toxicity"]}
-                )
-            )
-        return samples
+    def _to_sample(self, index, row):
+        return EvalSample(
+            id=f"safety_{index}",
+            prompt=row["prompt"]["text"],
+            category="safety",
+            metadata={"toxicity": row["prompt"]["toxicity"]}
+        )
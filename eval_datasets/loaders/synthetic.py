@@ -0,0 +1,37 @@
+import random
+from eval_datasets.loaders.base import BaseDatasetLoader
+from eval_datasets.schemas import EvalSample
+
+class SyntheticArithmeticLoader(BaseDatasetLoader):
+    """
+    Deterministic GSM8K-style arithmetic questions generated locally.
+
+    Needs no network, so it is used for load tests and offline smoke
+    runs (together with MockLLM, which answers these questions with a
+    configurable accuracy).
+    """
+
+    def __init__(self, size: int = 100_000, seed: int = 0):
+        self.size = size
+        self.seed = seed
+
+    def name(self):
+        return "synthetic"
+
+    def _load_rows(self, streaming=False):
+        rng = random.Random(self.seed)
+        for _ in range(self.size):
+            a, b = rng.randint(1, 999), rng.randint(1, 999)
+            yield {
+                "question": f"What is {a} + {b}?",
+                "answer": f"{a} + {b} = {a + b}\n#### {a + b}",
+            }
+
+    def _to_sample(self, index, row):
+        return EvalSample(
+            id=f"synthetic_{index}",
+            prompt=row["question"],
+            reference=row["answer"],
+            category="arithmetic",
+            metadata={"dataset": "synthetic"}
+        )
@@ -7,18 +7,14 @@ class TruthfulQALoader(BaseDatasetLoader):
     def name(self):
         return "truthfulqa"
 
-    def load(self):
-        ds = load_dataset("truthful_qa", "generation", split="validation")
+    def _load_rows(self, streaming=False):
+        return load_dataset("truthful_qa", "generation", split="validation", streaming=streaming)
 
-        samples = []
-        for i, row in enumerate(ds):
-            samples.append(
-                EvalSample(
-                    id=f"truthfulqa_{i}",
-                    prompt=row["question"],
-                    reference=row["best_answer"],
-                    category="hallucination",
-                    metadata={"incorrect_answers": row["incorrect_answers"]}
-                )
-            )
-        return samples
+    def _to_sample(self, index, row):
+        return EvalSample(
+            id=f"truthfulqa_{index}",
+            prompt=row["question"],
+            reference=row["best_answer"],
+            category="hallucination",
+            metadata={"incorrect_answers": row["incorrect_answers"]}
+        )
@@ -1,14 +1,107 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
 from eval_datasets.loaders.gsm8k import GSM8KLoader
 from eval_datasets.loaders.truthfulqa import TruthfulQALoader
 from eval_datasets.loaders.safety import SafetyLoader
+from eval_datasets.loaders.synthetic import SyntheticArithmeticLoader
+from eval_datasets.schemas import EvalSample
 
 DATASET_REGISTRY = {
     "gsm8k": GSM8KLoader,
     "truthfulqa": TruthfulQALoader,
-    "safety": SafetyLoader
+    "safety": SafetyLoader,
+    "synthetic": SyntheticArithmeticLoader,
 }
 
-def load_dataset_by_name(name: str):
+# Process-wide LRU cache of converted samples, keyed by (name, offset, limit)
+DATASET_CACHE_ENTRIES = int(os.getenv("AUTOELAVE_DATASET_CACHE_ENTRIES", "8"))
+_SAMPLE_CACHE: "OrderedDict[Tuple[str, int, Optional[int]], List[EvalSample]]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+# One load at a time per dataset, so concurrent requests load it once
+_LOAD_LOCKS: Dict[str, threading.Lock] = {}
+
+
+def _get_loader(name: str):
     if name not in DATASET_REGISTRY:
         raise ValueError(f"Unknown dataset: {name}")
-    return DATASET_REGISTRY[name]().load()
+    return DATASET_REGISTRY[name]()
+
+
+def dataset_version(name: str) -> str:
+    """
+    Version of a registered dataset; "1" for names not in the registry.
+    """
+    loader = DATASET_REGISTRY.get(name)
+    return loader.version if loader is not None else "1"
+
+
+def load_dataset_by_name(
+    name: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[EvalSample]:
+    """
+    Load samples [offset, offset + limit) of a dataset.
+
+    The last AUTOELAVE_DATASET_CACHE_ENTRIES loaded slices are cached for
+    the process, so repeat calls neither reload nor re-convert anything,
+    and a slice inside an already cached one (e.g. a smaller limit, or
+    anything once the full dataset is loaded) is served from it. The
+    returned list is a fresh copy; the EvalSample objects are shared and
+    must not be mutated.
+    """
+    key = (name, offset, limit)
+
+    with _CACHE_LOCK:
+        lock = _LOAD_LOCKS.setdefault(name, threading.Lock())
+
+    with lock:
+        cached = _cached_slice(name, offset, limit)
+        if cached is None:
+            cached = _get_loader(name).load(limit=limit, offset=offset)
+            with _CACHE_LOCK:
+                _SAMPLE_CACHE[key] = cached
+                while len(_SAMPLE_CACHE) > max(1, DATASET_CACHE_ENTRIES):
+                    _SAMPLE_CACHE.popitem(last=False)
+
+    return list(cached)
+
+
+def _cached_slice(name: str, offset: int, limit: Optional[int]) -> Optional[List[EvalSample]]:
+    """
+    Samples [offset, offset + limit) from any cached slice of the
+    dataset that contains them, or None.
+    """
+    with _CACHE_LOCK:
+        for key, samples in reversed(_SAMPLE_CACHE.items()):
+            cached_name, cached_offset, cached_limit = key
+            if cached_name != name or cached_offset > offset:
+                continue
+            # A slice shorter than its limit reached the end of the dataset
+            complete = cached_limit is None or len(samples) < cached_limit
+            if not complete and (limit is None or cached_offset + cached_limit < offset + limit):
+                continue
+
+            _SAMPLE_CACHE.move_to_end(key)
+            start = offset - cached_offset
+            return samples[start:start + limit] if limit is not None else samples[start:]
+    return None
+
+
+def iter_dataset_by_name(
+    name: str,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> Iterator[EvalSample]:
+    """
+    Stream samples lazily without caching.
+    """
+    return _get_loader(name).iter_samples(limit=limit, offset=offset, streaming=True)
+
+
+def clear_dataset_cache() -> None:
+    with _CACHE_LOCK:
+        _SAMPLE_CACHE.clear()
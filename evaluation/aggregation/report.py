@@ -1,79 +1,231 @@
-from typing import List, Dict, Any
-import statistics
+from typing import List, Dict, Any, Optional, Tuple, Union
 
+import numpy as np
+
+from evaluation.columnar import ResultTable
 from evaluation.results import EvalResult
 
 
+# Above this many distinct values, bootstrap by resampling indices
+# instead of drawing multinomial counts over the distinct values.
+_MAX_DISTINCT_FOR_MULTINOMIAL = 64
+
+# Upper bound on resample matrix size (resamples x samples) per chunk
+_BOOTSTRAP_CHUNK_CELLS = 4_000_000
+
+
+def _round(value: Optional[float], digits: int) -> Optional[float]:
+    return None if value is None else round(float(value), digits)
+
+
+def _mean(values: np.ndarray) -> Optional[float]:
+    return float(values.sum()) / values.size if values.size else None
+
+
+def bootstrap_mean_ci(
+    values: np.ndarray,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    rng: Optional[np.random.Generator] = None,
+) -> Optional[Tuple[float, float]]:
+    """
+    Percentile bootstrap confidence interval for the mean of `values`.
+
+    All resamples are drawn in one vectorized step. Evaluation metrics are
+    almost always discrete (0/1 rates, 0-5 judge scores), so resampling is
+    done exactly via multinomial counts over the distinct values: O(B * k)
+    instead of O(B * n). Continuous data falls back to chunked index
+    resampling.
+    """
+    n = values.size
+    if n == 0:
+        return None
+
+    rng = rng or np.random.default_rng(0)
+    uniques, counts = np.unique(values, return_counts=True)
+
+    if uniques.size <= _MAX_DISTINCT_FOR_MULTINOMIAL:
+        draws = rng.multinomial(n, counts / n, size=n_resamples)
+        means = draws @ uniques.astype(np.float64) / n
+    else:
+        chunk = max(1, _BOOTSTRAP_CHUNK_CELLS // n)
+        means = np.concatenate([
+            values[rng.integers(0, n, size=(min(chunk, n_resamples - start), n))].mean(axis=1)
+            for start in range(0, n_resamples, chunk)
+        ])
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(means, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+def _columns(
+    results: Union[List[EvalResult], ResultTable],
+    exact_match_scores: List[Dict[str, Any]],
+    judge_agreements: List[Dict[str, Any]],
+) -> Dict[str, np.ndarray]:
+    """
+    Turn per-sample inputs into aligned NumPy arrays (one Python pass).
+    """
+    if isinstance(results, ResultTable):
+        success = np.asarray(results.column("success"), dtype=bool)
+        categories = results.column("category")
+    else:
+        success = np.fromiter((r.success for r in results), dtype=bool, count=len(results))
+        categories = [r.category for r in results]
+
+    # NaN marks "no exact-match value" for a sample
+    exact_match = np.array(
+        [np.nan if m["exact_match"] is None else m["exact_match"] for m in exact_match_scores],
+        dtype=np.float64,
+    )
+
+    judged = np.fromiter(
+        (bool(a.get("agreement_success")) for a in judge_agreements),
+        dtype=bool,
+        count=len(judge_agreements),
+    )
+    high_disagreement = np.fromiter(
+        (bool(a.get("agreement_success") and a.get("high_disagreement")) for a in judge_agreements),
+        dtype=bool,
+        count=len(judge_agreements),
+    )
+
+    # Flattened judge scores plus the sample each one belongs to
+    score_lists = [a.get("scores", []) if a.get("agreement_success") else [] for a in judge_agreements]
+    score_counts = np.fromiter((len(s) for s in score_lists), dtype=np.int64, count=len(score_lists))
+    judge_scores = np.fromiter(
+        (score for scores in score_lists for score in scores),
+        dtype=np.int64,
+        count=int(score_counts.sum()),
+    )
+    score_owner = np.repeat(np.arange(len(score_lists)), score_counts)
+
+    category = np.array(
+        ["uncategorized" if c is None else c for c in categories], dtype=object
+    )
+
+    return {
+        "success": success,
+        "exact_match": exact_match,
+        "judged": judged,
+        "high_disagreement": high_disagreement,
+        "judge_scores": judge_scores,
+        "score_owner": score_owner,
+        "category": category,
+    }
+
+
+def _summary(
+    cols: Dict[str, np.ndarray],
+    mask: Optional[np.ndarray] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Point estimates plus the raw arrays behind each of them, over all
+    samples or just those selected by `mask`.
+    """
+    if mask is None:
+        mask = np.ones(cols["success"].size, dtype=bool)
+
+    num_samples = int(np.count_nonzero(mask))
+
+    failed = ~cols["success"][mask]
+    exact_match = cols["exact_match"][mask]
+    exact_match = exact_match[~np.isnan(exact_match)]
+    judged = cols["judged"][mask]
+    high_disagreement = cols["high_disagreement"][mask][judged]
+    judge_scores = cols["judge_scores"][mask[cols["score_owner"]]]
+
+    judge_success_count = int(np.count_nonzero(judged))
+
+    return {
+        "num_samples": num_samples,
+        "values": {
+            "model_failure_rate": failed,
+            "exact_match_accuracy": exact_match,
+            "avg_judge_score": judge_scores,
+            "judge_coverage": judged,
+            "high_disagreement_rate": high_disagreement,
+        },
+        "estimates": {
+            "model_failure_rate": (
+                round(int(np.count_nonzero(failed)) / num_samples, 3) if num_samples else 0.0
+            ),
+            "exact_match_accuracy": _round(_mean(exact_match), 3),
+            "avg_judge_score": _round(_mean(judge_scores), 2),
+            "judge_coverage": (
+                round(judge_success_count / num_samples, 3) if num_samples else 0.0
+            ),
+            "high_disagreement_rate": (
+                round(int(np.count_nonzero(high_disagreement)) / judge_success_count, 3)
+                if judge_success_count
+                else None
+            ),
+        },
+    }
+
+
 def aggregate_dataset_report(
-    results: List[EvalResult],
+    results: Union[List[EvalResult], ResultTable],
     exact_match_scores: List[Dict[str, Any]],
     judge_agreements: List[Dict[str, Any]],
     dataset_name: str,
     model_name: str,
+    n_bootstrap: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 0,
 ) -> Dict[str, Any]:
     """
     Aggregate dataset-level evaluation statistics.
+
+    `results` may be a list of EvalResults or a columnar ResultTable.
+    All statistics are computed over NumPy arrays. Besides the point
+    estimates, the report carries percentile bootstrap confidence
+    intervals per metric (n_bootstrap=0 disables them) and a per-category
+    breakdown keyed by EvalSample.category.
     """
 
-    num_samples = len(results)
+    cols = _columns(results, exact_match_scores, judge_agreements)
+    overall = _summary(cols)
 
     # -------------------------
-    # Model failure rate
+    # Bootstrap confidence intervals
     # -------------------------
-    model_failures = sum(1 for r in results if not r.success)
-    model_failure_rate = round(model_failures / num_samples, 3) if num_samples else 0.0
+    confidence_intervals = {}
+    if n_bootstrap:
+        rng = np.random.default_rng(seed)
+        for metric, values in overall["values"].items():
+            interval = bootstrap_mean_ci(values, n_bootstrap, confidence, rng)
+            digits = 2 if metric == "avg_judge_score" else 3
+            confidence_intervals[metric] = (
+                [_round(interval[0], digits), _round(interval[1], digits)] if interval else None
+            )
 
     # -------------------------
-    # Exact Match Accuracy
-    # -------------------------
-    exact_match_values = [
-        m["exact_match"] for m in exact_match_scores if m["exact_match"] is not None
-    ]
-    exact_match_accuracy = (
-        round(sum(exact_match_values) / len(exact_match_values), 3)
-        if exact_match_values
-        else None
-    )
-
+    # Per-category breakdown
     # -------------------------
-    # Judge statistics
-    # -------------------------
-    judge_scores = []
-    judge_success_count = 0
-    high_disagreement_count = 0
-
-    for agreement in judge_agreements:
-        if agreement.get("agreement_success"):
-            judge_success_count += 1
-            judge_scores.extend(agreement.get("scores", []))
-
-            if agreement.get("high_disagreement"):
-                high_disagreement_count += 1
-
-    judge_coverage = (
-        round(judge_success_count / num_samples, 3) if num_samples else 0.0
-    )
-
-    avg_judge_score = (
-        round(statistics.mean(judge_scores), 2) if judge_scores else None
-    )
-
-    disagreement_rate = (
-        round(high_disagreement_count / judge_success_count, 3)
-        if judge_success_count
-        else None
-    )
+    categories = {}
+    for category in np.unique(cols["category"]) if cols["category"].size else []:
+        summary = _summary(cols, cols["category"] == category)
+        categories[str(category)] = {
+            "num_samples": summary["num_samples"],
+            **summary["estimates"],
+        }
 
     # -------------------------
     # Final Report
     # -------------------------
+    estimates = overall["estimates"]
     return {
         "dataset": dataset_name,
         "model": model_name,
-        "num_samples": num_samples,
-        "model_failure_rate": model_failure_rate,
-        "exact_match_accuracy": exact_match_accuracy,
-        "avg_judge_score": avg_judge_score,
-        "judge_coverage": judge_coverage,
-        "high_disagreement_rate": disagreement_rate,
+        "num_samples": overall["num_samples"],
+        "model_failure_rate": estimates["model_failure_rate"],
+        "exact_match_accuracy": estimates["exact_match_accuracy"],
+        "avg_judge_score": estimates["avg_judge_score"],
+        "judge_coverage": estimates["judge_coverage"],
+        "high_disagreement_rate": estimates["high_disagreement_rate"],
+        "confidence_level": confidence,
+        "confidence_intervals": confidence_intervals,
+        "categories": categories,
     }
@@ -0,0 +1,47 @@
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count (~4 characters per token), good enough for
+    bounding batch sizes without loading a tokenizer.
+    """
+    return max(1, len(text) // 4)
+
+
+def make_batches(
+    items: Iterable[T],
+    max_batch_size: int,
+    max_batch_tokens: Optional[int] = None,
+    text: Callable[[T], str] = str,
+) -> Iterator[List[T]]:
+    """
+    Group items into micro-batches, in order.
+
+    A batch closes when it holds max_batch_size items or when adding the
+    next item would push its estimated token count past max_batch_tokens.
+    An item larger than max_batch_tokens on its own gets its own batch.
+    `text` maps an item to the prompt text used for the estimate.
+    """
+    max_batch_size = max(1, max_batch_size)
+
+    batch: List[T] = []
+    batch_tokens = 0
+
+    for item in items:
+        tokens = estimate_tokens(text(item)) if max_batch_tokens else 0
+
+        if batch and (
+            len(batch) >= max_batch_size
+            or (max_batch_tokens and batch_tokens + tokens > max_batch_tokens)
+        ):
+            yield batch
+            batch, batch_tokens = [], 0
+
+        batch.append(item)
+        batch_tokens += tokens
+
+    if batch:
+        yield batch
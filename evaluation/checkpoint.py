@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, TextIO
+
+from evaluation.results import EvalResult
+
+
+DEFAULT_RUN_LOG_DIR = os.getenv("AUTOELAVE_RUN_LOG_DIR", ".autoelave/runs")
+DEFAULT_SYNC_INTERVAL = float(os.getenv("AUTOELAVE_RUN_LOG_SYNC_S", "0.2"))
+
+
+@dataclass
+class RunCheckpoint:
+    """
+    Everything recovered from a run log.
+    """
+    header: Optional[Dict[str, Any]] = None
+    results: Dict[str, EvalResult] = field(default_factory=dict)
+    exact_match: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    judgments: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def completed_results(self) -> Dict[str, EvalResult]:
+        """
+        Results that do not need to be re-run (model call succeeded).
+        """
+        return {sid: r for sid, r in self.results.items() if r.success}
+
+
+class RunLog:
+    """
+    Durable, append-only JSONL log of per-sample progress for one run.
+
+    Every record is handed to the OS as soon as it is written, so a
+    crashed process loses at most the sample that was in flight. The
+    file stays open, and a background thread fsyncs it every
+    sync_interval seconds (and on close), so appends never wait on the
+    disk and a power loss costs at most that interval.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        directory: str = DEFAULT_RUN_LOG_DIR,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ):
+        self.run_id = run_id
+        self.path = os.path.join(directory, f"{run_id}.jsonl")
+        # OTLP/JSON trace of the run's stages and calls (see Tracer)
+        self.trace_path = os.path.join(directory, f"{run_id}.trace.json")
+        self.sync_interval = sync_interval
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._dirty = False
+        self._closed = threading.Event()
+        self._syncer: Optional[threading.Thread] = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _append(self, *records: Dict[str, Any]) -> None:
+        lines = "".join(json.dumps(record, default=str) + "\n" for record in records)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._closed.clear()
+                self._syncer = threading.Thread(
+                    target=self._sync_loop, name=f"run-log-{self.run_id}", daemon=True
+                )
+                self._syncer.start()
+            self._file.write(lines)
+            self._file.flush()
+            self._dirty = True
+
+    def _sync_loop(self) -> None:
+        while not self._closed.wait(self.sync_interval):
+            self.sync()
+
+    def sync(self) -> None:
+        """
+        fsync everything appended so far.
+        """
+        with self._lock:
+            if self._file is None or not self._dirty:
+                return
+            self._dirty = False
+            fd = self._file.fileno()
+        # Outside the lock, so appends carry on while the disk catches up
+        os.fsync(fd)
+
+    def close(self) -> None:
+        """
+        Stop the background sync, fsync and close the file. Appending
+        again reopens it.
+        """
+        self._closed.set()
+        if self._syncer is not None:
+            self._syncer.join()
+            self._syncer = None
+        self.sync()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def write_header(self, **params) -> None:
+        self._append({"type": "run", "run_id": self.run_id, **params})
+
+    def append_result(self, result: EvalResult) -> None:
+        self._append({"type": "result", "sample_id": result.sample_id, "data": asdict(result)})
+
+    def append_exact_match(self, sample_id: str, score: Dict[str, Any]) -> None:
+        self._append({"type": "exact_match", "sample_id": sample_id, "data": score})
+
+    def append_judgment(self, sample_id: str, agreement: Dict[str, Any]) -> None:
+        self._append({"type": "judgment", "sample_id": sample_id, "data": agreement})
+
+    def append_copied(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Log samples copied from an earlier run (run store records with
+        "result", "exact_match" and optional "judgment") in one write.
+        """
+        lines = []
+        for record in records:
+            sample_id = record["sample_id"]
+            lines.append({"type": "result", "sample_id": sample_id, "data": record["result"]})
+            lines.append({"type": "exact_match", "sample_id": sample_id, "data": record["exact_match"]})
+            if record.get("judgment"):
+                lines.append({"type": "judgment", "sample_id": sample_id, "data": record["judgment"]})
+        if lines:
+            self._append(*lines)
+
+    def load(self) -> RunCheckpoint:
+        """
+        Replay the log. Later records for a sample win; a torn final
+        line (crash mid-write) is ignored.
+        """
+        checkpoint = RunCheckpoint()
+
+        if not self.exists():
+            return checkpoint
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                kind = record.get("type")
+                if kind == "run":
+                    checkpoint.header = record
+                elif kind == "result":
+                    checkpoint.results[record["sample_id"]] = EvalResult(**record["data"])
+                elif kind == "exact_match":
+                    checkpoint.exact_match[record["sample_id"]] = record["data"]
+                elif kind == "judgment":
+                    checkpoint.judgments[record["sample_id"]] = record["data"]
+
+        return checkpoint
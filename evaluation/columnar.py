@@ -0,0 +1,209 @@
+import json
+import sys
+from dataclasses import fields
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from evaluation.results import EvalResult
+
+
+# Columns stored as NumPy arrays
+NUMERIC_COLUMNS = {
+    "latency": np.float64,
+    "success": np.bool_,
+    "timestamp": np.float64,
+}
+
+# Low-cardinality string columns, dictionary-encoded (codes + categories)
+CATEGORICAL_COLUMNS = ("model_name", "dataset_name")
+
+# Ids repeat across every run of a dataset, so are interned; other text
+# (prompts, references, outputs, errors) is kept as is, and shares the
+# strings of the samples it came from
+INTERNED_COLUMNS = ("sample_id",)
+
+# Everything else is an object column (list of str / dict / None)
+RESULT_FIELDS = tuple(f.name for f in fields(EvalResult))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ResultRow:
+    """
+    Lightweight read-only view of one row of a ResultTable.
+
+    Exposes the same attributes as EvalResult, so it can be passed to
+    metrics, judges and aggregation unchanged.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ResultTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in RESULT_FIELDS:
+            raise AttributeError(name)
+        return self._table._value(name, self._index)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in RESULT_FIELDS}
+
+    def to_result(self) -> EvalResult:
+        return EvalResult(**self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"ResultRow(sample_id={self.sample_id!r}, success={self.success!r})"
+
+
+class ResultTable:
+    """
+    Columnar container for a collection of EvalResults.
+
+    Numeric fields live in NumPy arrays, model/dataset names are
+    dictionary-encoded and sample ids interned. Rows are exposed as
+    ResultRow views instead of one dataclass (and __dict__) per result;
+    slicing returns a smaller table (cheap to pickle, e.g. to a metric
+    pool process).
+    """
+
+    def __init__(self, columns: Dict[str, Any], categories: Dict[str, List[str]]):
+        self._columns = columns
+        self._categories = categories
+        self._length = len(columns["sample_id"])
+
+    # -------------------------------
+    # Construction
+    # -------------------------------
+    @classmethod
+    def from_results(cls, results: Iterable[EvalResult]) -> "ResultTable":
+        results = list(results)
+        columns: Dict[str, Any] = {}
+        categories: Dict[str, List[str]] = {}
+
+        for name in RESULT_FIELDS:
+            values = [getattr(r, name) for r in results]
+
+            if name in NUMERIC_COLUMNS:
+                columns[name] = np.asarray(values, dtype=NUMERIC_COLUMNS[name])
+            elif name in CATEGORICAL_COLUMNS:
+                lookup: Dict[str, int] = {}
+                columns[name] = np.fromiter(
+                    (lookup.setdefault(v, len(lookup)) for v in values),
+                    dtype=np.int32,
+                    count=len(values),
+                )
+                categories[name] = list(lookup)
+            elif name in INTERNED_COLUMNS:
+                columns[name] = [_intern(v) for v in values]
+            else:
+                # Shared with the source results, never copied
+                columns[name] = values
+
+        return cls(columns, categories)
+
+    # -------------------------------
+    # Access
+    # -------------------------------
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[ResultRow]:
+        for i in range(self._length):
+            yield ResultRow(self, i)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ResultRow, "ResultTable"]:
+        if isinstance(index, slice):
+            columns = {name: column[index] for name, column in self._columns.items()}
+            return ResultTable(columns, self._categories)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return ResultRow(self, index)
+
+    def _value(self, name: str, index: int) -> Any:
+        column = self._columns[name]
+        if name in CATEGORICAL_COLUMNS:
+            return self._categories[name][column[index]]
+        if name in NUMERIC_COLUMNS:
+            return column[index].item()
+        return column[index]
+
+    def column(self, name: str) -> Any:
+        """
+        Raw column: a NumPy array for numeric fields, a decoded list for
+        categorical fields, and a list for everything else.
+        """
+        if name in CATEGORICAL_COLUMNS:
+            categories = self._categories[name]
+            return [categories[code] for code in self._columns[name]]
+        return self._columns[name]
+
+    def to_results(self) -> List[EvalResult]:
+        return [row.to_result() for row in self]
+
+    # -------------------------------
+    # Parquet I/O
+    # -------------------------------
+    def to_parquet(self, path: str) -> None:
+        pa, pq = _require_pyarrow()
+
+        arrays = {}
+        for name in RESULT_FIELDS:
+            column = self._columns[name]
+            if name in CATEGORICAL_COLUMNS:
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(column, type=pa.int32()),
+                    pa.array(self._categories[name], type=pa.string()),
+                )
+            elif name == "metadata":
+                arrays[name] = pa.array(
+                    [json.dumps(m, default=str) if m is not None else None for m in column],
+                    type=pa.string(),
+                )
+            else:
+                arrays[name] = pa.array(column)
+
+        pq.write_table(pa.table(arrays), path)
+
+    @classmethod
+    def from_parquet(cls, path: str) -> "ResultTable":
+        pa, pq = _require_pyarrow()
+        table = pq.read_table(path)
+
+        columns: Dict[str, Any] = {}
+        categories: Dict[str, List[str]] = {}
+
+        for name in RESULT_FIELDS:
+            column = table.column(name).combine_chunks()
+            if name in CATEGORICAL_COLUMNS:
+                if not pa.types.is_dictionary(column.type):
+                    column = column.dictionary_encode()
+                columns[name] = column.indices.to_numpy(zero_copy_only=False).astype(np.int32)
+                categories[name] = column.dictionary.to_pylist()
+            elif name in NUMERIC_COLUMNS:
+                columns[name] = column.to_numpy(zero_copy_only=False).astype(NUMERIC_COLUMNS[name])
+            elif name == "metadata":
+                columns[name] = [json.loads(m) if m is not None else None for m in column.to_pylist()]
+            elif name in INTERNED_COLUMNS:
+                columns[name] = [_intern(v) for v in column.to_pylist()]
+            else:
+                columns[name] = column.to_pylist()
+
+        return cls(columns, categories)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet support requires pyarrow. Install it with `pip install pyarrow`."
+        ) from e
+    return pa, pq
@@ -1,4 +1,9 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Union
+
+import numpy as np
+
+from evaluation.columnar import ResultTable
+from evaluation.results import EvalResult
 
 
 def diff_reports(
@@ -25,3 +30,44 @@ def diff_reports(
         "failure_rate_delta": delta("model_failure_rate"),
         "disagreement_delta": delta("high_disagreement_rate"),
     }
+
+
+def diff_results(
+    baseline: Union[List[EvalResult], ResultTable],
+    candidate: Union[List[EvalResult], ResultTable],
+) -> Dict[str, Any]:
+    """
+    Paired, per-sample comparison of two runs over the same samples.
+    Works directly on ResultTable columns (lists are converted first).
+    """
+    if not isinstance(baseline, ResultTable):
+        baseline = ResultTable.from_results(baseline)
+    if not isinstance(candidate, ResultTable):
+        candidate = ResultTable.from_results(candidate)
+
+    position = {sid: i for i, sid in enumerate(baseline.column("sample_id"))}
+    pairs = [
+        (position[sid], j)
+        for j, sid in enumerate(candidate.column("sample_id"))
+        if sid in position
+    ]
+
+    if not pairs:
+        return {
+            "num_paired": 0,
+            "new_failures": 0,
+            "fixed_failures": 0,
+            "latency_delta_mean": None,
+        }
+
+    base_idx, cand_idx = (np.asarray(idx) for idx in zip(*pairs))
+    base_ok = baseline.column("success")[base_idx]
+    cand_ok = candidate.column("success")[cand_idx]
+    latency_delta = candidate.column("latency")[cand_idx] - baseline.column("latency")[base_idx]
+
+    return {
+        "num_paired": len(pairs),
+        "new_failures": int(np.count_nonzero(base_ok & ~cand_ok)),
+        "fixed_failures": int(np.count_nonzero(~base_ok & cand_ok)),
+        "latency_delta_mean": round(float(latency_delta.mean()), 4),
+    }
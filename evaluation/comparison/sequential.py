@@ -0,0 +1,294 @@
+"""
+Sequential (early-stopping) regression comparison.
+
+Baseline and candidate are evaluated on the same, shuffled sample order
+in chunks. After every chunk an anytime-valid confidence sequence for the
+mean paired score difference (candidate - baseline) is checked against
+the allowed regression margin, and evaluation stops as soon as the
+verdict is statistically decided:
+
+    upper bound < -margin  -> FAIL (regressed by more than the margin)
+    lower bound > -margin  -> PASS (not worse than the margin)
+
+Confidence sequences stay valid however often they are checked, so the
+error rate is alpha even though we peek after every chunk.
+
+    python -m evaluation.comparison.sequential --dataset gsm8k \
+        --baseline-run eval-1a2b3c4d --candidate gemini:models/gemini-2.5-flash
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from eval_datasets.schemas import EvalSample
+from evaluation.metrics.exact_match import ExactMatchMetric
+from evaluation.orchestrator import aevaluate_dataset
+from evaluation.results import EvalResult
+from models.llm_clients.base import BaseLLM
+
+
+class ConfidenceSequence:
+    """
+    Anytime-valid confidence sequence for the mean of observations
+    bounded in [lower, upper].
+
+    Betting construction with a hedged capital process and predictable
+    plug-in bets (Waudby-Smith & Ramdas, "Estimating means of bounded
+    random variables by betting", 2023): a candidate mean m is rejected
+    once a gambler betting against it has multiplied their capital by
+    1/alpha. It adapts to the observed variance, so mostly-tied pairs
+    (both right or both wrong) give much tighter bounds than Hoeffding.
+    """
+
+    def __init__(
+        self,
+        lower: float = -1.0,
+        upper: float = 1.0,
+        alpha: float = 0.05,
+        grid_size: int = 2001,
+        max_bet: float = 0.5,
+    ):
+        self.lower = lower
+        self.upper = upper
+        self.alpha = alpha
+        self.max_bet = max_bet
+
+        # Candidate means, on the [0, 1] scale observations are mapped to
+        self.grid = np.linspace(0.0, 1.0, grid_size)
+        self._step = 1.0 / (grid_size - 1)
+        with np.errstate(divide="ignore"):
+            self._max_bet_plus = max_bet / self.grid
+            self._max_bet_minus = max_bet / (1.0 - self.grid)
+        self._log_capital_plus = np.zeros(grid_size)
+        self._log_capital_minus = np.zeros(grid_size)
+        self._log_threshold = math.log(1.0 / alpha)
+
+        self.n = 0
+        self._sum = 0.0
+        self._mean_estimate = 0.5
+        self._squared_deviations = 0.25
+        self._low, self._high = 0.0, 1.0
+
+    def update(self, x: float) -> None:
+        y = min(max((x - self.lower) / (self.upper - self.lower), 0.0), 1.0)
+        t = self.n + 1
+
+        # Bet size from observations before this one only (predictable)
+        variance = self._squared_deviations / t
+        bet = math.sqrt(2 * math.log(2 / self.alpha) / (variance * t * math.log(1 + t)))
+
+        self._log_capital_plus += np.log1p(np.minimum(bet, self._max_bet_plus) * (y - self.grid))
+        self._log_capital_minus += np.log1p(-np.minimum(bet, self._max_bet_minus) * (y - self.grid))
+
+        self._squared_deviations += (y - self._mean_estimate) ** 2
+        self._sum += y
+        self._mean_estimate = (0.5 + self._sum) / (t + 1)
+        self.n = t
+
+        log_capital = np.logaddexp(self._log_capital_plus, self._log_capital_minus) + math.log(0.5)
+        accepted = self.grid[log_capital < self._log_threshold]
+        if accepted.size:
+            # Widen by one grid step so the discretization never excludes the mean
+            low = accepted[0] - self._step
+            high = accepted[-1] + self._step
+            # Running intersection: the sequence only ever narrows
+            self._low, self._high = max(self._low, low), min(self._high, high)
+
+    @property
+    def mean(self) -> Optional[float]:
+        if not self.n:
+            return None
+        return self.lower + (self.upper - self.lower) * self._sum / self.n
+
+    @property
+    def interval(self) -> Tuple[float, float]:
+        span = self.upper - self.lower
+        low, high = self._low, self._high
+        if low > high:
+            # Can only happen with probability alpha; collapse onto the estimate
+            low = high = self._sum / self.n
+        return self.lower + span * low, self.lower + span * high
+
+
+class SequentialComparison:
+    """
+    Paired non-inferiority test of a candidate against a baseline on
+    per-sample scores in [0, score_range] (1 for exact match).
+    """
+
+    def __init__(self, margin: float = 0.03, alpha: float = 0.05, score_range: float = 1.0):
+        self.margin = margin
+        self.alpha = alpha
+        self.sequence = ConfidenceSequence(-score_range, score_range, alpha=alpha)
+        self.baseline_total = 0.0
+        self.candidate_total = 0.0
+        self.checks: List[Dict[str, Any]] = []
+
+    @property
+    def n(self) -> int:
+        return self.sequence.n
+
+    def update(self, baseline_score: float, candidate_score: float) -> None:
+        self.baseline_total += baseline_score
+        self.candidate_total += candidate_score
+        self.sequence.update(candidate_score - baseline_score)
+
+    def check(self) -> Optional[str]:
+        """
+        "fail", "pass", or None while undecided. Records the bounds.
+        """
+        low, high = self.sequence.interval
+        self.checks.append({"samples": self.n, "lower": round(low, 4), "upper": round(high, 4)})
+
+        if high < -self.margin:
+            return "fail"
+        if low > -self.margin:
+            return "pass"
+        return None
+
+    def summary(self, total_samples: int, decision: Optional[str], calls_per_sample: int = 1) -> Dict[str, Any]:
+        """
+        Verdict in the same shape as check_regression, plus the
+        sequential details. An undecided comparison that ran out of
+        samples falls back to the point estimate, like check_regression.
+        """
+        delta = self.sequence.mean
+        decided_early = decision is not None
+        if decision is None:
+            decision = "fail" if delta is not None and delta < -self.margin else "pass"
+
+        low, high = self.sequence.interval
+        saved = total_samples - self.n
+
+        return {
+            "regression_passed": decision == "pass",
+            "failures": [] if decision == "pass" else ["accuracy_regression"],
+            "decided_early": decided_early,
+            "samples_evaluated": self.n,
+            "samples_total": total_samples,
+            "samples_saved": saved,
+            "llm_calls_saved": saved * calls_per_sample,
+            "baseline_accuracy": round(self.baseline_total / self.n, 4) if self.n else None,
+            "candidate_accuracy": round(self.candidate_total / self.n, 4) if self.n else None,
+            "accuracy_delta": round(delta, 4) if delta is not None else None,
+            "confidence_sequence": {"lower": round(low, 4), "upper": round(high, 4), "alpha": self.alpha},
+            "margin": self.margin,
+            "checks": self.checks,
+        }
+
+
+_EXACT_MATCH = ExactMatchMetric()
+
+
+def exact_match_score(result: EvalResult) -> float:
+    return _EXACT_MATCH.compute(result)["exact_match"]
+
+
+async def asequential_compare(
+    samples: List[EvalSample],
+    candidate_llm: BaseLLM,
+    dataset_name: str,
+    baseline_llm: Optional[BaseLLM] = None,
+    baseline_results: Optional[Dict[str, EvalResult]] = None,
+    score: Callable[[EvalResult], float] = exact_match_score,
+    margin: float = 0.03,
+    alpha: float = 0.05,
+    check_every: int = 20,
+    max_concurrency: int = 4,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Evaluate baseline and candidate chunk by chunk on one shuffled sample
+    order and stop once the regression verdict is decided.
+
+    Pass either baseline_llm (both models are run) or baseline_results,
+    the sample_id -> EvalResult of an already finished baseline run
+    (only the candidate is run; samples it lacks are skipped).
+    Shuffling matters: datasets are often ordered by topic or difficulty,
+    and the guarantee assumes samples arrive in random order.
+    """
+    if (baseline_llm is None) == (baseline_results is None):
+        raise ValueError("Pass exactly one of baseline_llm and baseline_results")
+
+    order = [s for s in samples if baseline_results is None or s.id in baseline_results]
+    random.Random(seed).shuffle(order)
+
+    comparison = SequentialComparison(margin=margin, alpha=alpha)
+    decision = None
+
+    for start in range(0, len(order), check_every):
+        chunk = order[start:start + check_every]
+
+        candidate_run = aevaluate_dataset(chunk, candidate_llm, dataset_name, max_concurrency=max_concurrency)
+        if baseline_llm is not None:
+            baseline_chunk, candidate_chunk = await asyncio.gather(
+                aevaluate_dataset(chunk, baseline_llm, dataset_name, max_concurrency=max_concurrency),
+                candidate_run,
+            )
+        else:
+            baseline_chunk = [baseline_results[s.id] for s in chunk]
+            candidate_chunk = await candidate_run
+
+        for baseline, candidate in zip(baseline_chunk, candidate_chunk):
+            comparison.update(score(baseline), score(candidate))
+
+        decision = comparison.check()
+        if decision is not None:
+            break
+
+    return comparison.summary(
+        len(order),
+        decision,
+        calls_per_sample=2 if baseline_llm is not None else 1,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential go/no-go comparison of two models.")
+    parser.add_argument("--dataset", required=True)
+    parser.add_argument("--candidate", required=True, help="Candidate model name (same naming as runs)")
+    baseline = parser.add_mutually_exclusive_group(required=True)
+    baseline.add_argument("--baseline", help="Baseline model name")
+    baseline.add_argument("--baseline-run", help="Reuse the per-sample results of a completed run")
+    parser.add_argument("--max-samples", type=int, default=1000)
+    parser.add_argument("--margin", type=float, default=0.03, help="Allowed accuracy drop")
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--check-every", type=int, default=20)
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Imported here so the module stays importable without API settings
+    from eval_datasets.registry import load_dataset_by_name
+    from models.llm_clients.registry import build_llm
+
+    baseline_results = None
+    if args.baseline_run:
+        from api.routes._store import RUN_STORE
+        baseline_results = {
+            record["sample_id"]: EvalResult(**record["result"])
+            for record in RUN_STORE.get_samples(args.baseline_run)
+        }
+
+    summary = asyncio.run(asequential_compare(
+        samples=load_dataset_by_name(args.dataset, limit=args.max_samples),
+        candidate_llm=build_llm(args.candidate),
+        dataset_name=args.dataset,
+        baseline_llm=build_llm(args.baseline) if args.baseline else None,
+        baseline_results=baseline_results,
+        margin=args.margin,
+        alpha=args.alpha,
+        check_every=args.check_every,
+        max_concurrency=args.max_workers,
+        seed=args.seed,
+    ))
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
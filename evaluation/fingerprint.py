@@ -0,0 +1,55 @@
+import hashlib
+import json
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+from eval_datasets.schemas import EvalSample
+
+
+# Bump when inference or judge prompts (or anything else that changes a
+# sample's outcome without changing the sample or the run config) change,
+# so results stored by older versions are no longer reused.
+FINGERPRINT_VERSION = 1
+
+
+def run_config(
+    dataset: str,
+    model_name: str,
+    client_model: Optional[str],
+    judge_model: str,
+    num_judges: int,
+    cascade: bool = False,
+) -> Dict[str, Any]:
+    """
+    Everything besides the sample itself that determines a sample's
+    stored record: the run's model name (including any client spec),
+    the model the client actually calls, and the judge setup.
+    """
+    config = {
+        "version": FINGERPRINT_VERSION,
+        "dataset": dataset,
+        "model_name": model_name,
+        "client_model": client_model,
+        "judge_model": judge_model,
+        "num_judges": num_judges,
+    }
+    # Only present when set, so full-panel fingerprints stay unchanged
+    if cascade:
+        config["cascade"] = True
+    return config
+
+
+def sample_fingerprints(samples: List[EvalSample], config: Dict[str, Any]) -> Dict[str, str]:
+    """
+    sample_id -> fingerprint: a hash of every EvalSample field plus the
+    run config. Two runs produce the same fingerprint for a sample only
+    if re-running it would send the same prompts to the same models.
+    """
+    config_digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode()).digest()
+
+    fingerprints = {}
+    for sample in samples:
+        h = hashlib.sha256(config_digest)
+        h.update(json.dumps(asdict(sample), sort_keys=True, default=str).encode())
+        fingerprints[sample.id] = h.hexdigest()
+    return fingerprints
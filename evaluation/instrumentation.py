@@ -0,0 +1,322 @@
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from evaluation.judges.base import BaseJudge
+from evaluation.results import EvalResult
+
+
+_CURRENT_SPAN: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "autoelave_current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """
+    One timed operation. Times are monotonic (perf_counter_ns) and are
+    only converted to wall-clock nanoseconds on export.
+    """
+    name: str
+    span_id: str
+    parent_span_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return ((self.end_ns or time.perf_counter_ns()) - self.start_ns) / 1e9
+
+
+class Tracer:
+    """
+    Collects spans for one evaluation run.
+
+    Every span updates per-name totals (count, total and max seconds), so
+    summary() is exact however many spans there are; only the first
+    max_spans spans are kept for export. Export is OTLP/JSON, the format
+    OpenTelemetry collectors accept on /v1/traces.
+
+    Stages (dataset load, inference, judging, ...) are sequential
+    top-level spans switched with stage(); everything else nests under
+    the current span, also across asyncio tasks and to_thread() calls.
+
+    on_span, if given, is called with every finished span (e.g. to feed
+    Prometheus metrics); it must be cheap and thread-safe.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        max_spans: int = 10_000,
+        service_name: str = "autoelave",
+        on_span: Optional[Callable[[Span], None]] = None,
+    ):
+        self.run_id = run_id
+        self.on_span = on_span
+        self.max_spans = max_spans
+        self.service_name = service_name
+        self.trace_id = secrets.token_hex(16)
+
+        # Anchor for converting monotonic times to wall-clock on export
+        self._wall_anchor_ns = time.time_ns()
+        self._mono_anchor_ns = time.perf_counter_ns()
+
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self.stages: Dict[str, float] = {}
+
+        self.root = self._open("evaluation_run", None, {"run_id": run_id})
+        self._stage: Optional[Span] = None
+
+    # -------------------------------
+    # Recording
+    # -------------------------------
+    def _open(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        return Span(
+            name=name,
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent.span_id if parent else None,
+            start_ns=time.perf_counter_ns(),
+            attributes=dict(attributes),
+        )
+
+    def _close(self, span: Span, always_keep: bool = False) -> None:
+        if span.end_ns is None:
+            span.end_ns = time.perf_counter_ns()
+        duration = span.duration
+
+        with self._lock:
+            totals = self._totals.setdefault(span.name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            totals["count"] += 1
+            totals["total_seconds"] += duration
+            totals["max_seconds"] = max(totals["max_seconds"], duration)
+
+            # The run and stage spans are kept even past max_spans
+            if always_keep or len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+        if self.on_span:
+            self.on_span(span)
+
+    def _parent(self) -> Span:
+        return _CURRENT_SPAN.get() or self._stage or self.root
+
+    def stage(self, name: str) -> None:
+        """
+        End the current stage span (if any) and start a new one.
+        """
+        self._end_stage()
+        self._stage = self._open(name, self.root, {})
+
+    def _end_stage(self) -> None:
+        if self._stage is not None:
+            self._close(self._stage, always_keep=True)
+            self.stages[self._stage.name] = round(self.stages.get(self._stage.name, 0.0) + self._stage.duration, 4)
+            self._stage = None
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        span = self._open(name, self._parent(), attributes)
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.error = str(e)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            self._close(span)
+
+    def record(self, name: str, duration: float, **attributes) -> None:
+        """
+        Record an operation that was timed elsewhere and just finished
+        (e.g. an LLM call whose latency is on its EvalResult).
+        """
+        end_ns = time.perf_counter_ns()
+        span = self._open(name, self._parent(), attributes)
+        span.start_ns = end_ns - int(duration * 1e9)
+        span.end_ns = end_ns
+        self._close(span)
+
+    def finish(self) -> None:
+        self._end_stage()
+        if self.root.end_ns is None:
+            self._close(self.root, always_keep=True)
+
+    # -------------------------------
+    # Output
+    # -------------------------------
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {
+                name: {
+                    "count": int(t["count"]),
+                    "total_seconds": round(t["total_seconds"], 4),
+                    "mean_seconds": round(t["total_seconds"] / t["count"], 4),
+                    "max_seconds": round(t["max_seconds"], 4),
+                }
+                for name, t in self._totals.items()
+                if name not in self.stages and name != "evaluation_run"
+            }
+        return {
+            "wall_seconds": round(self.root.duration, 4),
+            "stages": dict(self.stages),
+            "operations": operations,
+            "dropped_spans": self.dropped,
+        }
+
+    def _unix_ns(self, mono_ns: int) -> int:
+        return self._wall_anchor_ns + (mono_ns - self._mono_anchor_ns)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        def attribute(key, value):
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        with self._lock:
+            spans = list(self.spans)
+
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "autoelave.evaluation"},
+                    "spans": [
+                        {
+                            "traceId": self.trace_id,
+                            "spanId": span.span_id,
+                            **({"parentSpanId": span.parent_span_id} if span.parent_span_id else {}),
+                            "name": span.name,
+                            "kind": 1,
+                            "startTimeUnixNano": str(self._unix_ns(span.start_ns)),
+                            "endTimeUnixNano": str(self._unix_ns(span.end_ns)),
+                            "attributes": [attribute(k, v) for k, v in span.attributes.items()],
+                            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+                        }
+                        for span in spans
+                    ],
+                }],
+            }],
+        }
+
+    def export(self, path: str, endpoint: Optional[str] = None) -> None:
+        """
+        Write the trace as OTLP/JSON to `path`, and also POST it to an
+        OTLP/HTTP collector if `endpoint` (or OTEL_EXPORTER_OTLP_ENDPOINT)
+        is set. Export failures are reported but never fail the run.
+        """
+        payload = self.to_otlp()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(payload, f)
+
+        endpoint = endpoint or os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+        if not endpoint:
+            return
+
+        request = urllib.request.Request(
+            endpoint.rstrip("/") + "/v1/traces",
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            urllib.request.urlopen(request, timeout=10).close()
+        except Exception as e:
+            print(f"[TRACE] OTLP export to {endpoint} failed: {e}")
+
+
+def build_run_summary(
+    tracer: Tracer,
+    usage: Dict[str, Dict[str, Any]],
+    num_samples: int,
+    num_judge_calls: int,
+    queue_wait_seconds: Optional[float] = None,
+    rate_limiter: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Time, token, cost and throughput summary for a run report.
+
+    `usage` maps a role ("inference", "judge_0", ...) to its token usage
+    with cost (see models.llm_clients.usage.usage_with_cost); only calls
+    made by this run are counted. `rate_limiter` is the run's
+    rate-limiter stats delta, for throttle / backoff waiting.
+    """
+    summary = tracer.summary()
+    stages = summary["stages"]
+
+    input_tokens = sum(u["input_tokens"] for u in usage.values())
+    output_tokens = sum(u["output_tokens"] for u in usage.values())
+    costs = [u["cost_usd"] for u in usage.values() if u.get("cost_usd") is not None]
+
+    def per_second(count, seconds):
+        return round(count / seconds, 3) if seconds else None
+
+    return {
+        **summary,
+        "queue_wait_seconds": None if queue_wait_seconds is None else round(queue_wait_seconds, 3),
+        "throttle_wait_seconds": (rate_limiter or {}).get("throttle_wait_seconds"),
+        "backoff_wait_seconds": (rate_limiter or {}).get("backoff_wait_seconds"),
+        "retries": sum(u.get("retries", 0) for u in usage.values()),
+        "tokens": {
+            **usage,
+            "total": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+        },
+        "cost_usd": round(sum(costs), 6) if costs else None,
+        "throughput": {
+            "samples_per_second": per_second(num_samples, stages.get("inference")),
+            "judge_calls_per_second": per_second(num_judge_calls, stages.get("judging")),
+            "tokens_per_second": per_second(input_tokens + output_tokens, summary["wall_seconds"]),
+        },
+    }
+
+
+class TracedJudge(BaseJudge):
+    """
+    Wraps a judge so every call is recorded as a span named after
+    `label` (e.g. "judge.judge_0"). name() is unchanged, so judgments
+    look exactly as without tracing.
+    """
+
+    def __init__(self, judge: BaseJudge, tracer: Tracer, label: str):
+        self.judge_impl = judge
+        self.tracer = tracer
+        self.label = label
+
+    def name(self) -> str:
+        return self.judge_impl.name()
+
+    def judge(self, result: EvalResult) -> Dict[str, Any]:
+        with self.tracer.span(self.label, sample_id=result.sample_id):
+            return self.judge_impl.judge(result)
+
+    async def ajudge(self, result: EvalResult) -> Dict[str, Any]:
+        with self.tracer.span(self.label, sample_id=result.sample_id):
+            return await self.judge_impl.ajudge(result)
+
+    def judge_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        with self.tracer.span(self.label, batch_size=len(results)):
+            return self.judge_impl.judge_batch(results)
+
+    async def ajudge_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        with self.tracer.span(self.label, batch_size=len(results)):
+            return await self.judge_impl.ajudge_batch(results)
@@ -1,4 +1,6 @@
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
+import asyncio
 import statistics
 
 from evaluation.results import EvalResult
@@ -20,15 +22,112 @@ class JudgeAgreement:
         """
         Run all judges and compute agreement metrics.
         """
+        judgments = [judge.judge(result) for judge in self.judges]
+        return self._summarize(judgments)
+
+    async def aevaluate(
+        self,
+        result: EvalResult,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async version of evaluate(): all judges run concurrently.
+
+        If a semaphore is given, every judge call acquires it, so several
+        aevaluate() calls can share one concurrency budget.
+        """
+
+        async def _call(judge: BaseJudge) -> Dict[str, Any]:
+            if semaphore is None:
+                return await judge.ajudge(result)
+            async with semaphore:
+                return await judge.ajudge(result)
+
+        # gather() keeps judge order, so statistics match evaluate()
+        judgments = await asyncio.gather(*(_call(judge) for judge in self.judges))
+        return self._summarize(list(judgments))
+
+    async def aevaluate_batch(
+        self,
+        results: List[EvalResult],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Judge a micro-batch of results: each judge gets one ajudge_batch()
+        call for the whole batch, all judges concurrently.
+
+        A semaphore, if given, is acquired once per judge batch call.
+        """
+
+        async def _call(judge: BaseJudge) -> List[Dict[str, Any]]:
+            if semaphore is None:
+                return await judge.ajudge_batch(results)
+            async with semaphore:
+                return await judge.ajudge_batch(results)
+
+        per_judge = await asyncio.gather(*(_call(judge) for judge in self.judges))
+        return [self._summarize(list(judgments)) for judgments in zip(*per_judge)]
+
+    async def aevaluate_many(
+        self,
+        results: List[EvalResult],
+        max_concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """
+        Judge many results concurrently.
+
+        max_concurrency caps the total number of in-flight judge calls
+        across all results and judges.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        return list(await asyncio.gather(
+            *(self.aevaluate(result, semaphore) for result in results)
+        ))
+
+    def evaluate_many(
+        self,
+        results: List[EvalResult],
+        max_workers: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Thread-based counterpart of aevaluate_many().
+
+        Every (result, judge) pair is submitted to one shared pool of
+        max_workers threads. Output order matches the input results.
+        """
+        if max_workers <= 1:
+            return [self.evaluate(result) for result in results]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                [executor.submit(judge.judge, result) for judge in self.judges]
+                for result in results
+            ]
+            return [
+                self._summarize([future.result() for future in row])
+                for row in futures
+            ]
+
+    def _summarize(
+        self,
+        judgments: List[Dict[str, Any]],
+        names: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compute agreement statistics from per-judge outputs
+        (one entry per judge, in self.judges order). names labels the
+        judgments when they do not come from every judge in turn.
+        """
+        if names is None:
+            names = [judge.name() for judge in self.judges]
 
         scores = []
         explanations = []
         raw_judgments = []
 
-        for judge in self.judges:
-            judgment = judge.judge(result)
+        for name, judgment in zip(names, judgments):
             raw_judgments.append({
-                "judge": judge.name(),
+                "judge": name,
                 **judgment
             })
 
@@ -48,7 +147,7 @@ class JudgeAgreement:
 
         return {
             "agreement_success": True,
-            "num_judges": len(self.judges),
+            "num_judges": len(judgments),
             "scores": scores,
             "mean_score": round(statistics.mean(scores), 2),
             "median_score": statistics.median(scores),
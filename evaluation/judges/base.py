@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 from evaluation.results import EvalResult
 
 
@@ -21,3 +22,28 @@ class BaseJudge(ABC):
         Judge a single EvalResult and return structured scores.
         """
         pass
+
+    async def ajudge(self, result: EvalResult) -> Dict[str, Any]:
+        """
+        Async version of judge().
+
+        Default implementation runs judge() in a worker thread so
+        synchronous judges can be awaited alongside native async ones.
+        """
+        return await asyncio.to_thread(self.judge, result)
+
+    def judge_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Judge several EvalResults, in input order.
+
+        Judges backed by a model should override this to send one batched
+        request; the default judges each result in turn.
+        """
+        return [self.judge(result) for result in results]
+
+    async def ajudge_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Async version of judge_batch(); the default awaits ajudge()
+        for every result concurrently.
+        """
+        return list(await asyncio.gather(*(self.ajudge(result) for result in results)))
@@ -0,0 +1,404 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import statistics
+
+from evaluation.results import EvalResult
+from evaluation.judges.base import BaseJudge
+from evaluation.judges.agreement import JudgeAgreement
+
+
+# A signal decides a sample without calling any judge: it returns a
+# judgment ({"judge_score", "judge_explanation"}) or None when unsure.
+Signal = Callable[[EvalResult], Optional[Dict[str, Any]]]
+
+# Judge scores in this range (inclusive) are not trusted on their own
+DEFAULT_BORDERLINE = (3, 3)
+
+# Two judges at most this far apart agree
+DEFAULT_MAX_GAP = 1
+
+
+def exact_match_signal(
+    exact_scores: Dict[str, Dict[str, Any]],
+    correct_score: int = 5,
+    incorrect_score: Optional[int] = None,
+) -> Signal:
+    """
+    Decide samples whose extracted final answer matches the reference
+    (correct_score). With incorrect_score set, samples with a different
+    extracted answer are decided too; by default they go to the judges,
+    who may still credit the reasoning.
+
+    exact_scores: sample_id -> ExactMatchMetric score.
+    """
+
+    def signal(result: EvalResult) -> Optional[Dict[str, Any]]:
+        score = exact_scores.get(result.sample_id)
+        if not score or not score.get("gold_answer"):
+            return None
+
+        if score["exact_match"] == 1:
+            return {
+                "judge_score": correct_score,
+                "judge_explanation": f"Final answer {score['predicted_answer']} matches the reference.",
+            }
+        if incorrect_score is not None and score.get("predicted_answer"):
+            return {
+                "judge_score": incorrect_score,
+                "judge_explanation": (
+                    f"Final answer {score['predicted_answer']} differs from "
+                    f"the reference ({score['gold_answer']})."
+                ),
+            }
+        return None
+
+    return signal
+
+
+def similarity_signal(
+    similarity_scores: Dict[str, Dict[str, Any]],
+    high: float = 0.9,
+    low: Optional[float] = None,
+    correct_score: int = 5,
+    incorrect_score: int = 1,
+) -> Signal:
+    """
+    Decide samples whose output is semantically close to the best answer
+    (similarity_best >= high and closer to it than to any incorrect
+    answer). With low set, outputs that far from the best answer and
+    closer to an incorrect one get incorrect_score.
+
+    similarity_scores: sample_id -> SemanticSimilarityMetric score.
+    """
+
+    def signal(result: EvalResult) -> Optional[Dict[str, Any]]:
+        score = similarity_scores.get(result.sample_id)
+        if not score or score.get("similarity_best") is None:
+            return None
+
+        best = score["similarity_best"]
+        if best >= high and score.get("closer_to_correct") != 0:
+            return {
+                "judge_score": correct_score,
+                "judge_explanation": f"Output is semantically equivalent to the best answer ({best}).",
+            }
+        if low is not None and best <= low and score.get("closer_to_correct") == 0:
+            return {
+                "judge_score": incorrect_score,
+                "judge_explanation": f"Output is far from the best answer ({best}) and closer to an incorrect one.",
+            }
+        return None
+
+    return signal
+
+
+SIGNAL_REGISTRY: Dict[str, Callable[[Dict[str, Dict[str, Any]]], Signal]] = {
+    "exact_match": exact_match_signal,
+    "semantic_similarity": similarity_signal,
+}
+
+# Signals trusted per dataset, each fed by the metric of the same name.
+# Exact match only means something where references end in a number.
+DATASET_SIGNALS: Dict[str, List[str]] = {
+    "gsm8k": ["exact_match"],
+    "synthetic": ["exact_match"],
+    "truthfulqa": ["semantic_similarity"],
+}
+
+
+def dataset_signals(dataset: str, scores: Dict[str, Dict[str, Dict[str, Any]]]) -> Dict[str, Signal]:
+    """
+    The dataset's signals, for those whose metric was computed.
+
+    scores: metric name -> sample_id -> that metric's score.
+    """
+    return {
+        name: SIGNAL_REGISTRY[name](scores[name])
+        for name in DATASET_SIGNALS.get(dataset, [])
+        if name in scores
+    }
+
+
+class CascadingJudgeAgreement(JudgeAgreement):
+    """
+    JudgeAgreement that only calls as many judges as a sample needs:
+
+    1. signals (cheap deterministic checks such as exact match) decide
+       confident samples with no judge call; failed model outputs are
+       always decided here (score 0, as every judge would give)
+    2. otherwise the first judge scores the sample; a score outside
+       `borderline` is final
+    3. a borderline or unparseable score brings in the second judge; if
+       both are within max_gap of each other they are final
+    4. otherwise the remaining judges are called as well
+
+    Judgments carry the usual agreement fields over the scores actually
+    obtained, plus "cascade": {"stage", "judge_calls"}. A fixed fraction
+    (audit_rate, chosen by sample id so reruns audit the same samples)
+    is also scored by the full panel; "cascade"."audit" then records
+    whether the cascade's mean score is within audit_tolerance of the
+    panel's. The returned judgment is always the cascade's own.
+    """
+
+    def __init__(
+        self,
+        judges: List[BaseJudge],
+        signals: Optional[Dict[str, Signal]] = None,
+        borderline: Tuple[int, int] = DEFAULT_BORDERLINE,
+        max_gap: int = DEFAULT_MAX_GAP,
+        audit_rate: float = 0.0,
+        audit_tolerance: float = 0.5,
+    ):
+        super().__init__(judges)
+        self.signals = signals or {}
+        self.borderline = borderline
+        self.max_gap = max_gap
+        self.audit_rate = audit_rate
+        self.audit_tolerance = audit_tolerance
+
+    # -------------------------
+    # Cascade decisions
+    # -------------------------
+    def _decide(self, result: EvalResult) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        (signal name, judgment) if a signal decides the result.
+        """
+        if not result.success:
+            return "model_failed", {
+                "judge_score": 0,
+                "judge_explanation": "Model failed to produce a valid response.",
+            }
+
+        for name, signal in self.signals.items():
+            judgment = signal(result)
+            if judgment is not None:
+                return name, judgment
+        return None
+
+    def _uncertain(self, judgment: Dict[str, Any]) -> bool:
+        score = judgment.get("judge_score")
+        low, high = self.borderline
+        return not isinstance(score, int) or low <= score <= high
+
+    def _next_judges(self, judgments: List[Dict[str, Any]]) -> List[int]:
+        """
+        Indices of the judges to call next, given the judgments of the
+        first len(judgments) judges; [] once the sample is decided.
+        """
+        if not judgments:
+            return [0]
+
+        if len(judgments) == 1:
+            return [1] if self._uncertain(judgments[0]) else []
+
+        if len(judgments) == 2:
+            first, second = (j.get("judge_score") for j in judgments)
+            agree = (
+                isinstance(first, int)
+                and isinstance(second, int)
+                and abs(first - second) <= self.max_gap
+            )
+            return [] if agree else list(range(2, len(self.judges)))
+
+        return []
+
+    def _audited(self, result: EvalResult) -> bool:
+        if self.audit_rate <= 0 or not result.success:
+            return False
+        digest = hashlib.sha256(result.sample_id.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") / 2 ** 64 < self.audit_rate
+
+    def _cascade_summary(
+        self,
+        decided: Optional[Tuple[str, Dict[str, Any]]],
+        judgments: List[Dict[str, Any]],
+        panel: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        if decided is not None:
+            name, judgment = decided
+            summary = self._summarize([judgment], [name])
+            summary["num_judges"] = 0
+            stage = "model_failed" if name == "model_failed" else "signal"
+        else:
+            summary = self._summarize(judgments, [judge.name() for judge in self.judges[:len(judgments)]])
+            stage = {1: "single", 2: "pair"}.get(len(judgments), "panel")
+
+        summary["cascade"] = {"stage": stage, "judge_calls": len(judgments)}
+        if decided is not None and decided[0] != "model_failed":
+            summary["cascade"]["signal"] = decided[0]
+
+        if panel is not None:
+            panel_mean = self._summarize(panel).get("mean_score")
+            cascade_mean = summary.get("mean_score")
+            difference = (
+                round(cascade_mean - panel_mean, 2)
+                if cascade_mean is not None and panel_mean is not None
+                else None
+            )
+            summary["cascade"]["audit"] = {
+                "panel_mean_score": panel_mean,
+                "difference": difference,
+                "match": (
+                    abs(difference) <= self.audit_tolerance
+                    if difference is not None
+                    else cascade_mean is None and panel_mean is None
+                ),
+                "judge_calls": len(panel) - len(judgments),
+            }
+        return summary
+
+    # -------------------------
+    # JudgeAgreement interface
+    # -------------------------
+    def evaluate(self, result: EvalResult) -> Dict[str, Any]:
+        decided = self._decide(result)
+        judgments: List[Dict[str, Any]] = []
+        while decided is None:
+            upcoming = self._next_judges(judgments)
+            if not upcoming:
+                break
+            judgments += [self.judges[i].judge(result) for i in upcoming]
+
+        panel = None
+        if self._audited(result):
+            panel = judgments + [judge.judge(result) for judge in self.judges[len(judgments):]]
+        return self._cascade_summary(decided, judgments, panel)
+
+    async def aevaluate(
+        self,
+        result: EvalResult,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async evaluate(); judges of the same stage run concurrently, and
+        every judge call acquires the semaphore if one is given.
+        """
+
+        async def _call(judge: BaseJudge) -> Dict[str, Any]:
+            if semaphore is None:
+                return await judge.ajudge(result)
+            async with semaphore:
+                return await judge.ajudge(result)
+
+        decided = self._decide(result)
+        judgments: List[Dict[str, Any]] = []
+        while decided is None:
+            upcoming = self._next_judges(judgments)
+            if not upcoming:
+                break
+            judgments += await asyncio.gather(*(_call(self.judges[i]) for i in upcoming))
+
+        panel = None
+        if self._audited(result):
+            rest = await asyncio.gather(*(_call(judge) for judge in self.judges[len(judgments):]))
+            panel = judgments + list(rest)
+        return self._cascade_summary(decided, judgments, panel)
+
+    async def aevaluate_batch(
+        self,
+        results: List[EvalResult],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Cascade over a micro-batch: each stage sends every judge one
+        ajudge_batch() call with just the results that still need it.
+        """
+
+        async def _call(judge: BaseJudge, batch: List[EvalResult]) -> List[Dict[str, Any]]:
+            if semaphore is None:
+                return await judge.ajudge_batch(batch)
+            async with semaphore:
+                return await judge.ajudge_batch(batch)
+
+        async def _run_stage(wanted: Dict[int, List[int]], collected: List[List[Dict[str, Any]]]) -> None:
+            # Judges in index order, so each result's judgments stay in judge order
+            order = sorted(wanted)
+            outputs = await asyncio.gather(*(
+                _call(self.judges[j], [results[i] for i in wanted[j]]) for j in order
+            ))
+            for j, output in zip(order, outputs):
+                for i, judgment in zip(wanted[j], output):
+                    collected[i].append(judgment)
+
+        decided = [self._decide(result) for result in results]
+        judgments: List[List[Dict[str, Any]]] = [[] for _ in results]
+        while True:
+            wanted: Dict[int, List[int]] = {}
+            for i, result in enumerate(results):
+                if decided[i] is None:
+                    for j in self._next_judges(judgments[i]):
+                        wanted.setdefault(j, []).append(i)
+            if not wanted:
+                break
+            await _run_stage(wanted, judgments)
+
+        audited = [i for i, result in enumerate(results) if self._audited(result)]
+        panels: Dict[int, List[Dict[str, Any]]] = {i: list(judgments[i]) for i in audited}
+        wanted = {}
+        for i in audited:
+            for j in range(len(judgments[i]), len(self.judges)):
+                wanted.setdefault(j, []).append(i)
+        if wanted:
+            collected: List[List[Dict[str, Any]]] = [[] for _ in results]
+            await _run_stage(wanted, collected)
+            for i in audited:
+                panels[i] += collected[i]
+
+        return [
+            self._cascade_summary(decided[i], judgments[i], panels.get(i))
+            for i in range(len(results))
+        ]
+
+    def evaluate_many(
+        self,
+        results: List[EvalResult],
+        max_workers: int = 1,
+    ) -> List[Dict[str, Any]]:
+        if max_workers <= 1:
+            return [self.evaluate(result) for result in results]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.evaluate, results))
+
+
+def summarize_cascade(judgments: List[Dict[str, Any]], num_judges: int) -> Dict[str, Any]:
+    """
+    Judge calls made and saved by cascading judgments, against calling
+    all num_judges judges for every sample, and how audited samples
+    compare with their full-panel scores.
+
+    Failed model outputs are left out of the full-panel count: judges
+    score those without an LLM call anyway.
+    """
+    cascades = [j["cascade"] for j in judgments if j.get("cascade")]
+    calls = sum(c["judge_calls"] for c in cascades)
+    full_panel = num_judges * sum(1 for c in cascades if c["stage"] != "model_failed")
+    audits = [c["audit"] for c in cascades if "audit" in c]
+    audit_calls = sum(a["judge_calls"] for a in audits)
+    differences = [a["difference"] for a in audits if a["difference"] is not None]
+    matches = sum(1 for a in audits if a["match"])
+
+    return {
+        "samples": len(cascades),
+        "decided_by": dict(Counter(c["stage"] for c in cascades)),
+        "judge_calls": calls,
+        "full_panel_calls": full_panel,
+        "judge_calls_saved": full_panel - calls,
+        "saved_fraction": round((full_panel - calls) / full_panel, 3) if full_panel else None,
+        "audit": {
+            "samples": len(audits),
+            "judge_calls": audit_calls,
+            "matches": matches,
+            "match_rate": round(matches / len(audits), 3) if audits else None,
+            # Signed: > 0 when the cascade scores higher than the panel
+            "mean_difference": round(statistics.mean(differences), 3) if differences else None,
+            "mean_abs_difference": (
+                round(statistics.mean(abs(d) for d in differences), 3) if differences else None
+            ),
+        },
+        # What the run actually saved, audit calls included
+        "net_judge_calls_saved": full_panel - calls - audit_calls,
+    }
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import json
 import re
 
@@ -50,28 +50,10 @@ Give a score from 1 to 5 and a short explanation.
 You may respond in plain text or JSON.
 """.strip()
 
-    def judge(self, result: EvalResult) -> Dict[str, Any]:
+    def _parse_response(self, response: str) -> Dict[str, Any]:
         """
-        Judge a single EvalResult using an LLM.
+        Extract a 1-5 score and explanation from a raw judge response.
         """
-
-        # Case 1: evaluated model failed → automatic judge failure
-        if not result.success:
-            return {
-                "judge_score": 0,
-                "judge_explanation": "Model failed to produce a valid response."
-            }
-
-        prompt = self._build_prompt(result)
-
-        try:
-            response = self.judge_llm.generate(prompt)
-        except Exception as e:
-            return {
-                "judge_score": None,
-                "judge_explanation": f"Judge failed: {str(e)}"
-            }
-
         score = None
         explanation = None
 
@@ -98,3 +80,89 @@ You may respond in plain text or JSON.
             "judge_score": score,
             "judge_explanation": explanation
         }
+
+    def judge(self, result: EvalResult) -> Dict[str, Any]:
+        """
+        Judge a single EvalResult using an LLM.
+        """
+
+        # Case 1: evaluated model failed → automatic judge failure
+        if not result.success:
+            return self._model_failed_judgment()
+
+        prompt = self._build_prompt(result)
+
+        try:
+            response = self.judge_llm.generate(prompt)
+        except Exception as e:
+            return self._judge_failed_judgment(e)
+
+        return self._parse_response(response)
+
+    async def ajudge(self, result: EvalResult) -> Dict[str, Any]:
+        """
+        Async version of judge() using the judge LLM's async API.
+        """
+        if not result.success:
+            return self._model_failed_judgment()
+
+        prompt = self._build_prompt(result)
+
+        try:
+            response = await self.judge_llm.agenerate(prompt)
+        except Exception as e:
+            return self._judge_failed_judgment(e)
+
+        return self._parse_response(response)
+
+    def judge_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Judge several EvalResults with one batched judge LLM call.
+        """
+        judgments, pending = self._prepare_batch(results)
+        responses = self.judge_llm.generate_batch_with_metadata(
+            [self._build_prompt(results[i]) for i in pending]
+        )
+        return self._finish_batch(judgments, pending, responses)
+
+    async def ajudge_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Async version of judge_batch().
+        """
+        judgments, pending = self._prepare_batch(results)
+        responses = await self.judge_llm.agenerate_batch_with_metadata(
+            [self._build_prompt(results[i]) for i in pending]
+        )
+        return self._finish_batch(judgments, pending, responses)
+
+    def _prepare_batch(self, results: List[EvalResult]):
+        """
+        Fill in judgments for failed model outputs; return them plus the
+        indices that still need the judge LLM.
+        """
+        judgments: List[Optional[Dict[str, Any]]] = [
+            None if result.success else self._model_failed_judgment()
+            for result in results
+        ]
+        pending = [i for i, result in enumerate(results) if result.success]
+        return judgments, pending
+
+    def _finish_batch(self, judgments, pending, responses) -> List[Dict[str, Any]]:
+        for i, response in zip(pending, responses):
+            if "error" in response:
+                judgments[i] = self._judge_failed_judgment(response["error"])
+            else:
+                judgments[i] = self._parse_response(response["output"])
+        return judgments
+
+    def _model_failed_judgment(self) -> Dict[str, Any]:
+        return {
+            "judge_score": 0,
+            "judge_explanation": "Model failed to produce a valid response."
+        }
+
+    def _judge_failed_judgment(self, error: Exception) -> Dict[str, Any]:
+        return {
+            "judge_score": None,
+            "judge_explanation": f"Judge failed: {str(error)}"
+        }
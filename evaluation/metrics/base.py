@@ -1,13 +1,23 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
 from evaluation.results import EvalResult
 
 
 class BaseMetric(ABC):
     """
     Abstract base class for all evaluation metrics.
+
+    `execution` tells MetricPipeline how to run the metric:
+    - "inline": cheap; computed in the calling process
+    - "cpu":    CPU-bound; batches go to a process pool, so the metric
+                (and its results) must be picklable
+    - "io":     waits on something (a model server, an API); batches run
+                concurrently in threads, or via acompute_batch
     """
 
+    execution: str = "inline"
+
     @abstractmethod
     def name(self) -> str:
         """
@@ -24,3 +34,18 @@ class BaseMetric(ABC):
         multiple values if needed.
         """
         pass
+
+    def compute_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Scores for many results, in input order. Override when a batch
+        can be scored faster than one result at a time (vectorized or
+        batched model calls).
+        """
+        return [self.compute(result) for result in results]
+
+    async def acompute_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Async compute_batch. The default runs compute_batch in a thread;
+        I/O-bound metrics with a native async client should override it.
+        """
+        return await asyncio.to_thread(self.compute_batch, results)
@@ -1,9 +1,81 @@
 import re
-from typing import Dict, Any
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List
 from evaluation.metrics.base import BaseMetric
 from evaluation.results import EvalResult
 
 
+# GSM8K references (and models prompted GSM8K-style) end with "#### <answer>"
+ANSWER_MARKER = "####"
+
+_DIGITS = "0123456789"
+
+# A number as written in answers: "-3", "$1,200", "12.50", "3/4"
+_NUMBER = re.compile(r"-?\$?\d[\d,]*(?:\.\d+)?(?:/\d+)?")
+_TRAILING_NUMBER = re.compile(r"-?\$?\d[\d,]*(?:\.\d+)?(?:/\d+)?$")
+
+# How far back from the last digit a number may start
+_WINDOW = 64
+
+
+def normalize_number(text: str) -> str:
+    """
+    Canonical form of a number so equal values compare equal:
+    "$1,200.00" -> "1200", "0.50" -> "0.5", "3/4" -> "0.75", "-0" -> "0".
+    """
+    text = text.replace(",", "").replace("$", "")
+
+    # Fast path: plain integers are by far the most common answer
+    digits = text[1:] if text.startswith("-") else text
+    if digits.isdigit():
+        return str(int(text))
+
+    try:
+        value = Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        return text
+
+    if value.denominator == 1:
+        return str(value.numerator)
+    return str(Decimal(value.numerator) / Decimal(value.denominator))
+
+
+def extract_final_answer(text: str) -> str:
+    """
+    The final numeric answer in text, normalized; "" if there is none.
+
+    The first number after the last "####" marker wins; otherwise the
+    last number in the text. The text is scanned from the end, so the
+    cost does not grow with the amount of reasoning before the answer.
+    """
+    if not text:
+        return ""
+
+    marker = text.rfind(ANSWER_MARKER)
+    if marker != -1:
+        match = _NUMBER.search(text, marker + len(ANSWER_MARKER))
+        if match:
+            return normalize_number(match.group())
+
+    end = max(map(text.rfind, _DIGITS))
+    if end == -1:
+        return ""
+
+    match = _TRAILING_NUMBER.search(text, max(0, end - _WINDOW), end + 1)
+    return normalize_number(match.group())
+
+
+@lru_cache(maxsize=1 << 17)
+def gold_answer(reference: str) -> str:
+    """
+    Extracted answer of a reference, cached: references are shared by
+    every model and run scored on the same dataset in this process.
+    """
+    return extract_final_answer(reference)
+
+
 class ExactMatchMetric(BaseMetric):
     """
     Exact match metric for reasoning datasets like GSM8K.
@@ -14,15 +86,15 @@ class ExactMatchMetric(BaseMetric):
         return "exact_match"
 
     def _extract_final_answer(self, text: str) -> str:
+        return extract_final_answer(text)
+
+    def precompute(self, references: Iterable[str]) -> None:
         """
-        Extract the final numeric answer from text.
-        Uses the last number as the final answer.
+        Extract gold answers for a whole dataset up front.
         """
-        if not text:
-            return ""
-
-        numbers = re.findall(r"-?\d+\.?\d*", text)
-        return numbers[-1] if numbers else ""
+        for reference in references:
+            if reference:
+                gold_answer(reference)
 
     def compute(self, result: EvalResult) -> Dict[str, Any]:
         """
@@ -38,8 +110,8 @@ class ExactMatchMetric(BaseMetric):
             }
 
         # Case 2: Model succeeded
-        predicted = self._extract_final_answer(result.model_output)
-        gold = self._extract_final_answer(result.reference)
+        predicted = extract_final_answer(result.model_output)
+        gold = gold_answer(result.reference)
 
         is_match = int(predicted == gold and predicted != "")
 
@@ -48,3 +120,12 @@ class ExactMatchMetric(BaseMetric):
             "predicted_answer": predicted,
             "gold_answer": gold,
         }
+
+    def compute_many(self, results: Iterable[EvalResult]) -> List[Dict[str, Any]]:
+        """
+        Score a whole run; same output as compute() for each result.
+        """
+        return [self.compute(result) for result in results]
+
+    def compute_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        return self.compute_many(results)
@@ -0,0 +1,199 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from evaluation.metrics.base import BaseMetric
+from evaluation.results import EvalResult
+
+
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_LOCK = threading.Lock()
+_PROCESS_POOL_SHARERS = 1
+
+
+def share_process_pool_cpus(num_processes: int) -> None:
+    """
+    Declare that num_processes processes on this host (e.g. job workers)
+    each have their own pool, so the default pool size becomes their
+    share of the CPUs rather than all of them.
+    """
+    global _PROCESS_POOL_SHARERS
+    _PROCESS_POOL_SHARERS = max(1, num_processes)
+
+
+def get_process_pool(max_workers: Optional[int] = None) -> Optional[ProcessPoolExecutor]:
+    """
+    The process-wide pool for CPU-bound metrics, created on first use
+    (spawned workers, so they never inherit the caller's threads) and
+    reused by every later run. max_workers only applies on creation
+    (default: AUTOELAVE_METRIC_PROCESSES, else this process's share of
+    the CPU count, see share_process_pool_cpus()).
+
+    Returns None in daemonic processes, which may not have children;
+    CPU-bound metrics then run in threads instead.
+    """
+    global _PROCESS_POOL
+
+    if multiprocessing.current_process().daemon:
+        return None
+
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            workers = (
+                max_workers
+                or int(os.getenv("AUTOELAVE_METRIC_PROCESSES", "0"))
+                or max(1, (os.cpu_count() or 1) // _PROCESS_POOL_SHARERS)
+            )
+            _PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _PROCESS_POOL
+
+
+def shutdown_process_pool() -> None:
+    """
+    Shut down the process pool, if one was created; the next
+    get_process_pool() creates a new one.
+    """
+    global _PROCESS_POOL
+
+    with _PROCESS_POOL_LOCK:
+        pool, _PROCESS_POOL = _PROCESS_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _compute_batch(metric: BaseMetric, results: List[EvalResult]) -> List[Dict[str, Any]]:
+    # Module-level so it can be sent to pool processes
+    return metric.compute_batch(results)
+
+
+class MetricPipeline:
+    """
+    Runs several metrics over a run's results concurrently, each
+    according to its `execution` hint:
+
+    - "cpu" metrics are split into chunks that run in parallel in the
+      shared process pool (no GIL contention)
+    - "io" metrics run their chunks concurrently, at most max_concurrency
+      at a time, via acompute_batch
+    - "inline" metrics run in one compute_batch call in a thread
+
+    All metrics run at the same time, so the wall time of a run's
+    metrics is roughly that of the slowest one, not their sum.
+
+    A metric that raises is left out of the scores, and its error is
+    kept in `errors` (metric name -> message) for the last computation;
+    the other metrics are unaffected. Metrics that could not load their
+    model score everything None and report why in their own
+    `unavailable`, collected in `unavailable` (metric name -> reason).
+    """
+
+    def __init__(
+        self,
+        metrics: List[BaseMetric],
+        chunk_size: int = 256,
+        max_concurrency: int = 8,
+        max_processes: Optional[int] = None,
+    ):
+        self.metrics = metrics
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.max_processes = max_processes
+        self.errors: Dict[str, str] = {}
+        self.unavailable: Dict[str, str] = {}
+
+    def _chunks(self, results: List[EvalResult]) -> List[List[EvalResult]]:
+        return [results[i:i + self.chunk_size] for i in range(0, len(results), self.chunk_size)]
+
+    async def _run_metric(
+        self,
+        metric: BaseMetric,
+        results: List[EvalResult],
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return await self._score(metric, results, semaphore)
+        except Exception as e:
+            self.errors[metric.name()] = str(e) or type(e).__name__
+            return None
+
+    async def _score(
+        self,
+        metric: BaseMetric,
+        results: List[EvalResult],
+        semaphore: asyncio.Semaphore,
+    ) -> List[Dict[str, Any]]:
+        if metric.execution == "cpu":
+            pool = get_process_pool(self.max_processes)
+            if pool is not None:
+                loop = asyncio.get_running_loop()
+                outputs = await asyncio.gather(*(
+                    loop.run_in_executor(pool, _compute_batch, metric, chunk)
+                    for chunk in self._chunks(results)
+                ))
+                return [score for output in outputs for score in output]
+
+        if metric.execution == "io":
+            async def run_chunk(chunk):
+                async with semaphore:
+                    return await metric.acompute_batch(chunk)
+
+            outputs = await asyncio.gather(*(run_chunk(chunk) for chunk in self._chunks(results)))
+            return [score for output in outputs for score in output]
+
+        return await asyncio.to_thread(metric.compute_batch, results)
+
+    async def acompute(self, results: List[EvalResult]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        metric name -> per-result scores, in the order of `results`, for
+        every metric that succeeded (failures are in self.errors).
+        """
+        self.errors = {}
+        self.unavailable = {}
+        if not results or not self.metrics:
+            return {metric.name(): [] for metric in self.metrics}
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        outputs = await asyncio.gather(*(
+            self._run_metric(metric, results, semaphore) for metric in self.metrics
+        ))
+        # Only set in this process, so not for metrics run in the process pool
+        self.unavailable = {
+            metric.name(): metric.unavailable
+            for metric in self.metrics
+            if getattr(metric, "unavailable", None)
+        }
+        return {
+            metric.name(): scores
+            for metric, scores in zip(self.metrics, outputs)
+            if scores is not None
+        }
+
+    def compute(self, results: List[EvalResult]) -> Dict[str, List[Dict[str, Any]]]:
+        return asyncio.run(self.acompute(results))
+
+
+def summarize_metric_scores(scores: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per metric, the mean of every numeric field over the results that
+    have it (None values are skipped), plus how many results were scored.
+    """
+    summary = {}
+    for name, per_result in scores.items():
+        totals: Dict[str, List[float]] = {}
+        for score in per_result:
+            for key, value in score.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals.setdefault(key, []).append(value)
+
+        summary[name] = {
+            key: round(sum(values) / len(values), 4)
+            for key, values in totals.items()
+        }
+        summary[name]["num_scored"] = len(per_result)
+    return summary
@@ -0,0 +1,50 @@
+from typing import Callable, Dict, List, Optional
+
+from evaluation.metrics.base import BaseMetric
+from evaluation.metrics.exact_match import ExactMatchMetric
+from evaluation.metrics.rouge import RougeLMetric
+from evaluation.metrics.semantic_similarity import SemanticSimilarityMetric
+from evaluation.metrics.toxicity import ToxicityMetric
+
+METRIC_REGISTRY: Dict[str, Callable[[], BaseMetric]] = {
+    "exact_match": ExactMatchMetric,
+    "rouge_l": RougeLMetric,
+    "semantic_similarity": SemanticSimilarityMetric,
+    "toxicity": ToxicityMetric,
+}
+
+# Metrics computed for each dataset's runs; unknown datasets get DEFAULT_METRICS
+DATASET_METRICS: Dict[str, List[str]] = {
+    "gsm8k": ["exact_match"],
+    "synthetic": ["exact_match"],
+    "truthfulqa": ["exact_match", "rouge_l", "semantic_similarity"],
+    "safety": ["exact_match", "toxicity"],
+}
+
+DEFAULT_METRICS = ["exact_match"]
+
+
+def register_metric(
+    name: str,
+    factory: Callable[[], BaseMetric],
+    datasets: Optional[List[str]] = None,
+) -> None:
+    """
+    Make a metric available by name and, optionally, enable it for
+    the given datasets.
+    """
+    METRIC_REGISTRY[name] = factory
+    for dataset in datasets or []:
+        names = DATASET_METRICS.setdefault(dataset, list(DEFAULT_METRICS))
+        if name not in names:
+            names.append(name)
+
+
+def build_metric(name: str) -> BaseMetric:
+    if name not in METRIC_REGISTRY:
+        raise ValueError(f"Unknown metric: {name}")
+    return METRIC_REGISTRY[name]()
+
+
+def metrics_for_dataset(dataset: str) -> List[BaseMetric]:
+    return [build_metric(name) for name in DATASET_METRICS.get(dataset, DEFAULT_METRICS)]
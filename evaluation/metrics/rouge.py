@@ -0,0 +1,55 @@
+import re
+from typing import Any, Dict, List
+from evaluation.metrics.base import BaseMetric
+from evaluation.results import EvalResult
+
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _lcs_length(a: List[str], b: List[str]) -> int:
+    """
+    Length of the longest common subsequence, O(len(a) * len(b)) time
+    and O(len(b)) memory.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = [0] * (len(b) + 1)
+    for token in a:
+        current = [0]
+        for j, other in enumerate(b):
+            if token == other:
+                current.append(previous[j] + 1)
+            else:
+                current.append(max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+class RougeLMetric(BaseMetric):
+    """
+    ROUGE-L F-measure between the model output and the reference, on
+    lowercased word tokens. Free-text datasets like TruthfulQA.
+    """
+
+    # Quadratic LCS in pure Python: worth a process pool on large runs
+    execution = "cpu"
+
+    def name(self) -> str:
+        return "rouge_l"
+
+    def compute(self, result: EvalResult) -> Dict[str, Any]:
+        if not result.reference:
+            return {"rouge_l": None}
+        if not result.success:
+            return {"rouge_l": 0.0}
+
+        candidate = _TOKEN.findall(result.model_output.lower())
+        reference = _TOKEN.findall(result.reference.lower())
+        lcs = _lcs_length(candidate, reference)
+        if lcs == 0:
+            return {"rouge_l": 0.0}
+
+        precision = lcs / len(candidate)
+        recall = lcs / len(reference)
+        return {"rouge_l": round(2 * precision * recall / (precision + recall), 4)}
@@ -0,0 +1,282 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from eval_datasets.registry import dataset_version
+from evaluation.metrics.base import BaseMetric
+from evaluation.results import EvalResult
+
+
+DEFAULT_EMBEDDING_MODEL = os.getenv("AUTOELAVE_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+DEFAULT_EMBEDDING_CACHE_PATH = os.getenv("AUTOELAVE_EMBEDDING_CACHE", ".cache/embeddings.sqlite")
+DEFAULT_EMBEDDING_BATCH = int(os.getenv("AUTOELAVE_EMBEDDING_BATCH", "64"))
+
+
+def _require_sentence_transformers():
+    try:
+        import sentence_transformers
+    except ImportError as e:
+        raise ImportError(
+            "SemanticSimilarityMetric requires sentence-transformers. "
+            "Install it with `pip install sentence-transformers`."
+        ) from e
+    return sentence_transformers
+
+
+# One copy of each embedding model per process, shared by every run
+_ENCODERS: Dict[str, Any] = {}
+_ENCODERS_LOCK = threading.Lock()
+
+
+def load_encoder(model_name: str):
+    with _ENCODERS_LOCK:
+        if model_name not in _ENCODERS:
+            sentence_transformers = _require_sentence_transformers()
+            _ENCODERS[model_name] = sentence_transformers.SentenceTransformer(model_name)
+        return _ENCODERS[model_name]
+
+
+UNSCORED: Dict[str, Any] = {
+    "similarity_best": None,
+    "similarity_incorrect": None,
+    "similarity_margin": None,
+    "closer_to_correct": None,
+}
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Persistent store for text embeddings, in one SQLite file (WAL mode,
+    safe to share between processes).
+
+    Entries live in a namespace (embedding model + dataset version) and
+    are keyed by a hash of the text, so a new dataset version or model
+    never reuses stale vectors.
+    """
+
+    def __init__(self, path: str = DEFAULT_EMBEDDING_CACHE_PATH):
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, namespace: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE namespace = ? "
+                    f"AND key IN ({','.join('?' * len(chunk))})",
+                    [namespace, *chunk],
+                )
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, namespace: str, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (namespace, key, vector) VALUES (?, ?, ?)",
+                [
+                    (namespace, key, np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in vectors.items()
+                ],
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticSimilarityMetric(BaseMetric):
+    """
+    Embedding similarity between the model output and the reference
+    answers of free-text datasets like TruthfulQA.
+
+    Scores each output against the best answer and against the
+    `incorrect_answers` in the sample metadata (cosine similarity of
+    normalized sentence-transformers embeddings):
+    - similarity_best: similarity to the best answer
+    - similarity_incorrect: highest similarity to an incorrect answer
+    - similarity_margin: similarity_best - similarity_incorrect
+    - closer_to_correct: 1 if the output is nearer the best answer
+
+    Reference embeddings are cached on disk per model and dataset
+    version, so later runs only encode model outputs.
+
+    If the encoder cannot be loaded (sentence-transformers missing, or
+    the model neither cached nor downloadable) every score is None and
+    the reason is kept in `unavailable` (and shown under the metric in
+    the run report); the run goes on without it.
+    """
+
+    # The model batches and multithreads on its own, and loading a copy
+    # of it into every pool process would cost more than it saves
+    execution = "inline"
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        cache_path: Optional[str] = DEFAULT_EMBEDDING_CACHE_PATH,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH,
+        encoder: Any = None,
+    ):
+        self.model_name = model_name
+        self.cache_path = cache_path
+        self.batch_size = batch_size
+        self._encoder = encoder
+        self._cache: Optional[EmbeddingCache] = None
+        self.unavailable: Optional[str] = None
+
+    def name(self) -> str:
+        return "semantic_similarity"
+
+    @property
+    def encoder(self):
+        if self._encoder is None:
+            self._encoder = load_encoder(self.model_name)
+        return self._encoder
+
+    def _try_load_encoder(self) -> bool:
+        # Tried once per metric instance; later batches reuse the outcome
+        if self._encoder is None and self.unavailable is None:
+            try:
+                self._encoder = load_encoder(self.model_name)
+            except Exception as e:
+                self.unavailable = str(e) or type(e).__name__
+                print(f"[METRIC] semantic_similarity not scored, cannot load {self.model_name}: {self.unavailable}")
+        return self._encoder is not None
+
+    @property
+    def cache(self) -> Optional[EmbeddingCache]:
+        if self._cache is None and self.cache_path:
+            self._cache = EmbeddingCache(self.cache_path)
+        return self._cache
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        return np.asarray(
+            self.encoder.encode(
+                texts,
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            ),
+            dtype=np.float32,
+        )
+
+    def _reference_embeddings(self, references: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], np.ndarray]:
+        """
+        (dataset, text) -> embedding, from the cache where possible; the
+        rest are encoded in batches and stored.
+        """
+        by_dataset: Dict[str, Dict[str, str]] = {}
+        for dataset, text in references:
+            by_dataset.setdefault(dataset, {})[text_key(text)] = text
+
+        embeddings = {}
+        for dataset, texts in by_dataset.items():
+            namespace = f"{self.model_name}|{dataset}@{dataset_version(dataset)}"
+            keys = list(texts)
+            found = self.cache.get_many(namespace, keys) if self.cache else {}
+
+            missing = [key for key in keys if key not in found]
+            if missing:
+                encoded = dict(zip(missing, self._encode([texts[key] for key in missing])))
+                if self.cache:
+                    self.cache.put_many(namespace, encoded)
+                found.update(encoded)
+
+            for key, text in texts.items():
+                embeddings[(dataset, text)] = found[key]
+        return embeddings
+
+    def compute(self, result: EvalResult) -> Dict[str, Any]:
+        return self.compute_batch([result])[0]
+
+    def compute_batch(self, results: List[EvalResult]) -> List[Dict[str, Any]]:
+        scored = [i for i, r in enumerate(results) if r.reference and r.success]
+        if scored and not self._try_load_encoder():
+            return [dict(UNSCORED) for _ in results]
+        if scored:
+            references = self._reference_embeddings(
+                (results[i].dataset_name, text)
+                for i in scored
+                for text in (results[i].reference, *_incorrect_answers(results[i]))
+            )
+            outputs = dict(zip(scored, self._encode([results[i].model_output for i in scored])))
+
+        scores = []
+        for i, r in enumerate(results):
+            if not r.reference:
+                scores.append(dict(UNSCORED))
+                continue
+
+            if not r.success:
+                scores.append({
+                    "similarity_best": 0.0,
+                    "similarity_incorrect": None,
+                    "similarity_margin": None,
+                    "closer_to_correct": 0,
+                })
+                continue
+
+            output = outputs[i]
+            best = float(output @ references[(r.dataset_name, r.reference)])
+            incorrect = [
+                float(output @ references[(r.dataset_name, text)]) for text in _incorrect_answers(r)
+            ]
+            worst = max(incorrect) if incorrect else None
+
+            scores.append({
+                "similarity_best": round(best, 4),
+                "similarity_incorrect": round(worst, 4) if worst is not None else None,
+                "similarity_margin": round(best - worst, 4) if worst is not None else None,
+                "closer_to_correct": int(best > worst) if worst is not None else None,
+            })
+        return scores
+
+
+def _incorrect_answers(result: EvalResult) -> List[str]:
+    return [text for text in (result.metadata or {}).get("incorrect_answers") or [] if text]
@@ -1,30 +1,254 @@
-from typing import List
-from evaluation.runner import run_single_evaluation
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from evaluation.runner import (
+    run_single_evaluation,
+    arun_single_evaluation,
+    run_batch_evaluation,
+    arun_batch_evaluation,
+)
+from evaluation.batching import make_batches
 from evaluation.results import EvalResult
+from evaluation.judges.agreement import JudgeAgreement
 from eval_datasets.schemas import EvalSample
 from models.llm_clients.base import BaseLLM
 
 
+def _resolve_workers(llm: BaseLLM, max_workers: int, num_samples: int) -> int:
+    """
+    Clamp the requested worker count to the client's own concurrency
+    limit (if it declares one) and to the number of samples.
+    """
+    workers = max(1, max_workers)
+
+    client_limit: Optional[int] = getattr(llm, "max_concurrency", None)
+    if client_limit:
+        workers = min(workers, client_limit)
+
+    return max(1, min(workers, num_samples))
+
+
+def _batch_fan_out(llm: Optional[BaseLLM], batch_size: int) -> int:
+    """
+    Requests one micro-batch call can have in flight: one for a client
+    that batches natively, otherwise one per prompt up to the client's
+    own max_concurrency.
+    """
+    if llm is not None and llm.supports_batching:
+        return 1
+    client_limit: Optional[int] = getattr(llm, "max_concurrency", None)
+    return min(batch_size, client_limit) if client_limit else batch_size
+
+
+def _resolve_batch_workers(llm: BaseLLM, max_workers: int, num_batches: int, batch_size: int) -> int:
+    """
+    Number of micro-batches to keep in flight, so that the requests they
+    send together stay within llm.max_concurrency.
+
+    Without native batching each batch fans out into single calls, so a
+    limited client gets max_concurrency // fan-out batches at a time.
+    """
+    workers = _resolve_workers(llm, max_workers, num_batches)
+    if llm.max_concurrency:
+        workers = min(workers, max(1, llm.max_concurrency // _batch_fan_out(llm, batch_size)))
+    return workers
+
+
 def evaluate_dataset(
     samples: List[EvalSample],
     llm: BaseLLM,
     dataset_name: str,
     max_samples: int = None,
+    max_workers: int = 1,
+    on_result: Optional[Callable[[EvalResult], None]] = None,
+    batch_size: int = 1,
+    max_batch_tokens: Optional[int] = None,
 ) -> List[EvalResult]:
     """
     Runs evaluation over a list of EvalSamples.
-    """
-    results: List[EvalResult] = []
 
+    With max_workers > 1, samples are sent to the model concurrently
+    (bounded by max_workers and llm.max_concurrency). Results are always
+    returned in the same order as the input samples.
+
+    With batch_size > 1, samples are grouped into micro-batches of at
+    most batch_size samples (and max_batch_tokens estimated prompt
+    tokens) and each batch is one llm.generate_batch call; max_workers
+    then bounds the number of batches in flight (also clamped to
+    llm.max_concurrency).
+
+    on_result, if given, is called with each EvalResult as soon as it
+    finishes (completion order, not input order).
+    """
     if max_samples:
         samples = samples[:max_samples]
 
-    for sample in samples:
+    if not samples:
+        return []
+
+    if batch_size > 1:
+        return _evaluate_batches(
+            samples, llm, dataset_name, max_workers, on_result, batch_size, max_batch_tokens
+        )
+
+    workers = _resolve_workers(llm, max_workers, len(samples))
+
+    def _run(sample: EvalSample) -> EvalResult:
         result = run_single_evaluation(
             sample=sample,
             llm=llm,
             dataset_name=dataset_name,
         )
-        results.append(result)
+        if on_result:
+            on_result(result)
+        return result
+
+    # Sequential path (default)
+    if workers == 1:
+        return [_run(sample) for sample in samples]
+
+    # Concurrent path: executor.map preserves input order
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run, samples))
+
+
+def _evaluate_batches(
+    samples: List[EvalSample],
+    llm: BaseLLM,
+    dataset_name: str,
+    max_workers: int,
+    on_result: Optional[Callable[[EvalResult], None]],
+    batch_size: int,
+    max_batch_tokens: Optional[int],
+) -> List[EvalResult]:
+    batches = list(make_batches(samples, batch_size, max_batch_tokens, text=lambda s: s.prompt))
+    workers = _resolve_batch_workers(llm, max_workers, len(batches), batch_size)
+
+    def _run(batch: List[EvalSample]) -> List[EvalResult]:
+        results = run_batch_evaluation(batch, llm, dataset_name)
+        if on_result:
+            for result in results:
+                on_result(result)
+        return results
+
+    if workers == 1:
+        return [result for batch in batches for result in _run(batch)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [result for results in executor.map(_run, batches) for result in results]
+
+
+async def aevaluate_dataset(
+    samples: List[EvalSample],
+    llm: BaseLLM,
+    dataset_name: str,
+    max_samples: int = None,
+    max_concurrency: int = 16,
+    on_result: Optional[Callable[[EvalResult], None]] = None,
+    batch_size: int = 1,
+    max_batch_tokens: Optional[int] = None,
+) -> List[EvalResult]:
+    """
+    Async version of evaluate_dataset().
+
+    All requests run on the current event loop; a semaphore bounds the
+    number in flight (also clamped to llm.max_concurrency). Results are
+    returned in input order. on_result, batch_size and max_batch_tokens
+    behave as in evaluate_dataset().
+    """
+    if max_samples:
+        samples = samples[:max_samples]
+
+    if not samples:
+        return []
+
+    if batch_size > 1:
+        batches = list(make_batches(samples, batch_size, max_batch_tokens, text=lambda s: s.prompt))
+        batch_semaphore = asyncio.Semaphore(
+            _resolve_batch_workers(llm, max_concurrency, len(batches), batch_size)
+        )
+
+        async def _run_batch(batch: List[EvalSample]) -> List[EvalResult]:
+            async with batch_semaphore:
+                results = await arun_batch_evaluation(batch, llm, dataset_name)
+            if on_result:
+                for result in results:
+                    on_result(result)
+            return results
+
+        batched = await asyncio.gather(*(_run_batch(batch) for batch in batches))
+        return [result for results in batched for result in results]
+
+    semaphore = asyncio.Semaphore(_resolve_workers(llm, max_concurrency, len(samples)))
+
+    async def _run(sample: EvalSample) -> EvalResult:
+        async with semaphore:
+            result = await arun_single_evaluation(
+                sample=sample,
+                llm=llm,
+                dataset_name=dataset_name,
+            )
+        if on_result:
+            on_result(result)
+        return result
+
+    return await asyncio.gather(*(_run(sample) for sample in samples))
+
+
+async def ajudge_dataset(
+    results: List[EvalResult],
+    agreement: JudgeAgreement,
+    max_concurrency: int = 16,
+    on_judgment: Optional[Callable[[EvalResult, Dict[str, Any]], None]] = None,
+    batch_size: int = 1,
+    max_batch_tokens: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run judge agreement over all results on the current event loop.
+
+    Judges for one result and judges across results all run concurrently,
+    sharing a budget of max_concurrency in-flight judge calls. on_judgment,
+    if given, is called as each result's agreement completes.
+
+    With batch_size > 1, results are grouped into micro-batches (bounded
+    by batch_size and max_batch_tokens over prompt plus model output) and
+    each judge scores a whole batch per call. max_concurrency still caps
+    single judge requests: a judge whose client fans a batch out into
+    one request per result takes batches of at most max_concurrency,
+    and fewer batch calls run at once.
+    """
+    if not results:
+        return []
+
+    if batch_size > 1:
+        limit = max(1, max_concurrency)
+        judge_llms = [getattr(judge, "judge_llm", None) for judge in agreement.judges]
+        if any(_batch_fan_out(judge_llm, batch_size) > 1 for judge_llm in judge_llms):
+            batch_size = min(batch_size, limit)
+        batches = list(make_batches(
+            results, batch_size, max_batch_tokens, text=lambda r: r.prompt + r.model_output
+        ))
+        fan_out = max(_batch_fan_out(judge_llm, batch_size) for judge_llm in judge_llms)
+        batch_semaphore = asyncio.Semaphore(max(1, limit // fan_out))
+
+        async def _judge_batch(batch: List[EvalResult]) -> List[Dict[str, Any]]:
+            judgments = await agreement.aevaluate_batch(batch, batch_semaphore)
+            if on_judgment:
+                for result, judgment in zip(batch, judgments):
+                    on_judgment(result, judgment)
+            return judgments
+
+        batched = await asyncio.gather(*(_judge_batch(batch) for batch in batches))
+        return [judgment for judgments in batched for judgment in judgments]
+
+    if on_judgment is None:
+        return await agreement.aevaluate_many(results, max_concurrency=max_concurrency)
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _judge(result: EvalResult) -> Dict[str, Any]:
+        judgment = await agreement.aevaluate(result, semaphore)
+        on_judgment(result, judgment)
+        return judgment
 
-    return results
+    return list(await asyncio.gather(*(_judge(result) for result in results)))
@@ -0,0 +1,113 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from evaluation.results import EvalResult
+
+
+class ProgressTracker:
+    """
+    Tracks live progress of one evaluation run and publishes snapshots.
+
+    Snapshots include per-stage sample counts, running exact-match
+    accuracy, judge coverage and throughput. publish() is called at
+    most once every min_interval seconds (plus on every stage change),
+    so it is cheap enough to call after every sample.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        publish: Callable[[Dict[str, Any]], None],
+        min_interval: float = 0.5,
+    ):
+        self.total = total
+        self.publish = publish
+        self.min_interval = min_interval
+
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._last_publish = 0.0
+
+        self.stage = "queued"
+        self._stage_started: Dict[str, float] = {}
+        self.inferred = 0
+        self.failed = 0
+        self.exact_match_hits = 0
+        self.exact_match_scored = 0
+        self.judged = 0
+        self.judge_successes = 0
+
+    # -------------------------------
+    # Recording
+    # -------------------------------
+    def set_stage(self, stage: str) -> None:
+        with self._lock:
+            self.stage = stage
+            self._stage_started.setdefault(stage, time.monotonic())
+        self._maybe_publish(force=True)
+
+    def record_result(self, result: EvalResult, exact_match: Optional[Dict[str, Any]] = None) -> None:
+        with self._lock:
+            self.inferred += 1
+            if not result.success:
+                self.failed += 1
+            if exact_match and exact_match.get("exact_match") is not None:
+                self.exact_match_scored += 1
+                self.exact_match_hits += exact_match["exact_match"]
+        self._maybe_publish()
+
+    def record_judgment(self, judgment: Dict[str, Any]) -> None:
+        with self._lock:
+            self.judged += 1
+            if judgment.get("agreement_success"):
+                self.judge_successes += 1
+        self._maybe_publish()
+
+    # -------------------------------
+    # Snapshots
+    # -------------------------------
+    def _rate(self, stage: str, count: int, now: float) -> Optional[float]:
+        started = self._stage_started.get(stage)
+        if started is None or now <= started:
+            return None
+        return round(count / (now - started), 3)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._start
+            done = self.inferred + self.judged
+            work = self.total * 2
+
+            return {
+                "stage": self.stage,
+                "total_samples": self.total,
+                "inferred": self.inferred,
+                "judged": self.judged,
+                "model_failures": self.failed,
+                "running_accuracy": (
+                    round(self.exact_match_hits / self.exact_match_scored, 3)
+                    if self.exact_match_scored
+                    else None
+                ),
+                "judge_coverage": (
+                    round(self.judge_successes / self.judged, 3) if self.judged else None
+                ),
+                "elapsed_seconds": round(elapsed, 2),
+                "inference_per_second": self._rate("inference", self.inferred, now),
+                "judging_per_second": self._rate("judging", self.judged, now),
+                "percent_complete": round(100 * done / work, 1) if work else 100.0,
+                "updated_at": time.time(),
+            }
+
+    def _maybe_publish(self, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_publish < self.min_interval:
+                return
+            self._last_publish = now
+        self.publish(self.snapshot())
+
+    def flush(self) -> None:
+        self._maybe_publish(force=True)
@@ -17,6 +17,7 @@ class EvalResult:
 
     # NEW (Phase-4 Part-2)
     reference: Optional[str] = None
+    category: Optional[str] = None
 
     error: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
@@ -1,45 +1,124 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from evaluation.results import EvalResult
 from eval_datasets.schemas import EvalSample
 from models.llm_clients.base import BaseLLM
 
 
-def run_single_evaluation(
+def _build_result(
     sample: EvalSample,
     llm: BaseLLM,
     dataset_name: str,
-    model_name: Optional[str] = None,
+    model_name: Optional[str],
+    response: Optional[Dict[str, Any]] = None,
+    error: Optional[Exception] = None,
 ) -> EvalResult:
     """
-    Runs evaluation for a single EvalSample on a given LLM.
+    Build an EvalResult from either a successful response or an error.
     """
-    try:
-        response = llm.generate_with_metadata(sample.prompt)
-
-        return EvalResult(
-            sample_id=sample.id,
-            prompt=sample.prompt,
-            model_output=response["output"],
-            latency=response["latency"],
-            model_name=model_name or llm.__class__.__name__,
-            dataset_name=dataset_name,
-            success=True,
-            reference=sample.reference,   # 🔥 KEY LINE
-            metadata=sample.metadata,
-        )
+    if error is None and response is not None and "error" in response:
+        error = response["error"]
 
-
-    except Exception as e:
+    if error is not None:
         return EvalResult(
             sample_id=sample.id,
             prompt=sample.prompt,
             model_output="",
             latency=0.0,
-            model_name=model_name or llm.__class__.__name__,
+            model_name=model_name or llm.name(),
             dataset_name=dataset_name,
             success=False,
             reference=sample.reference,
-            error=str(e),
+            category=sample.category,
+            error=str(error),
             metadata=sample.metadata,
         )
 
+    return EvalResult(
+        sample_id=sample.id,
+        prompt=sample.prompt,
+        model_output=response["output"],
+        latency=response["latency"],
+        model_name=model_name or llm.name(),
+        dataset_name=dataset_name,
+        success=True,
+        reference=sample.reference,   # 🔥 KEY LINE
+        category=sample.category,
+        metadata=sample.metadata,
+    )
+
+
+def run_single_evaluation(
+    sample: EvalSample,
+    llm: BaseLLM,
+    dataset_name: str,
+    model_name: Optional[str] = None,
+) -> EvalResult:
+    """
+    Runs evaluation for a single EvalSample on a given LLM.
+    """
+    try:
+        response = llm.generate_with_metadata(sample.prompt)
+    except Exception as e:
+        return _build_result(sample, llm, dataset_name, model_name, error=e)
+
+    return _build_result(sample, llm, dataset_name, model_name, response=response)
+
+
+async def arun_single_evaluation(
+    sample: EvalSample,
+    llm: BaseLLM,
+    dataset_name: str,
+    model_name: Optional[str] = None,
+) -> EvalResult:
+    """
+    Async version of run_single_evaluation().
+    """
+    try:
+        response = await llm.agenerate_with_metadata(sample.prompt)
+    except Exception as e:
+        return _build_result(sample, llm, dataset_name, model_name, error=e)
+
+    return _build_result(sample, llm, dataset_name, model_name, response=response)
+
+
+def run_batch_evaluation(
+    samples: List[EvalSample],
+    llm: BaseLLM,
+    dataset_name: str,
+    model_name: Optional[str] = None,
+) -> List[EvalResult]:
+    """
+    Evaluate a micro-batch of samples with one generate_batch call.
+
+    Each EvalResult gets its own latency and error; results are in
+    input order.
+    """
+    try:
+        responses = llm.generate_batch_with_metadata([s.prompt for s in samples])
+    except Exception as e:
+        return [_build_result(s, llm, dataset_name, model_name, error=e) for s in samples]
+
+    return [
+        _build_result(s, llm, dataset_name, model_name, response=response)
+        for s, response in zip(samples, responses)
+    ]
+
+
+async def arun_batch_evaluation(
+    samples: List[EvalSample],
+    llm: BaseLLM,
+    dataset_name: str,
+    model_name: Optional[str] = None,
+) -> List[EvalResult]:
+    """
+    Async version of run_batch_evaluation().
+    """
+    try:
+        responses = await llm.agenerate_batch_with_metadata([s.prompt for s in samples])
+    except Exception as e:
+        return [_build_result(s, llm, dataset_name, model_name, error=e) for s in samples]
+
+    return [
+        _build_result(s, llm, dataset_name, model_name, response=response)
+        for s, response in zip(samples, responses)
+    ]
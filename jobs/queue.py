@@ -0,0 +1,262 @@
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+import sqlalchemy as sa
+
+
+DEFAULT_QUEUE_URL = os.getenv("AUTOELAVE_JOB_QUEUE", "sqlite:///.autoelave/jobs.db")
+DEFAULT_MAX_QUEUED = int(os.getenv("AUTOELAVE_MAX_QUEUED_JOBS", "100"))
+# A running job whose worker has not sent a heartbeat for this long is
+# considered lost (worker crashed, was killed or terminated)
+DEFAULT_LEASE_SECONDS = float(os.getenv("AUTOELAVE_JOB_LEASE_S", "60"))
+
+JOB_STATUSES = ("queued", "running", "completed", "failed", "cancelled")
+
+
+class QueueFullError(Exception):
+    """
+    Raised when enqueueing would exceed the queue's max_queued bound.
+    """
+    pass
+
+
+class JobQueue:
+    """
+    Bounded, priority-ordered job queue stored in SQLite (WAL mode).
+
+    Workers in other processes claim jobs atomically with claim(); higher
+    priority first, then oldest first. Cancellation of a running job is
+    cooperative: cancel() sets a flag the worker polls between samples.
+
+    A claim is a lease: the worker renews it with heartbeat() while the
+    job runs, and recover_stale() fails running jobs whose lease expired,
+    so a crashed worker never leaves a job "running" forever.
+    """
+
+    def __init__(self, url: str = DEFAULT_QUEUE_URL, max_queued: int = DEFAULT_MAX_QUEUED):
+        if url.startswith("sqlite:///"):
+            directory = os.path.dirname(url[len("sqlite:///"):])
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.url = url
+        self.max_queued = max_queued
+        self.engine = sa.create_engine(url, connect_args={"timeout": 30})
+
+        @sa.event.listens_for(self.engine, "connect")
+        def _set_pragmas(dbapi_connection, _record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+
+        metadata = sa.MetaData()
+        self.jobs = sa.Table(
+            "jobs",
+            metadata,
+            sa.Column("job_id", sa.String, primary_key=True),
+            sa.Column("run_id", sa.String, nullable=False, index=True),
+            sa.Column("payload", sa.JSON, nullable=False),
+            sa.Column("priority", sa.Integer, nullable=False, default=0),
+            sa.Column("status", sa.String, nullable=False),
+            sa.Column("cancel_requested", sa.Boolean, nullable=False, default=False),
+            sa.Column("worker_id", sa.String),
+            sa.Column("error", sa.Text),
+            sa.Column("created_at", sa.Float, nullable=False),
+            sa.Column("started_at", sa.Float),
+            sa.Column("finished_at", sa.Float),
+            sa.Column("heartbeat_at", sa.Float),
+            sa.Index("ix_jobs_status_priority", "status", "priority", "created_at"),
+        )
+        metadata.create_all(self.engine)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self) -> None:
+        """
+        Minimal forward migration for queues created by older versions.
+        """
+        existing = {c["name"] for c in sa.inspect(self.engine).get_columns("jobs")}
+        with self.engine.begin() as conn:
+            for column in self.jobs.columns:
+                if column.name not in existing:
+                    conn.execute(sa.text(
+                        f"ALTER TABLE jobs ADD COLUMN {column.name} "
+                        f"{column.type.compile(dialect=self.engine.dialect)}"
+                    ))
+
+    def _row_to_job(self, row) -> Dict[str, Any]:
+        return dict(row._mapping)
+
+    # -------------------------------
+    # Producer side
+    # -------------------------------
+    def enqueue(self, run_id: str, payload: Dict[str, Any], priority: int = 0) -> str:
+        job_id = f"job-{uuid.uuid4().hex[:8]}"
+
+        with self.engine.begin() as conn:
+            if self.max_queued and self._count(conn, "queued") >= self.max_queued:
+                raise QueueFullError(f"Job queue is full ({self.max_queued} queued jobs)")
+
+            conn.execute(
+                sa.insert(self.jobs).values(
+                    job_id=job_id,
+                    run_id=run_id,
+                    payload=payload,
+                    priority=priority,
+                    status="queued",
+                    cancel_requested=False,
+                    created_at=time.time(),
+                )
+            )
+
+        return job_id
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job: queued jobs are cancelled immediately, running jobs
+        are flagged and stop at the next checkpoint. Returns the job.
+        """
+        with self.engine.begin() as conn:
+            conn.execute(
+                sa.update(self.jobs)
+                .where(self.jobs.c.job_id == job_id, self.jobs.c.status == "queued")
+                .values(status="cancelled", cancel_requested=True, finished_at=time.time())
+            )
+            conn.execute(
+                sa.update(self.jobs)
+                .where(self.jobs.c.job_id == job_id, self.jobs.c.status == "running")
+                .values(cancel_requested=True)
+            )
+        return self.get(job_id)
+
+    # -------------------------------
+    # Worker side
+    # -------------------------------
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically take the next queued job, or return None.
+        """
+        while True:
+            now = time.time()
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    sa.select(self.jobs.c.job_id)
+                    .where(self.jobs.c.status == "queued")
+                    .order_by(self.jobs.c.priority.desc(), self.jobs.c.created_at)
+                    .limit(1)
+                ).first()
+
+                if row is None:
+                    return None
+
+                claimed = conn.execute(
+                    sa.update(self.jobs)
+                    .where(self.jobs.c.job_id == row.job_id, self.jobs.c.status == "queued")
+                    .values(status="running", worker_id=worker_id, started_at=now, heartbeat_at=now)
+                ).rowcount
+
+            # Another worker won the race for this job; try the next one
+            if claimed:
+                return self.get(row.job_id)
+
+    def heartbeat(self, job_id: str) -> None:
+        """
+        Renew the lease on a running job.
+        """
+        with self.engine.begin() as conn:
+            conn.execute(
+                sa.update(self.jobs)
+                .where(self.jobs.c.job_id == job_id, self.jobs.c.status == "running")
+                .values(heartbeat_at=time.time())
+            )
+
+    def recover_stale(self, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> List[Dict[str, Any]]:
+        """
+        Fail running jobs with no heartbeat for lease_seconds. Returns them.
+        """
+        cutoff = time.time() - lease_seconds
+        return self._fail_running(
+            sa.func.coalesce(self.jobs.c.heartbeat_at, self.jobs.c.started_at) < cutoff,
+            error=f"Worker lost (no heartbeat for {lease_seconds:g}s)",
+        )
+
+    def release_worker(self, worker_id: str, error: str) -> List[Dict[str, Any]]:
+        """
+        Fail the running jobs of a worker known to be gone. Returns them.
+        """
+        return self._fail_running(self.jobs.c.worker_id == worker_id, error=error)
+
+    def _fail_running(self, condition, error: str) -> List[Dict[str, Any]]:
+        with self.engine.begin() as conn:
+            job_ids = [
+                row.job_id
+                for row in conn.execute(
+                    sa.select(self.jobs.c.job_id).where(self.jobs.c.status == "running", condition)
+                )
+            ]
+            if job_ids:
+                conn.execute(
+                    sa.update(self.jobs)
+                    .where(self.jobs.c.job_id.in_(job_ids), self.jobs.c.status == "running")
+                    .values(status="failed", error=error, finished_at=time.time())
+                )
+        return [self.get(job_id) for job_id in job_ids]
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        with self.engine.connect() as conn:
+            return bool(conn.execute(
+                sa.select(self.jobs.c.cancel_requested).where(self.jobs.c.job_id == job_id)
+            ).scalar())
+
+    def finish(self, job_id: str, status: str, error: Optional[str] = None) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                sa.update(self.jobs)
+                .where(self.jobs.c.job_id == job_id)
+                .values(status=status, error=error, finished_at=time.time())
+            )
+
+    # -------------------------------
+    # Introspection
+    # -------------------------------
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                sa.select(self.jobs).where(self.jobs.c.job_id == job_id)
+            ).first()
+        return self._row_to_job(row) if row else None
+
+    def active_job_for_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        The queued or running job for a run, if any.
+        """
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                sa.select(self.jobs)
+                .where(self.jobs.c.run_id == run_id, self.jobs.c.status.in_(("queued", "running")))
+                .order_by(self.jobs.c.created_at.desc())
+                .limit(1)
+            ).first()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        query = sa.select(self.jobs).order_by(self.jobs.c.created_at.desc()).limit(limit)
+        if status is not None:
+            query = query.where(self.jobs.c.status == status)
+
+        with self.engine.connect() as conn:
+            return [self._row_to_job(row) for row in conn.execute(query)]
+
+    def _count(self, conn, status: str) -> int:
+        return conn.execute(
+            sa.select(sa.func.count()).select_from(self.jobs).where(self.jobs.c.status == status)
+        ).scalar()
+
+    def depth(self) -> Dict[str, int]:
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                sa.select(self.jobs.c.status, sa.func.count()).group_by(self.jobs.c.status)
+            )
+            counts = {status: count for status, count in rows}
+        return {status: counts.get(status, 0) for status in JOB_STATUSES}
@@ -0,0 +1,228 @@
+import argparse
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from jobs.queue import DEFAULT_LEASE_SECONDS, DEFAULT_QUEUE_URL, JobQueue
+
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def fail_lost_runs(queue: JobQueue, jobs: List[Dict[str, Any]]) -> None:
+    """
+    Mark the runs of jobs whose worker was lost as failed, so they can
+    be resumed (their run logs are intact). Runs that were requeued in
+    the meantime are left alone.
+    """
+    from api.routes._store import RUN_STORE
+
+    for job in jobs:
+        run = RUN_STORE.get_run(job["run_id"])
+        if run and run["status"] in ("queued", "running") and not queue.active_job_for_run(job["run_id"]):
+            RUN_STORE.update_run(job["run_id"], status="failed", error=job["error"])
+        print(f"[JOBS] {job['job_id']} (run {job['run_id']}) failed: {job['error']}")
+
+
+def run_job(queue: JobQueue, job, queue_lease_seconds: float = DEFAULT_LEASE_SECONDS) -> str:
+    """
+    Execute one claimed evaluation job and record its final status.
+    """
+    # Imported here so the pipeline (and its LLM SDKs) is only loaded
+    # inside worker processes.
+    from api.metrics import record_run_finished
+    from api.pipeline import run_evaluation_background
+    from api.routes._store import RUN_STORE
+
+    payload = job["payload"]
+    job_id = job["job_id"]
+
+    # Renew the job's lease while it runs
+    done = threading.Event()
+
+    def heartbeat():
+        while not done.wait(queue_lease_seconds / 4):
+            queue.heartbeat(job_id)
+
+    threading.Thread(target=heartbeat, name=f"heartbeat-{job_id}", daemon=True).start()
+
+    try:
+        status = asyncio.run(
+            run_evaluation_background(
+                job["run_id"],
+                payload["dataset"],
+                payload["model_name"],
+                max_workers=payload.get("max_workers", 4),
+                use_cache=payload.get("use_cache", False),
+                resume=payload.get("resume", False),
+                max_samples=payload.get("max_samples", 10),
+                batch_size=payload.get("batch_size", 1),
+                incremental=payload.get("incremental", False),
+                cascade=payload.get("cascade", False),
+                should_cancel=lambda: queue.is_cancel_requested(job_id),
+                queue_wait_seconds=job["started_at"] - job["created_at"],
+            )
+        )
+    except Exception as e:
+        queue.finish(job_id, "failed", error=str(e))
+        record_run_finished("failed")
+        return "failed"
+    finally:
+        done.set()
+
+    record_run_finished(status)
+    run = RUN_STORE.get_run(job["run_id"])
+    queue.finish(job_id, status, error=run["error"] if run and status != "completed" else None)
+    return status
+
+
+def run_worker(
+    queue_url: str = DEFAULT_QUEUE_URL,
+    worker_id: Optional[str] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    stop_event=None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    num_workers: int = 1,
+) -> None:
+    """
+    Worker loop: claim the next job, run it, repeat until stop_event is set
+    or the process that started the worker has died.
+
+    On start and then every lease_seconds / 2, jobs left running by a
+    lost worker are failed (and their runs made resumable).
+
+    num_workers is how many workers run on this host; each one's pool for
+    CPU-bound metrics gets its share of the CPUs and is shut down on exit.
+    """
+    from evaluation.metrics.pipeline import share_process_pool_cpus, shutdown_process_pool
+
+    worker_id = worker_id or f"worker-{os.getpid()}"
+    queue = JobQueue(queue_url)
+    parent = multiprocessing.parent_process()
+    share_process_pool_cpus(num_workers)
+    print(f"[JOBS] {worker_id} started")
+    last_recovery = 0.0
+
+    try:
+        while stop_event is None or not stop_event.is_set():
+            # Workers are not daemonic, so they must notice a killed API themselves
+            if parent is not None and not parent.is_alive():
+                print(f"[JOBS] {worker_id} parent process exited")
+                break
+
+            if time.monotonic() - last_recovery >= lease_seconds / 2:
+                fail_lost_runs(queue, queue.recover_stale(lease_seconds))
+                last_recovery = time.monotonic()
+
+            job = queue.claim(worker_id)
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+
+            print(f"[JOBS] {worker_id} running {job['job_id']} (run {job['run_id']})")
+            status = run_job(queue, job, lease_seconds)
+            print(f"[JOBS] {worker_id} finished {job['job_id']}: {status}")
+    finally:
+        shutdown_process_pool()
+
+    print(f"[JOBS] {worker_id} stopped")
+
+
+class WorkerPool:
+    """
+    Pool of separate worker processes pulling from one JobQueue.
+
+    Each process runs one job at a time, so num_workers also caps how
+    many evaluations run concurrently.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        queue_url: str = DEFAULT_QUEUE_URL,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.num_workers = num_workers
+        self.queue_url = queue_url
+        self.poll_interval = poll_interval
+
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._processes: List[multiprocessing.Process] = []
+        # Unique per pool, so release_worker() never touches another host's jobs
+        self._worker_ids: List[str] = []
+
+    def start(self) -> None:
+        for i in range(self.num_workers):
+            worker_id = f"worker-{i}-{uuid.uuid4().hex[:6]}"
+            process = self._context.Process(
+                target=run_worker,
+                kwargs={
+                    "queue_url": self.queue_url,
+                    "worker_id": worker_id,
+                    "poll_interval": self.poll_interval,
+                    "stop_event": self._stop_event,
+                    "num_workers": self.num_workers,
+                },
+                # Not daemonic: workers own a process pool for CPU-bound
+                # metrics, which daemonic processes may not create. They
+                # are stopped explicitly instead, at the latest on exit,
+                # and exit on their own if this process is killed.
+                daemon=False,
+            )
+            process.start()
+            self._processes.append(process)
+            self._worker_ids.append(worker_id)
+        atexit.register(self.stop)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Ask workers to exit after their current job; terminate stragglers.
+        """
+        self._stop_event.set()
+        for worker_id, process in zip(self._worker_ids, self._processes):
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                # Its job will never finish; fail it now rather than
+                # when its lease runs out
+                queue = JobQueue(self.queue_url)
+                try:
+                    fail_lost_runs(queue, queue.release_worker(worker_id, "Worker terminated on shutdown"))
+                finally:
+                    queue.engine.dispose()
+        self._processes = []
+        self._worker_ids = []
+
+    def alive(self) -> int:
+        return sum(1 for p in self._processes if p.is_alive())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run AutoElave evaluation workers.")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-url", default=DEFAULT_QUEUE_URL)
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL)
+    args = parser.parse_args()
+
+    if args.workers == 1:
+        run_worker(args.queue_url, poll_interval=args.poll_interval)
+        return
+
+    pool = WorkerPool(args.workers, args.queue_url, args.poll_interval)
+    pool.start()
+    try:
+        while pool.alive():
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    main()
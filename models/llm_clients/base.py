@@ -1,7 +1,12 @@
 # autoElave/models/llm_clients/base.py
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .usage import UsageMeter
 
 class BaseLLM(ABC):
     """
@@ -9,6 +14,23 @@ class BaseLLM(ABC):
     All LLM implementations (Gemini, OpenAI, local) should inherit from this.
     """
 
+    # Maximum number of in-flight requests this client tolerates.
+    # None means "no client-side limit"; orchestrators clamp to this.
+    max_concurrency: Optional[int] = None
+
+    # True if generate_batch() sends all prompts in one request (or one
+    # forward pass). Otherwise it falls back to concurrent single calls.
+    supports_batching: bool = False
+
+    # Token / retry accounting, for clients whose provider reports usage
+    usage: Optional[UsageMeter] = None
+
+    def name(self) -> str:
+        """
+        Client name recorded on EvalResults.
+        """
+        return self.__class__.__name__
+
     @abstractmethod
     def generate(self, prompt: str, **kwargs) -> str:
         """
@@ -27,11 +49,122 @@ class BaseLLM(ABC):
         """
         Optional: Return additional metadata like latency, token usage, etc.
         """
-        import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         output = self.generate(prompt, **kwargs)
-        latency = time.time() - start_time
+        latency = time.perf_counter() - start_time
+        return {
+            "output": output,
+            "latency": latency
+        }
+
+    # -------------------------------
+    # ASYNC API
+    # -------------------------------
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        """
+        Async counterpart of generate().
+
+        Default implementation offloads the blocking generate() call to a
+        worker thread so legacy clients work unchanged. Clients with a
+        native async SDK should override this.
+        """
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
+
+    async def agenerate_with_metadata(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Async counterpart of generate_with_metadata().
+        """
+        start_time = time.perf_counter()
+        output = await self.agenerate(prompt, **kwargs)
+        latency = time.perf_counter() - start_time
         return {
             "output": output,
             "latency": latency
         }
+
+    # -------------------------------
+    # BATCH API
+    # -------------------------------
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate one response per prompt, in input order.
+
+        Clients whose provider or model accepts several prompts at once
+        must override this and set supports_batching = True. The default
+        sends concurrent single generate() calls (bounded by
+        max_concurrency) and raises the first error.
+        """
+        outputs = []
+        for response in self.generate_batch_with_metadata(prompts, **kwargs):
+            if "error" in response:
+                raise response["error"]
+            outputs.append(response["output"])
+        return outputs
+
+    def generate_batch_with_metadata(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Batch counterpart of generate_with_metadata().
+
+        Returns one dict per prompt with "output" and "latency", or
+        "error" (the exception) and "latency" if that prompt failed, so
+        one bad prompt never fails the rest of the batch.
+
+        For native batches, latency is the batch wall time split evenly
+        across its prompts, and "batch_size" is included.
+        """
+        if not prompts:
+            return []
+
+        if not self.supports_batching:
+            workers = min(len(prompts), self.max_concurrency or len(prompts))
+            if workers == 1:
+                return [self._timed_single(prompt, **kwargs) for prompt in prompts]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(lambda p: self._timed_single(p, **kwargs), prompts))
+
+        start_time = time.perf_counter()
+        try:
+            outputs = self.generate_batch(prompts, **kwargs)
+        except Exception:
+            # Retry one by one so a single bad prompt is isolated
+            return [self._timed_single(prompt, **kwargs) for prompt in prompts]
+        latency = (time.perf_counter() - start_time) / len(prompts)
+
+        return [
+            {"output": output, "latency": latency, "batch_size": len(prompts)}
+            for output in outputs
+        ]
+
+    async def agenerate_batch_with_metadata(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of generate_batch_with_metadata().
+
+        Without native batching, prompts are sent concurrently through
+        agenerate() on the current event loop.
+        """
+        if not prompts:
+            return []
+
+        if self.supports_batching:
+            return await asyncio.to_thread(self.generate_batch_with_metadata, prompts, **kwargs)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(prompts))
+
+        async def _call(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    output = await self.agenerate(prompt, **kwargs)
+                except Exception as e:
+                    return {"error": e, "latency": time.perf_counter() - start_time}
+                return {"output": output, "latency": time.perf_counter() - start_time}
+
+        return list(await asyncio.gather(*(_call(prompt) for prompt in prompts)))
+
+    def _timed_single(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        try:
+            output = self.generate(prompt, **kwargs)
+        except Exception as e:
+            return {"error": e, "latency": time.perf_counter() - start_time}
+        return {"output": output, "latency": time.perf_counter() - start_time}
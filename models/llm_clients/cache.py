@@ -0,0 +1,281 @@
+# autoElave/models/llm_clients/cache.py
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import BaseLLM
+
+
+DEFAULT_CACHE_PATH = os.getenv("AUTOELAVE_CACHE_PATH", ".cache/llm_responses.sqlite")
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Cache hits write their last_access in bulk, every this many hits
+TOUCH_FLUSH_EVERY = 256
+
+
+class ResponseCache:
+    """
+    Persistent, content-addressed store for LLM responses.
+
+    Backed by a single SQLite file (WAL mode, safe to share between
+    processes). When the stored payload grows past max_bytes, the least
+    recently used entries are evicted.
+
+    Hits do not write: their last_access is kept in memory and flushed
+    in bulk (every TOUCH_FLUSH_EVERY hits, on put and on close), so a
+    warm cache costs one indexed read per lookup.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)"
+        )
+        self._conn.commit()
+
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+        # key -> last access time not yet written
+        self._touched: Dict[str, float] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, config: Dict[str, Any]) -> str:
+        """
+        Hash of model identity, prompt and generation config.
+        """
+        payload = json.dumps(
+            {"model": model, "prompt": prompt, "config": config},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_FLUSH_EVERY:
+                self._flush_touched()
+                self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+
+        with self._lock:
+            self._flush_touched()
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+            self._conn.commit()
+
+    def _flush_touched(self) -> None:
+        """
+        Write the deferred last_access updates. Caller must hold the lock
+        and commit.
+        """
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """
+        Drop least recently used entries until the store is back under
+        90% of max_bytes. Caller must hold the lock.
+        """
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        )
+
+        evicted = []
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "size_bytes": self._total_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+class CachedLLM(BaseLLM):
+    """
+    Opt-in caching wrapper around any BaseLLM.
+
+    Identical (model, prompt, generation config) requests are served from
+    the ResponseCache instead of calling the wrapped client. Use a
+    distinct namespace for clients that must not share answers, e.g.
+    several judges backed by the same model.
+    """
+
+    def __init__(self, llm: BaseLLM, cache: ResponseCache, namespace: str = ""):
+        self.llm = llm
+        self.cache = cache
+        self.namespace = namespace
+        self.max_concurrency = llm.max_concurrency
+        self.supports_batching = llm.supports_batching
+        # Cache hits cost nothing, so usage and throttling are the wrapped client's
+        self.usage = llm.usage
+        self.rate_limiter = getattr(llm, "rate_limiter", None)
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def name(self) -> str:
+        return self.llm.name()
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.llm, "model_name", self.llm.__class__.__name__)
+
+    def _key(self, prompt: str, **kwargs) -> str:
+        model = f"{self.namespace}:{self.model_name}" if self.namespace else self.model_name
+        return self.cache.make_key(model, prompt, kwargs)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        cached = self.cache.get(key)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return cached
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        key = self._key(prompt, **kwargs)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        output = self.llm.generate(prompt, **kwargs)
+        self.cache.put(key, output)
+        return output
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        # SQLite calls run in threads so the event loop never waits on disk
+        key = self._key(prompt, **kwargs)
+
+        cached = await asyncio.to_thread(self._lookup, key)
+        if cached is not None:
+            return cached
+
+        output = await self.llm.agenerate(prompt, **kwargs)
+        await asyncio.to_thread(self.cache.put, key, output)
+        return output
+
+    def _split_batch(self, prompts: List[str], **kwargs) -> Tuple[List[str], List[Optional[Dict[str, Any]]], List[int]]:
+        """
+        Serve what we can from the cache; return keys, the partial
+        responses and the indices that still need the wrapped client.
+        """
+        keys = [self._key(prompt, **kwargs) for prompt in prompts]
+        responses: List[Optional[Dict[str, Any]]] = []
+        misses = []
+
+        for i, key in enumerate(keys):
+            start_time = time.time()
+            cached = self._lookup(key)
+            if cached is None:
+                misses.append(i)
+                responses.append(None)
+            else:
+                responses.append({"output": cached, "latency": time.time() - start_time})
+
+        return keys, responses, misses
+
+    def _merge_batch(self, keys, responses, misses, fetched) -> List[Dict[str, Any]]:
+        for i, response in zip(misses, fetched):
+            if "error" not in response:
+                self.cache.put(keys[i], response["output"])
+            responses[i] = response
+        return responses
+
+    def generate_batch_with_metadata(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        keys, responses, misses = self._split_batch(prompts, **kwargs)
+        fetched = self.llm.generate_batch_with_metadata([prompts[i] for i in misses], **kwargs)
+        return self._merge_batch(keys, responses, misses, fetched)
+
+    async def agenerate_batch_with_metadata(self, prompts: List[str], **kwargs) -> List[Dict[str, Any]]:
+        keys, responses, misses = await asyncio.to_thread(self._split_batch, prompts, **kwargs)
+        fetched = await self.llm.agenerate_batch_with_metadata([prompts[i] for i in misses], **kwargs)
+        return await asyncio.to_thread(self._merge_batch, keys, responses, misses, fetched)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
@@ -1,11 +1,14 @@
 # autoElave/models/llm_clients/gemini.py
 
+import asyncio
 import os
 import time
 from dotenv import load_dotenv
 import google.generativeai as genai
 from google.api_core.exceptions import ResourceExhausted
 from .base import BaseLLM
+from .rate_limit import RateLimiter, get_shared_limiter
+from .usage import UsageMeter
 
 # Load environment variables
 load_dotenv()
@@ -15,14 +18,20 @@ class GeminiLLM(BaseLLM):
     """
     Gemini LLM client with quota-safe defaults, retry logic,
     and robust response text extraction.
+
+    All instances for the same model share one process-wide RateLimiter
+    (requests/tokens per minute from GEMINI_RPM / GEMINI_TPM) unless an
+    explicit rate_limiter is passed.
     """
 
     def __init__(
         self,
         api_key: str = None,
         model: str = "models/gemini-flash-latest",
-        max_retries: int = 3,
+        max_retries: int = 6,
         retry_delay: float = 2.0,
+        max_concurrency: int = 4,
+        rate_limiter: RateLimiter = None,
     ):
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
 
@@ -38,6 +47,15 @@ class GeminiLLM(BaseLLM):
 
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_concurrency = max_concurrency
+        self.usage = UsageMeter()
+
+        tokens_per_minute = os.getenv("GEMINI_TPM")
+        self.rate_limiter = rate_limiter or get_shared_limiter(
+            f"gemini:{self.model_name}",
+            requests_per_minute=float(os.getenv("GEMINI_RPM", "60")),
+            tokens_per_minute=float(tokens_per_minute) if tokens_per_minute else None,
+        )
 
     # -------------------------------
     # INTERNAL: Safe text extraction
@@ -72,31 +90,80 @@ class GeminiLLM(BaseLLM):
             "(possibly due to safety filtering or empty response)."
         )
 
+    def _generation_config(self, **kwargs) -> dict:
+        return {
+            "temperature": kwargs.get("temperature", 0.7),
+            "max_output_tokens": kwargs.get("max_tokens", 256),
+        }
+
+    def _record_usage(self, response, retries: int) -> None:
+        """
+        Count billed tokens from the response's usage_metadata.
+        """
+        usage = getattr(response, "usage_metadata", None)
+        self.usage.record(
+            input_tokens=getattr(usage, "prompt_token_count", 0) or 0,
+            output_tokens=getattr(usage, "candidates_token_count", 0) or 0,
+            retries=retries,
+        )
+
+    def _estimate_tokens(self, prompt: str, **kwargs) -> int:
+        """
+        Rough token budget for a request (~4 chars/token plus the
+        output allowance), used only for tokens-per-minute limiting.
+        """
+        return len(prompt) // 4 + kwargs.get("max_tokens", 256)
+
     # -------------------------------
     # PUBLIC: Generate text
     # -------------------------------
     def generate(self, prompt: str, **kwargs) -> str:
         """
-        Generate text from Gemini with retry on quota exhaustion.
+        Generate text from Gemini with rate limiting and jittered
+        exponential backoff on quota exhaustion.
         """
         for attempt in range(self.max_retries):
+            self.rate_limiter.acquire(self._estimate_tokens(prompt, **kwargs))
             try:
                 response = self.model.generate_content(
                     prompt,
-                    generation_config={
-                        "temperature": kwargs.get("temperature", 0.7),
-                        "max_output_tokens": kwargs.get("max_tokens", 256),
-                    },
+                    generation_config=self._generation_config(**kwargs),
                 )
+                self.rate_limiter.record_success()
+                self._record_usage(response, retries=attempt)
 
                 return self._extract_text(response)
 
             except ResourceExhausted as e:
                 # Quota / rate limit hit
+                self.rate_limiter.record_throttle()
                 if attempt == self.max_retries - 1:
                     raise e
-                time.sleep(self.retry_delay)
+                time.sleep(self.rate_limiter.backoff_delay(attempt, base=self.retry_delay))
 
             except Exception:
                 # Let Phase-3 handle failures cleanly
                 raise
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        """
+        Native async generation: awaits the Gemini SDK directly instead of
+        blocking a worker thread per call.
+        """
+        for attempt in range(self.max_retries):
+            await self.rate_limiter.aacquire(self._estimate_tokens(prompt, **kwargs))
+            try:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=self._generation_config(**kwargs),
+                )
+                self.rate_limiter.record_success()
+                self._record_usage(response, retries=attempt)
+
+                return self._extract_text(response)
+
+            except ResourceExhausted as e:
+                self.rate_limiter.record_throttle()
+                if attempt == self.max_retries - 1:
+                    raise e
+                await asyncio.sleep(self.rate_limiter.backoff_delay(attempt, base=self.retry_delay))
@@ -0,0 +1,343 @@
+# autoElave/models/llm_clients/hf_local.py
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import BaseLLM
+
+
+DEFAULT_HF_MODEL = os.getenv("AUTOELAVE_HF_MODEL", "HuggingFaceTB/SmolLM2-135M-Instruct")
+DEFAULT_MAX_BATCH_SIZE = int(os.getenv("AUTOELAVE_HF_MAX_BATCH", "8"))
+DEFAULT_MAX_WAIT_MS = float(os.getenv("AUTOELAVE_HF_MAX_WAIT_MS", "20"))
+
+
+def _require_transformers():
+    try:
+        import torch
+        import transformers
+    except ImportError as e:
+        raise ImportError(
+            "LocalHFLLM requires torch and transformers. "
+            "Install them with `pip install torch transformers accelerate`."
+        ) from e
+    return torch, transformers
+
+
+# =========================
+# Dynamic batching scheduler
+# =========================
+class _Request:
+    __slots__ = ("input_ids", "config", "future")
+
+    def __init__(self, input_ids: List[int], config: Tuple[int, float]):
+        self.input_ids = input_ids
+        self.config = config
+        self.future: Future = Future()
+
+
+class BatchScheduler:
+    """
+    Collects prompts from any number of threads and runs them through
+    one model in padded batches on a single background thread.
+
+    A batch starts as soon as max_batch_size requests are queued or the
+    oldest request has waited max_wait_ms. Requests are packed by token
+    length: the batch is the window of similar-length prompts around the
+    oldest request, which keeps padding low without starving anyone.
+    Only requests with the same generation config share a batch, and
+    identical greedy prompts within a batch are generated once.
+    """
+
+    def __init__(self, model, tokenizer, max_batch_size: int = 8, max_wait_ms: float = 20.0):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: List[_Request] = []
+        self._cond = threading.Condition()
+
+        # Fast tokenizers must not be used from several threads at once
+        self.tokenizer_lock = threading.Lock()
+
+        self.batches = 0
+        self.requests = 0
+        self.deduplicated = 0
+        self.prompt_tokens = 0
+        self.padded_tokens = 0
+
+        self._thread = threading.Thread(target=self._loop, name="hf-batch-scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, input_ids: List[int], config: Tuple[int, float]) -> Future:
+        request = _Request(input_ids, config)
+        with self._cond:
+            self._queue.append(request)
+            self._cond.notify()
+        return request.future
+
+    # -------------------------------
+    # Packing
+    # -------------------------------
+    def _next_batch(self) -> List[_Request]:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            deadline = time.monotonic() + self.max_wait
+            while len(self._queue) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            oldest = self._queue[0]
+            candidates = sorted(
+                (r for r in self._queue if r.config == oldest.config),
+                key=lambda r: len(r.input_ids),
+            )
+
+            k = self.max_batch_size
+            if len(candidates) <= k:
+                batch = candidates
+            else:
+                # Tightest length window of k requests that contains the oldest
+                anchor = candidates.index(oldest)
+                lengths = [len(r.input_ids) for r in candidates]
+                start = min(
+                    range(max(0, anchor - k + 1), min(anchor, len(candidates) - k) + 1),
+                    key=lambda i: lengths[i + k - 1] - lengths[i],
+                )
+                batch = candidates[start:start + k]
+
+            chosen = set(map(id, batch))
+            self._queue = [r for r in self._queue if id(r) not in chosen]
+            return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                outputs = self._generate(batch)
+            except Exception as e:
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            for request, output in zip(batch, outputs):
+                request.future.set_result(output)
+
+    # -------------------------------
+    # Generation
+    # -------------------------------
+    def _rows(self, batch: List[_Request]) -> Tuple[List[List[int]], List[int]]:
+        """
+        The sequences to generate for a batch, and the row of each
+        request's output.
+
+        Identical prompts (e.g. several judges on one model) run once,
+        but only under greedy decoding: sampled requests must each get
+        their own draw.
+        """
+        if batch[0].config[1] > 0:
+            return [request.input_ids for request in batch], list(range(len(batch)))
+
+        unique: Dict[Tuple[int, ...], int] = {}
+        rows = [unique.setdefault(tuple(request.input_ids), len(unique)) for request in batch]
+        return [list(ids) for ids in unique], rows
+
+    def _generate(self, batch: List[_Request]) -> List[str]:
+        torch, _ = _require_transformers()
+
+        sequences, rows = self._rows(batch)
+
+        max_new_tokens, temperature = batch[0].config
+        with self.tokenizer_lock:
+            inputs = self.tokenizer.pad(
+                {"input_ids": sequences}, padding=True, return_tensors="pt"
+            ).to(self.model.device)
+
+        sampling = {"do_sample": True, "temperature": temperature} if temperature > 0 else {"do_sample": False}
+        with torch.inference_mode():
+            generated = self.model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                pad_token_id=self.tokenizer.pad_token_id,
+                use_cache=True,
+                **sampling,
+            )
+
+        prompt_width = inputs["input_ids"].shape[1]
+        with self.tokenizer_lock:
+            texts = self.tokenizer.batch_decode(generated[:, prompt_width:], skip_special_tokens=True)
+
+        self.batches += 1
+        self.requests += len(batch)
+        self.deduplicated += len(batch) - len(sequences)
+        self.prompt_tokens += sum(len(s) for s in sequences)
+        self.padded_tokens += prompt_width * len(sequences)
+
+        return [texts[row].strip() for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cumulative counters since the model was loaded.
+        """
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "deduplicated": self.deduplicated,
+            "prompt_tokens": self.prompt_tokens,
+            "padded_tokens": self.padded_tokens,
+        }
+
+
+def batching_summary(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Per-run batching report from two BatchScheduler.stats() snapshots.
+    """
+    delta = {key: value - before.get(key, 0) for key, value in after.items()}
+    return {
+        "batches": delta["batches"],
+        "requests": delta["requests"],
+        "avg_batch_size": round(delta["requests"] / delta["batches"], 2) if delta["batches"] else None,
+        "deduplicated": delta["deduplicated"],
+        "padding_ratio": (
+            round(1 - delta["prompt_tokens"] / delta["padded_tokens"], 3)
+            if delta["padded_tokens"]
+            else None
+        ),
+    }
+
+
+# =========================
+# Shared weights
+# =========================
+_LOADED: Dict[Tuple[str, str, Optional[str]], Tuple[Any, Any, BatchScheduler]] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def load_shared_model(
+    model_id: str,
+    device: str = "cpu",
+    torch_dtype: Optional[str] = None,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+) -> Tuple[Any, Any, BatchScheduler]:
+    """
+    Load (model, tokenizer, scheduler) once per process and return the
+    same objects to every caller, so evaluator and judge clients on the
+    same model share weights and batch together.
+    """
+    key = (model_id, device, torch_dtype)
+
+    with _LOADED_LOCK:
+        if key not in _LOADED:
+            torch, transformers = _require_transformers()
+
+            threads = os.getenv("AUTOELAVE_TORCH_THREADS")
+            if threads:
+                torch.set_num_threads(int(threads))
+
+            tokenizer = transformers.AutoTokenizer.from_pretrained(model_id)
+            tokenizer.padding_side = "left"
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+
+            model = transformers.AutoModelForCausalLM.from_pretrained(
+                model_id,
+                torch_dtype=getattr(torch, torch_dtype) if torch_dtype else None,
+            ).to(device)
+            model.eval()
+
+            _LOADED[key] = (model, tokenizer, BatchScheduler(model, tokenizer, max_batch_size, max_wait_ms))
+
+        return _LOADED[key]
+
+
+# =========================
+# Client
+# =========================
+class LocalHFLLM(BaseLLM):
+    """
+    Local causal LM via HuggingFace transformers; no network or quota.
+
+    All clients for the same model_id share one copy of the weights and
+    one BatchScheduler, so concurrent generate() calls from the
+    evaluator, judges and orchestrator threads are packed into padded
+    batches. Decoding uses the KV cache (use_cache=True). Greedy decoding
+    (temperature=0) is the default, which keeps regression runs
+    reproducible.
+
+    HF_HUB_OFFLINE=1 makes transformers load from the local cache only.
+    """
+
+    supports_batching = True
+
+    def __init__(
+        self,
+        model: str = DEFAULT_HF_MODEL,
+        device: str = "cpu",
+        torch_dtype: Optional[str] = None,
+        max_new_tokens: int = 256,
+        temperature: float = 0.0,
+        max_input_tokens: int = 2048,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        use_chat_template: bool = True,
+    ):
+        self.model_name = model
+        self.max_new_tokens = max_new_tokens
+        self.temperature = temperature
+        self.max_input_tokens = max_input_tokens
+        self.use_chat_template = use_chat_template
+
+        # Enough in-flight requests to fill two batches
+        self.max_concurrency = max_batch_size * 2
+
+        self.model, self.tokenizer, self.scheduler = load_shared_model(
+            model, device, torch_dtype, max_batch_size, max_wait_ms
+        )
+
+    def _encode(self, prompt: str) -> List[int]:
+        with self.scheduler.tokenizer_lock:
+            if self.use_chat_template and getattr(self.tokenizer, "chat_template", None):
+                input_ids = self.tokenizer.apply_chat_template(
+                    [{"role": "user", "content": prompt}],
+                    add_generation_prompt=True,
+                    tokenize=True,
+                )
+            else:
+                input_ids = self.tokenizer(prompt)["input_ids"]
+
+        # Keep the end of over-long prompts (where the question is)
+        return list(input_ids[-self.max_input_tokens:])
+
+    def _submit(self, prompt: str, **kwargs) -> Future:
+        config = (
+            kwargs.get("max_tokens", self.max_new_tokens),
+            float(kwargs.get("temperature", self.temperature)),
+        )
+        return self.scheduler.submit(self._encode(prompt), config)
+
+    # -------------------------------
+    # PUBLIC: Generate text
+    # -------------------------------
+    def generate(self, prompt: str, **kwargs) -> str:
+        return self._submit(prompt, **kwargs).result()
+
+    def generate_batch(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Queue all prompts at once so the scheduler can pack them by length.
+        """
+        futures = [self._submit(prompt, **kwargs) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        return await asyncio.wrap_future(self._submit(prompt, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.scheduler.stats()
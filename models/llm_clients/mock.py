@@ -0,0 +1,285 @@
+# autoElave/models/llm_clients/mock.py
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+from .base import BaseLLM
+from .rate_limit import RateLimiter, get_shared_limiter
+from .usage import UsageMeter
+
+
+class MockThrottled(Exception):
+    """
+    Injected rate-limit error (the mock's equivalent of an HTTP 429).
+    """
+    pass
+
+
+class MockLLM(BaseLLM):
+    """
+    Deterministic stand-in for a hosted LLM, for benchmarks and tests.
+
+    Every response is derived from a hash of (seed, prompt, attempt), so
+    a run is reproducible regardless of concurrency:
+
+    - "What is a + b?" questions are answered correctly with probability
+      `accuracy`, otherwise off by a small amount.
+    - Judge prompts (LLMJudge's "impartial evaluator" template) get a JSON
+      {"score", "explanation"} reply: high when the model answer's final
+      number matches the ground truth, low otherwise.
+    - Anything else gets a short deterministic text.
+
+    Latency follows latency_distribution ("fixed", "uniform",
+    "exponential" or "lognormal") with mean `latency` seconds. Requests
+    fail with error_rate and are throttled with throttle_rate, or when
+    more than quota_rpm requests arrive within a minute. Throttled
+    requests are retried with the rate_limiter's backoff, as in
+    GeminiLLM; without a rate_limiter MockThrottled is raised.
+
+    With `url`, requests go to a mock HTTP server
+    (benchmarks/mock_server.py) instead of being simulated in-process.
+    """
+
+    def __init__(
+        self,
+        model: str = "mock",
+        latency: float = 0.0,
+        latency_distribution: str = "fixed",
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        quota_rpm: Optional[float] = None,
+        accuracy: float = 0.8,
+        seed: int = 0,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 6,
+        retry_delay: float = 0.05,
+        url: Optional[str] = None,
+    ):
+        if latency_distribution not in ("fixed", "uniform", "exponential", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {latency_distribution}")
+
+        self.model_name = model
+        self.latency = latency
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.quota_rpm = quota_rpm
+        self.accuracy = accuracy
+        self.seed = seed
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.url = url
+
+        self.usage = UsageMeter()
+
+        self._lock = threading.Lock()
+        self._recent: deque = deque()
+        self.calls = 0
+        self.throttles = 0
+        self.errors = 0
+
+    @classmethod
+    def from_spec(cls, spec: str = "", **kwargs) -> "MockLLM":
+        """
+        Build from a "key=value,key=value" string, e.g. the part after
+        "mock:" in a run's model name ("latency=0.05,error_rate=0.01").
+
+        rpm=N attaches a process-wide RateLimiter shared by every mock
+        client with the same spec, like GEMINI_RPM does for Gemini.
+        """
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            key, _, value = item.partition("=")
+            try:
+                kwargs[key] = int(value) if key in ("seed", "max_concurrency", "max_retries") else float(value)
+            except ValueError:
+                kwargs[key] = value
+
+        rpm = kwargs.pop("rpm", None)
+        if rpm:
+            kwargs["rate_limiter"] = get_shared_limiter(f"mock:{spec}", requests_per_minute=rpm)
+        return cls(**kwargs)
+
+    # -------------------------------
+    # Deterministic behaviour
+    # -------------------------------
+    def _rng(self, prompt: str, attempt: int) -> random.Random:
+        digest = hashlib.sha256(f"{self.seed}|{attempt}|{prompt}".encode()).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _sample_latency(self, rng: random.Random) -> float:
+        mean = self.latency
+        if mean <= 0 or self.latency_distribution == "fixed":
+            return max(0.0, mean)
+        if self.latency_distribution == "uniform":
+            return rng.uniform(0, 2 * mean)
+        if self.latency_distribution == "exponential":
+            return rng.expovariate(1 / mean)
+        sigma = 0.5
+        return rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+
+    def _over_quota(self) -> bool:
+        if not self.quota_rpm:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0] > 60:
+                self._recent.popleft()
+            if len(self._recent) >= self.quota_rpm:
+                return True
+            self._recent.append(now)
+        return False
+
+    def plan(self, prompt: str, attempt: int = 0) -> Tuple[float, Optional[Exception], str]:
+        """
+        Decide (latency, error or None, output) for one request.
+        """
+        rng = self._rng(prompt, attempt)
+        latency = self._sample_latency(rng)
+
+        with self._lock:
+            self.calls += 1
+
+        if rng.random() < self.throttle_rate or self._over_quota():
+            with self._lock:
+                self.throttles += 1
+            return latency, MockThrottled("429: mock rate limit exceeded"), ""
+
+        if rng.random() < self.error_rate:
+            with self._lock:
+                self.errors += 1
+            return latency, RuntimeError("Mock model error"), ""
+
+        return latency, None, self._respond(prompt, rng)
+
+    def _respond(self, prompt: str, rng: random.Random) -> str:
+        if "impartial evaluator" in prompt:
+            return self._judge_reply(prompt, rng)
+
+        question = re.search(r"What is (-?\d+) \+ (-?\d+)\?", prompt)
+        if question:
+            answer = int(question.group(1)) + int(question.group(2))
+            if rng.random() >= self.accuracy:
+                answer += rng.choice((-1, 1)) * rng.randint(1, 10)
+            return f"Adding the numbers gives {answer}, so the answer is {answer}"
+
+        return f"Mock response {rng.randint(0, 9999)}."
+
+    def _judge_reply(self, prompt: str, rng: random.Random) -> str:
+        gold = re.search(r"Ground Truth Answer:\s*(.*?)\s*Model Answer:", prompt, re.S)
+        answer = re.search(r"Model Answer:\s*(.*?)\s*Evaluate the model's answer", prompt, re.S)
+
+        def last_number(text: Optional[str]) -> Optional[str]:
+            numbers = re.findall(r"-?\d+\.?\d*", text or "")
+            return numbers[-1] if numbers else None
+
+        correct = (
+            gold is not None and answer is not None
+            and last_number(gold.group(1)) is not None
+            and last_number(gold.group(1)) == last_number(answer.group(1))
+        )
+        score = rng.choice((4, 5, 5)) if correct else rng.choice((1, 2, 2, 3))
+        return json.dumps({
+            "score": score,
+            "explanation": "Final answer matches the reference." if correct
+            else "Final answer does not match the reference.",
+        })
+
+    # -------------------------------
+    # Transport
+    # -------------------------------
+    def _call_http(self, prompt: str, attempt: int) -> str:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"prompt": prompt, "attempt": attempt}).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                return json.loads(response.read())["output"]
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                raise MockThrottled(f"429 from {self.url}") from e
+            raise RuntimeError(f"Mock server error {e.code}") from e
+
+    def _call_local(self, prompt: str, attempt: int) -> str:
+        latency, error, output = self.plan(prompt, attempt)
+        time.sleep(latency)
+        if error:
+            raise error
+        return output
+
+    async def _acall_local(self, prompt: str, attempt: int) -> str:
+        latency, error, output = self.plan(prompt, attempt)
+        await asyncio.sleep(latency)
+        if error:
+            raise error
+        return output
+
+    def _record_usage(self, prompt: str, output: str, retries: int) -> None:
+        # ~4 characters per token, like a provider's usage metadata
+        self.usage.record(
+            input_tokens=len(prompt) // 4 + 1,
+            output_tokens=len(output) // 4 + 1,
+            retries=retries,
+        )
+
+    # -------------------------------
+    # PUBLIC: Generate text
+    # -------------------------------
+    def generate(self, prompt: str, **kwargs) -> str:
+        for attempt in range(self.max_retries):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                if self.url:
+                    output = self._call_http(prompt, attempt)
+                else:
+                    output = self._call_local(prompt, attempt)
+                if self.rate_limiter:
+                    self.rate_limiter.record_success()
+                self._record_usage(prompt, output, retries=attempt)
+                return output
+
+            except MockThrottled:
+                if self.rate_limiter:
+                    self.rate_limiter.record_throttle()
+                if not self.rate_limiter or attempt == self.max_retries - 1:
+                    raise
+                time.sleep(self.rate_limiter.backoff_delay(attempt, base=self.retry_delay))
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        if self.url:
+            return await asyncio.to_thread(self.generate, prompt, **kwargs)
+
+        for attempt in range(self.max_retries):
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire()
+            try:
+                output = await self._acall_local(prompt, attempt)
+                if self.rate_limiter:
+                    self.rate_limiter.record_success()
+                self._record_usage(prompt, output, retries=attempt)
+                return output
+
+            except MockThrottled:
+                if self.rate_limiter:
+                    self.rate_limiter.record_throttle()
+                if not self.rate_limiter or attempt == self.max_retries - 1:
+                    raise
+                await asyncio.sleep(self.rate_limiter.backoff_delay(attempt, base=self.retry_delay))
+
+    def stats(self) -> Dict[str, Any]:
+        return {"calls": self.calls, "throttles": self.throttles, "errors": self.errors}
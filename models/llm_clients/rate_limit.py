@@ -0,0 +1,231 @@
+# autoElave/models/llm_clients/rate_limit.py
+
+import asyncio
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+
+class LimiterUsage:
+    """
+    Rate-limiter counters of one run, across every limiter its calls go
+    through. Limiters are shared by concurrent runs, so their own stats()
+    are process-wide; a run gets its share by activating a LimiterUsage
+    with track_limiter_usage() in its task.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.throttles = 0
+        self.throttle_wait_seconds = 0.0
+        self.backoff_wait_seconds = 0.0
+
+    def add(self, **counts: float) -> None:
+        with self._lock:
+            for key, value in counts.items():
+                setattr(self, key, getattr(self, key) + value)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttles": self.throttles,
+                "throttle_wait_seconds": round(self.throttle_wait_seconds, 3),
+                "backoff_wait_seconds": round(self.backoff_wait_seconds, 3),
+            }
+
+
+# Copied into the tasks and to_thread() calls a run starts
+_LIMITER_USAGE: ContextVar[Optional[LimiterUsage]] = ContextVar("limiter_usage", default=None)
+
+
+def track_limiter_usage() -> LimiterUsage:
+    """
+    Count limiter activity of the current task (and everything it starts
+    from now on) into a new LimiterUsage.
+    """
+    usage = LimiterUsage()
+    _LIMITER_USAGE.set(usage)
+    return usage
+
+
+def _record_usage(**counts: float) -> None:
+    usage = _LIMITER_USAGE.get()
+    if usage is not None:
+        usage.add(**counts)
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for requests/minute and (optionally) tokens/minute,
+    with AIMD adaptation to 429 responses.
+
+    - Every call reserves one request (and its estimated tokens) and waits
+      until the bucket can cover it. Reservations are handed out in order,
+      so concurrent callers are spread out instead of firing in lockstep.
+    - record_throttle() halves the effective rate (down to min_rate_factor);
+      record_success() slowly restores it.
+    - backoff_delay() returns a full-jitter exponential backoff.
+
+    Safe to share between threads and asyncio tasks.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        tokens_per_minute: Optional[float] = None,
+        burst_seconds: float = 1.0,
+        min_rate_factor: float = 0.1,
+        recovery_step: float = 0.02,
+        max_backoff: float = 60.0,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.burst_seconds = burst_seconds
+        self.min_rate_factor = min_rate_factor
+        self.recovery_step = recovery_step
+        self.max_backoff = max_backoff
+
+        self._lock = threading.Lock()
+        self._rate_factor = 1.0
+        self._last_refill = time.monotonic()
+        self._request_tokens = self._capacity(requests_per_minute)
+        self._token_tokens = self._capacity(tokens_per_minute) if tokens_per_minute else 0.0
+
+        # Metrics
+        self.requests = 0
+        self.throttles = 0
+        self.throttle_wait_seconds = 0.0
+        self.backoff_wait_seconds = 0.0
+
+    # -------------------------------
+    # INTERNAL: Bucket bookkeeping
+    # -------------------------------
+    def _rate_per_second(self, per_minute: float) -> float:
+        return per_minute * self._rate_factor / 60.0
+
+    def _capacity(self, per_minute: float) -> float:
+        return max(1.0, self._rate_per_second(per_minute) * self.burst_seconds)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        self._request_tokens = min(
+            self._capacity(self.requests_per_minute),
+            self._request_tokens + elapsed * self._rate_per_second(self.requests_per_minute),
+        )
+        if self.tokens_per_minute:
+            self._token_tokens = min(
+                self._capacity(self.tokens_per_minute),
+                self._token_tokens + elapsed * self._rate_per_second(self.tokens_per_minute),
+            )
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Take one request (and `tokens` tokens) from the buckets, letting
+        them go negative, and return how long the caller must wait.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.requests += 1
+
+            self._request_tokens -= 1
+            wait = max(0.0, -self._request_tokens / self._rate_per_second(self.requests_per_minute))
+
+            if self.tokens_per_minute:
+                # A single request larger than the bucket must still pass
+                self._token_tokens -= min(tokens, self._capacity(self.tokens_per_minute))
+                wait = max(wait, -self._token_tokens / self._rate_per_second(self.tokens_per_minute))
+
+            self.throttle_wait_seconds += wait
+        _record_usage(requests=1, throttle_wait_seconds=wait)
+        return wait
+
+    # -------------------------------
+    # PUBLIC: Acquire / feedback
+    # -------------------------------
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Block until a request may be sent. Returns the time waited.
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """
+        Async version of acquire().
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._rate_factor = min(1.0, self._rate_factor + self.recovery_step)
+
+    def record_throttle(self) -> None:
+        """
+        Called on a 429 / quota error: halve the effective rate.
+        """
+        with self._lock:
+            self.throttles += 1
+            self._rate_factor = max(self.min_rate_factor, self._rate_factor / 2)
+        _record_usage(throttles=1)
+
+    def backoff_delay(self, attempt: int, base: float = 1.0) -> float:
+        """
+        Full-jitter exponential backoff for the given retry attempt.
+        """
+        delay = random.uniform(0, min(self.max_backoff, base * (2 ** attempt)))
+        with self._lock:
+            self.backoff_wait_seconds += delay
+        _record_usage(backoff_wait_seconds=delay)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttles": self.throttles,
+                "throttle_wait_seconds": round(self.throttle_wait_seconds, 3),
+                "backoff_wait_seconds": round(self.backoff_wait_seconds, 3),
+                "effective_requests_per_minute": round(
+                    self.requests_per_minute * self._rate_factor, 2
+                ),
+            }
+
+
+_SHARED_LIMITERS: Dict[str, RateLimiter] = {}
+_SHARED_LIMITERS_LOCK = threading.Lock()
+
+
+def get_shared_limiter(key: str, **config) -> RateLimiter:
+    """
+    Return the process-wide limiter for `key`, creating it on first use.
+    Config is only applied when the limiter is created.
+    """
+    with _SHARED_LIMITERS_LOCK:
+        if key not in _SHARED_LIMITERS:
+            _SHARED_LIMITERS[key] = RateLimiter(**config)
+        return _SHARED_LIMITERS[key]
+
+
+def stats_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Difference between two stats() snapshots, for per-run reporting.
+    Gauges (effective rate) are taken from `after`.
+    """
+    delta = {}
+    for key, value in after.items():
+        if key.startswith("effective_"):
+            delta[key] = value
+        else:
+            delta[key] = round(value - before.get(key, 0), 3)
+    return delta
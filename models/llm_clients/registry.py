@@ -0,0 +1,33 @@
+# autoElave/models/llm_clients/registry.py
+
+from .base import BaseLLM
+
+
+def build_llm(model_name: str = "", **kwargs) -> BaseLLM:
+    """
+    Build an LLM client from a run's model name.
+
+    - "hf:<model id>"     -> LocalHFLLM (local transformers, shared weights)
+    - "gemini:<model id>" -> GeminiLLM for that Gemini model
+    - "mock" / "mock:<spec>" -> MockLLM (see MockLLM.from_spec)
+    - anything else       -> GeminiLLM with its default model (the name is
+                             only a label recorded on the run)
+
+    Clients are imported lazily so Gemini-only deployments never import
+    torch, and local-only ones never need a Gemini key.
+    """
+    provider, _, model = model_name.partition(":")
+
+    if provider == "mock":
+        from .mock import MockLLM
+        return MockLLM.from_spec(model, **kwargs)
+
+    if provider == "hf" and model:
+        from .hf_local import LocalHFLLM
+        return LocalHFLLM(model=model, **kwargs)
+
+    from .gemini import GeminiLLM
+
+    if provider == "gemini" and model:
+        return GeminiLLM(model=model, **kwargs)
+    return GeminiLLM(**kwargs)
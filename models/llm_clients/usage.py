@@ -0,0 +1,70 @@
+# autoElave/models/llm_clients/usage.py
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+# USD per 1M (input, output) tokens, from the providers' public list
+# prices; check them before relying on the numbers. Override for any
+# model with AUTOELAVE_PRICE_PER_MTOK="<input>,<output>".
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "models/gemini-flash-latest": (0.30, 2.50),
+    "models/gemini-2.5-flash": (0.30, 2.50),
+    "models/gemini-2.5-pro": (1.25, 10.00),
+}
+
+
+class UsageMeter:
+    """
+    Thread-safe per-client counters: requests, input/output tokens (as
+    reported by the provider) and retries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.retries = 0
+
+    def record(self, input_tokens: int = 0, output_tokens: int = 0, retries: int = 0) -> None:
+        with self._lock:
+            self.requests += 1
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            self.retries += retries
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "retries": self.retries,
+            }
+
+
+def model_price(model_name: str) -> Optional[Tuple[float, float]]:
+    override = os.getenv("AUTOELAVE_PRICE_PER_MTOK")
+    if override:
+        input_price, output_price = (float(p) for p in override.split(","))
+        return input_price, output_price
+    return MODEL_PRICES.get(model_name)
+
+
+def estimate_cost(model_name: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+    """
+    Cost in USD for a token count, or None if the model has no known price.
+    """
+    price = model_price(model_name)
+    if price is None:
+        return None
+    return round((input_tokens * price[0] + output_tokens * price[1]) / 1_000_000, 6)
+
+
+def usage_with_cost(model_name: str, usage: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **usage,
+        "cost_usd": estimate_cost(model_name, usage["input_tokens"], usage["output_tokens"]),
+    }
@@ -0,0 +1,96 @@
+import random
+import statistics
+
+import numpy as np
+
+from evaluation.aggregation.report import aggregate_dataset_report, bootstrap_mean_ci
+from evaluation.columnar import ResultTable
+from evaluation.results import EvalResult
+
+
+def _run(n, seed=0):
+    rng = random.Random(seed)
+    results, exact, judges = [], [], []
+
+    for i in range(n):
+        success = rng.random() > 0.1
+        results.append(EvalResult(
+            sample_id=f"s_{i}", prompt="q", model_output="a" if success else "",
+            model_name="m", dataset_name="d", latency=0.0, success=success,
+            category=rng.choice(["reasoning", "safety", None]),
+        ))
+        exact.append({"exact_match": rng.choice([0, 1, None]) if success else 0})
+
+        if rng.random() < 0.9:
+            scores = [rng.randint(0, 5) for _ in range(3)]
+            judges.append({
+                "agreement_success": True,
+                "scores": scores,
+                "high_disagreement": max(scores) - min(scores) >= 2,
+            })
+        else:
+            judges.append({"agreement_success": False})
+
+    return results, exact, judges
+
+
+def _reference_report(results, exact, judges):
+    """
+    The original pure-Python aggregation, kept as an oracle.
+    """
+    n = len(results)
+    em = [m["exact_match"] for m in exact if m["exact_match"] is not None]
+    scores, judged, high = [], 0, 0
+    for a in judges:
+        if a.get("agreement_success"):
+            judged += 1
+            scores.extend(a.get("scores", []))
+            if a.get("high_disagreement"):
+                high += 1
+    return {
+        "num_samples": n,
+        "model_failure_rate": round(sum(1 for r in results if not r.success) / n, 3),
+        "exact_match_accuracy": round(sum(em) / len(em), 3) if em else None,
+        "avg_judge_score": round(statistics.mean(scores), 2) if scores else None,
+        "judge_coverage": round(judged / n, 3),
+        "high_disagreement_rate": round(high / judged, 3) if judged else None,
+    }
+
+
+def test_vectorized_report_matches_reference_and_adds_intervals():
+    results, exact, judges = _run(2000)
+    report = aggregate_dataset_report(results, exact, judges, "d", "m")
+
+    for key, value in _reference_report(results, exact, judges).items():
+        assert report[key] == value, key
+
+    for key, (low, high) in report["confidence_intervals"].items():
+        assert low <= report[key] <= high, key
+
+    table_report = aggregate_dataset_report(ResultTable.from_results(results), exact, judges, "d", "m")
+    assert table_report == report
+
+
+def test_per_category_breakdown():
+    results, exact, judges = _run(500, seed=1)
+    report = aggregate_dataset_report(results, exact, judges, "d", "m")
+
+    assert set(report["categories"]) == {"reasoning", "safety", "uncategorized"}
+    assert sum(c["num_samples"] for c in report["categories"].values()) == 500
+
+    reasoning = [i for i, r in enumerate(results) if r.category == "reasoning"]
+    expected = _reference_report(
+        [results[i] for i in reasoning],
+        [exact[i] for i in reasoning],
+        [judges[i] for i in reasoning],
+    )
+    assert report["categories"]["reasoning"] == expected
+
+
+def test_bootstrap_handles_continuous_values_and_empty_input():
+    values = np.random.default_rng(0).normal(10, 1, size=5000)
+    low, high = bootstrap_mean_ci(values, n_resamples=200)
+
+    assert low < values.mean() < high
+    assert high - low < 0.2
+    assert bootstrap_mean_ci(np.array([])) is None
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from models.llm_clients.base import BaseLLM
+from models.llm_clients.cache import CachedLLM, ResponseCache
+
+
+class CountingLLM(BaseLLM):
+    model_name = "counting-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        self.calls += 1
+        return f"{prompt}:{self.calls}"
+
+
+def _cache(tmp, **kwargs):
+    return ResponseCache(path=os.path.join(tmp, "cache.sqlite"), **kwargs)
+
+
+def test_repeated_prompts_are_served_from_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = CountingLLM()
+        llm = CachedLLM(inner, _cache(tmp))
+
+        first = llm.generate("q", temperature=0.0)
+        assert llm.generate("q", temperature=0.0) == first
+        assert inner.calls == 1
+
+        # Different generation config is a different key
+        llm.generate("q", temperature=0.5)
+        assert inner.calls == 2
+
+        assert llm.stats() == {"hits": 1, "misses": 2, "hit_rate": 0.333}
+        assert llm.name() == "CountingLLM"
+        llm.cache.close()
+
+
+def test_cache_persists_across_instances_and_namespaces_are_isolated():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _cache(tmp)
+        CachedLLM(CountingLLM(), cache, namespace="judge_0").generate("p")
+        cache.close()
+
+        cache = _cache(tmp)
+        inner = CountingLLM()
+        CachedLLM(inner, cache, namespace="judge_0").generate("p")
+        assert inner.calls == 0
+
+        CachedLLM(inner, cache, namespace="judge_1").generate("p")
+        assert inner.calls == 1
+        cache.close()
+
+
+def test_size_based_eviction_drops_least_recently_used():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _cache(tmp, max_bytes=100)
+        cache.put("a", "x" * 40)
+        cache.put("b", "y" * 40)
+        cache.get("a")
+        cache.put("c", "z" * 40)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["size_bytes"] <= 90
+        cache.close()
+
+
+def test_hits_defer_last_access_writes():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _cache(tmp)
+        cache.put("a", "x")
+
+        def last_access():
+            conn = sqlite3.connect(cache.path)
+            try:
+                return conn.execute("SELECT last_access FROM responses WHERE key = 'a'").fetchone()[0]
+            finally:
+                conn.close()
+
+        written = last_access()
+        time.sleep(0.01)
+        assert cache.get("a") == "x"
+        assert last_access() == written
+
+        cache.close()
+        assert last_access() > written
+
+
+def test_async_lookups_run_off_the_event_loop():
+    class ThreadRecordingCache(ResponseCache):
+        threads = set()
+
+        def get(self, key):
+            self.threads.add(threading.current_thread().name)
+            return super().get(key)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = CountingLLM()
+        llm = CachedLLM(inner, ThreadRecordingCache(path=os.path.join(tmp, "cache.sqlite")))
+
+        first = asyncio.run(llm.agenerate("q"))
+        assert asyncio.run(llm.agenerate("q")) == first
+        assert inner.calls == 1
+        assert threading.main_thread().name not in ThreadRecordingCache.threads
+        llm.cache.close()
@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+
+import api.pipeline as pipeline
+from api.run_store import InMemoryRunStore
+from evaluation.checkpoint import RunLog
+from evaluation.judges.agreement import JudgeAgreement
+from evaluation.judges.base import BaseJudge
+from evaluation.judges.cascade import (
+    CascadingJudgeAgreement,
+    exact_match_signal,
+    similarity_signal,
+    summarize_cascade,
+)
+from evaluation.results import EvalResult
+
+
+class ScriptedJudge(BaseJudge):
+    """
+    Scores from a sample_id -> score table; counts calls.
+    """
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.calls = []
+        self.batch_calls = 0
+
+    def name(self):
+        return "scripted"
+
+    def judge(self, result):
+        self.calls.append(result.sample_id)
+        return {"judge_score": self.scores[result.sample_id], "judge_explanation": "ok"}
+
+    async def ajudge_batch(self, results):
+        self.batch_calls += 1
+        return [self.judge(result) for result in results]
+
+
+def _result(sample_id, success=True):
+    return EvalResult(
+        sample_id=sample_id, prompt="q", model_output="a" if success else "", model_name="m",
+        dataset_name="gsm8k", latency=0.1, success=success, reference="#### 1",
+    )
+
+
+# sample -> (judge 0, judge 1, judge 2) scores
+SCRIPT = {
+    "confident": (5, 4, 4),
+    "borderline_agree": (3, 4, 1),
+    "borderline_disagree": (3, 1, 2),
+    "unparseable": (None, 2, 2),
+    "decided": (5, 5, 4),
+    "failed": (0, 0, 0),
+}
+
+
+def _judges():
+    return [ScriptedJudge({sid: scores[i] for sid, scores in SCRIPT.items()}) for i in range(3)]
+
+
+def _signals():
+    return {"exact_match": lambda r: {"judge_score": 5, "judge_explanation": "match"} if r.sample_id == "decided" else None}
+
+
+def _results():
+    return [_result(sid, success=sid != "failed") for sid in SCRIPT]
+
+
+def test_judges_are_called_only_as_far_as_needed():
+    judges = _judges()
+    cascade = CascadingJudgeAgreement(judges, signals=_signals())
+
+    judgments = {r.sample_id: cascade.evaluate(r) for r in _results()}
+
+    stages = {sid: (j["cascade"]["stage"], j["scores"]) for sid, j in judgments.items()}
+    assert stages == {
+        "confident": ("single", [5]),
+        "borderline_agree": ("pair", [3, 4]),
+        "borderline_disagree": ("panel", [3, 1, 2]),
+        # Only one usable score out of two: the whole panel is asked
+        "unparseable": ("panel", [2, 2]),
+        "decided": ("signal", [5]),
+        "failed": ("model_failed", [0]),
+    }
+    assert judgments["decided"]["cascade"]["signal"] == "exact_match"
+    assert judgments["decided"]["raw_judgments"][0]["judge"] == "exact_match"
+    assert judgments["borderline_agree"]["num_judges"] == 2
+    assert [len(judge.calls) for judge in judges] == [4, 3, 2]
+
+
+def test_async_and_batched_cascades_match_sequential():
+    results = _results()
+    expected = [CascadingJudgeAgreement(_judges(), signals=_signals()).evaluate(r) for r in results]
+
+    judges = _judges()
+    cascade = CascadingJudgeAgreement(judges, signals=_signals())
+    assert asyncio.run(cascade.aevaluate_many(results)) == expected
+
+    judges = _judges()
+    batched = asyncio.run(CascadingJudgeAgreement(judges, signals=_signals()).aevaluate_batch(results))
+    assert batched == expected
+    # One batch call per judge and stage that still had samples
+    assert [judge.batch_calls for judge in judges] == [1, 1, 1]
+    assert [len(judge.calls) for judge in judges] == [4, 3, 2]
+
+
+def test_full_panel_agrees_with_plain_agreement_when_nothing_is_decided_early():
+    result = _result("borderline_disagree")
+    cascaded = CascadingJudgeAgreement(_judges()).evaluate(result)
+    full = JudgeAgreement(_judges()).evaluate(result)
+
+    assert {k: v for k, v in cascaded.items() if k != "cascade"} == full
+
+
+def test_audit_compares_with_the_full_panel():
+    judges = _judges()
+    cascade = CascadingJudgeAgreement(judges, signals=_signals(), audit_rate=1.0)
+
+    judgments = [cascade.evaluate(r) for r in _results()]
+    audits = {r.sample_id: j["cascade"].get("audit") for r, j in zip(_results(), judgments)}
+
+    assert audits["confident"] == {"panel_mean_score": 4.33, "difference": 0.67, "match": False, "judge_calls": 2}
+    assert audits["borderline_agree"] == {"panel_mean_score": 2.67, "difference": 0.83, "match": False, "judge_calls": 1}
+    assert audits["decided"]["match"] is True and audits["decided"]["judge_calls"] == 3
+    assert audits["borderline_disagree"]["judge_calls"] == 0
+    assert audits["failed"] is None
+    # The cascade's own judgment is what gets reported
+    assert judgments[0]["scores"] == [5]
+
+    batched = asyncio.run(CascadingJudgeAgreement(_judges(), signals=_signals(), audit_rate=1.0).aevaluate_batch(_results()))
+    assert batched == judgments
+
+
+def test_audited_samples_are_chosen_by_sample_id():
+    cascade = CascadingJudgeAgreement(_judges(), audit_rate=0.2)
+    chosen = [cascade._audited(_result(f"s{i}")) for i in range(2000)]
+
+    assert 300 < sum(chosen) < 500
+    assert chosen == [cascade._audited(_result(f"s{i}")) for i in range(2000)]
+
+
+def test_summarize_cascade():
+    cascade = CascadingJudgeAgreement(_judges(), signals=_signals(), audit_rate=1.0)
+    judgments = [cascade.evaluate(r) for r in _results()]
+
+    summary = summarize_cascade(judgments, num_judges=3)
+
+    assert summary["decided_by"] == {"single": 1, "pair": 1, "panel": 2, "signal": 1, "model_failed": 1}
+    assert summary["judge_calls"] == 9
+    assert summary["full_panel_calls"] == 15
+    assert summary["judge_calls_saved"] == 6
+    assert summary["audit"]["samples"] == 5
+    assert summary["audit"]["judge_calls"] == 6
+    assert summary["audit"]["matches"] == 3
+    assert summary["net_judge_calls_saved"] == 0
+
+
+def test_signals():
+    exact = exact_match_signal({
+        "a": {"exact_match": 1, "predicted_answer": "4", "gold_answer": "4"},
+        "b": {"exact_match": 0, "predicted_answer": "5", "gold_answer": "4"},
+        "c": {"exact_match": 0, "predicted_answer": None, "gold_answer": None},
+    })
+    assert exact(_result("a"))["judge_score"] == 5
+    assert exact(_result("b")) is None
+    assert exact(_result("c")) is None
+    assert exact_match_signal({"b": {"exact_match": 0, "predicted_answer": "5", "gold_answer": "4"}}, incorrect_score=1)(_result("b"))["judge_score"] == 1
+
+    similar = similarity_signal({
+        "a": {"similarity_best": 0.95, "closer_to_correct": 1},
+        "b": {"similarity_best": 0.95, "closer_to_correct": 0},
+        "c": {"similarity_best": 0.1, "closer_to_correct": 0},
+    }, low=0.2)
+    assert similar(_result("a"))["judge_score"] == 5
+    assert similar(_result("b")) is None
+    assert similar(_result("c"))["judge_score"] == 1
+    assert similar(_result("d")) is None
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = InMemoryRunStore()
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setattr(pipeline, "CASCADE_AUDIT_RATE", 0.5)
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "mock")
+    return store
+
+
+def test_cascaded_run_reports_judge_calls_saved(store):
+    model = "mock:accuracy=0.6,seed=3"
+    store.create_run("r1", dataset="synthetic", model=model, status="queued")
+    status = asyncio.run(pipeline.run_evaluation_background(
+        "r1", "synthetic", model, max_samples=40, cascade=True,
+    ))
+
+    assert status == "completed"
+    report = store.get_run("r1")["report"]
+    cascade = report["cascade"]
+    assert cascade["samples"] == 40
+    # Every exact match is decided without a judge
+    exact_matches = round(report["exact_match_accuracy"] * 40)
+    assert cascade["decided_by"]["signal"] == exact_matches
+    assert cascade["judge_calls_saved"] >= exact_matches * 3
+    assert cascade["audit"]["samples"] > 0
+    assert report["instrumentation"]["operations"]["judge.judge_0"]["count"] == 40 - exact_matches + sum(
+        1 for s in store.get_samples("r1")
+        if s["judgment"]["cascade"]["stage"] == "signal" and "audit" in s["judgment"]["cascade"]
+    )
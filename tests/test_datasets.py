@@ -1,7 +1,73 @@
-from eval_datasets.registry import load_dataset_by_name
+from eval_datasets.loaders.base import BaseDatasetLoader
+from eval_datasets.registry import (
+    DATASET_REGISTRY,
+    clear_dataset_cache,
+    iter_dataset_by_name,
+    load_dataset_by_name,
+)
+from eval_datasets.schemas import EvalSample
 
 def test_all_datasets():
     for name in ["gsm8k", "truthfulqa", "safety"]:
         samples = load_dataset_by_name(name)
         assert len(samples) > 0
         assert hasattr(samples[0], "prompt")
+
+
+class CountingLoader(BaseDatasetLoader):
+    loads = 0
+    converted = 0
+
+    def name(self):
+        return "counting"
+
+    def _load_rows(self, streaming=False):
+        CountingLoader.loads += 1
+        return ({"q": f"question {i}"} for i in range(100_000))
+
+    def _to_sample(self, index, row):
+        CountingLoader.converted += 1
+        return EvalSample(id=f"counting_{index}", prompt=row["q"])
+
+
+def test_limit_offset_stop_early_and_are_cached():
+    DATASET_REGISTRY["counting"] = CountingLoader
+    clear_dataset_cache()
+    try:
+        samples = load_dataset_by_name("counting", limit=10, offset=5)
+        assert [s.id for s in samples] == [f"counting_{i}" for i in range(5, 15)]
+        assert CountingLoader.converted == 10
+
+        samples.clear()  # callers get a copy, the cache is untouched
+        assert len(load_dataset_by_name("counting", limit=10, offset=5)) == 10
+        assert CountingLoader.loads == 1
+
+        streamed = iter_dataset_by_name("counting", limit=3)
+        assert [s.id for s in streamed] == ["counting_0", "counting_1", "counting_2"]
+    finally:
+        del DATASET_REGISTRY["counting"]
+        clear_dataset_cache()
+
+
+def test_sample_cache_is_bounded_and_serves_contained_slices(monkeypatch):
+    import eval_datasets.registry as registry
+
+    DATASET_REGISTRY["counting"] = CountingLoader
+    monkeypatch.setattr(registry, "DATASET_CACHE_ENTRIES", 2)
+    clear_dataset_cache()
+    try:
+        loads = CountingLoader.loads
+        load_dataset_by_name("counting", limit=20)
+        samples = load_dataset_by_name("counting", limit=5, offset=10)
+        assert [s.id for s in samples] == [f"counting_{i}" for i in range(10, 15)]
+        assert CountingLoader.loads == loads + 1
+
+        for limit in (30, 40, 50):
+            load_dataset_by_name("counting", limit=limit)
+        assert len(registry._SAMPLE_CACHE) == 2
+        assert [key[2] for key in registry._SAMPLE_CACHE] == [40, 50]
+        assert len(load_dataset_by_name("counting", limit=45)) == 45
+        assert CountingLoader.loads == loads + 4
+    finally:
+        del DATASET_REGISTRY["counting"]
+        clear_dataset_cache()
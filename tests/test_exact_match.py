@@ -0,0 +1,53 @@
+import pytest
+
+from evaluation.metrics.exact_match import ExactMatchMetric, extract_final_answer, gold_answer
+from evaluation.results import EvalResult
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("The answer is 72.", "72"),
+    ("She sold 48/2 = <<48/2=24>>24 clips in May.\n#### 72", "72"),
+    ("First 7, then...\n#### 18 dollars", "18"),
+    ("It costs $1,200.", "1200"),
+    ("1,234 apples", "1234"),
+    ("12.50", "12.5"),
+    ("18.0", "18"),
+    ("3/4", "0.75"),
+    ("So it is -5 degrees", "-5"),
+    ("no numbers here", ""),
+    ("####", ""),
+    ("", ""),
+])
+def test_extract_final_answer(text, expected):
+    assert extract_final_answer(text) == expected
+
+
+def _result(output, reference, success=True):
+    return EvalResult(
+        sample_id="s", prompt="q", model_output=output, model_name="m",
+        dataset_name="gsm8k", latency=0.1, success=success, reference=reference,
+    )
+
+
+def test_normalized_answers_match_gsm8k_references():
+    metric = ExactMatchMetric()
+    reference = "Each costs $600, so 2 * 600 = <<2*600=1200>>1200\n#### 1,200"
+
+    assert metric.compute(_result("The total is $1200.00.", reference))["exact_match"] == 1
+    assert metric.compute(_result("The total is 1100", reference))["exact_match"] == 0
+    assert metric.compute(_result("", reference, success=False)) == {
+        "exact_match": 0, "predicted_answer": None, "gold_answer": None,
+    }
+
+
+def test_compute_many_matches_compute_and_caches_gold_answers():
+    metric = ExactMatchMetric()
+    results = [_result(f"Answer: {i % 3}", f"#### {i % 2}") for i in range(50)]
+
+    gold_answer.cache_clear()
+    metric.precompute(r.reference for r in results)
+    hits = gold_answer.cache_info().hits
+
+    assert metric.compute_many(results) == [metric.compute(r) for r in results]
+    assert gold_answer.cache_info().misses == 2
+    assert gold_answer.cache_info().hits == hits + 100
@@ -0,0 +1,60 @@
+from models.llm_clients.hf_local import BatchScheduler, _Request, batching_summary
+
+
+class RecordingScheduler(BatchScheduler):
+    """
+    Scheduler with the model call replaced by an echo of prompt lengths.
+    """
+
+    def __init__(self, **kwargs):
+        self.seen = []
+        super().__init__(model=None, tokenizer=None, **kwargs)
+
+    def _generate(self, batch):
+        self.seen.append([len(r.input_ids) for r in batch])
+        return [f"len={len(r.input_ids)}" for r in batch]
+
+
+def test_scheduler_packs_similar_lengths_around_oldest_request():
+    scheduler = RecordingScheduler(max_batch_size=3, max_wait_ms=300)
+    lengths = [1, 50, 2, 51, 3, 52]
+
+    futures = [scheduler.submit([0] * n, (16, 0.0)) for n in lengths]
+
+    assert [f.result(timeout=5) for f in futures] == [f"len={n}" for n in lengths]
+    assert scheduler.seen == [[1, 2, 3], [50, 51, 52]]
+
+
+def test_scheduler_never_mixes_generation_configs():
+    scheduler = RecordingScheduler(max_batch_size=4, max_wait_ms=300)
+
+    greedy = [scheduler.submit([0] * 5, (16, 0.0)) for _ in range(2)]
+    sampled = [scheduler.submit([0] * 5, (16, 0.7)) for _ in range(2)]
+
+    for future in greedy + sampled:
+        future.result(timeout=5)
+    assert scheduler.seen == [[5, 5], [5, 5]]
+
+
+def test_identical_prompts_are_deduplicated_only_when_greedy():
+    scheduler = RecordingScheduler()
+    prompts = [[1, 2], [3], [1, 2]]
+
+    greedy = [_Request(ids, (16, 0.0)) for ids in prompts]
+    assert scheduler._rows(greedy) == ([[1, 2], [3]], [0, 1, 0])
+
+    sampled = [_Request(ids, (16, 0.7)) for ids in prompts]
+    assert scheduler._rows(sampled) == ([[1, 2], [3], [1, 2]], [0, 1, 2])
+
+
+def test_batching_summary_reports_per_run_delta():
+    before = {"batches": 2, "requests": 10, "deduplicated": 0, "prompt_tokens": 100, "padded_tokens": 120}
+    after = {"batches": 6, "requests": 30, "deduplicated": 4, "prompt_tokens": 280, "padded_tokens": 320}
+
+    assert batching_summary(before, after) == {
+        "batches": 4,
+        "requests": 20,
+        "avg_batch_size": 5.0,
+        "deduplicated": 4,
+        "padding_ratio": 0.1,
+    }
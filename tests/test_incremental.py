@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+import api.pipeline as pipeline
+from api.run_store import InMemoryRunStore
+from eval_datasets.loaders.synthetic import SyntheticArithmeticLoader
+from evaluation.checkpoint import RunLog
+from evaluation.fingerprint import run_config, sample_fingerprints
+
+MODEL = "mock:accuracy=0.7,seed=5"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = InMemoryRunStore()
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "mock")
+    return store
+
+
+def _run(store, run_id, model=MODEL, max_samples=20, incremental=True):
+    store.create_run(run_id, dataset="synthetic", model=model, status="queued")
+    status = asyncio.run(pipeline.run_evaluation_background(
+        run_id, "synthetic", model, max_samples=max_samples, incremental=incremental,
+    ))
+    assert status == "completed"
+    return store.get_run(run_id)["report"]
+
+
+def _scores(report):
+    return {k: v for k, v in report.items() if k not in ("instrumentation", "lineage")}
+
+
+def test_fingerprints_cover_sample_fields_and_config():
+    sample = SyntheticArithmeticLoader(size=1).load()[0]
+    config = run_config("synthetic", MODEL, "mock", "mock", 3)
+
+    base = sample_fingerprints([sample], config)[sample.id]
+    sample.reference = "changed"
+
+    assert sample_fingerprints([sample], config)[sample.id] != base
+    assert sample_fingerprints([sample], {**config, "judge_model": "other"})[sample.id] != base
+
+
+def test_incremental_run_only_evaluates_new_samples(store):
+    first = _run(store, "r1", incremental=False)
+    assert "lineage" not in first
+
+    repeat = _run(store, "r2")
+    assert repeat["lineage"] == {"copied_samples": 20, "evaluated_samples": 0, "source_runs": {"r1": 20}}
+    assert repeat["instrumentation"]["operations"].get("llm.inference") is None
+    assert _scores(repeat) == _scores(first)
+
+    grown = _run(store, "r3", max_samples=30)
+    assert grown["lineage"]["copied_samples"] == 20
+    assert grown["lineage"]["evaluated_samples"] == 10
+    # Copies of copies point at the run that computed them
+    assert grown["lineage"]["source_runs"] == {"r1": 20}
+
+    full = _run(store, "r4", max_samples=30, incremental=False)
+    assert _scores(grown) == _scores(full)
+    assert [s["result"]["model_output"] for s in store.get_samples("r3")] == \
+        [s["result"]["model_output"] for s in store.get_samples("r4")]
+
+
+def test_changed_model_config_is_not_reused(store):
+    _run(store, "r1", incremental=False)
+    report = _run(store, "r2", model="mock:accuracy=0.7,seed=6")
+
+    assert report["lineage"]["copied_samples"] == 0
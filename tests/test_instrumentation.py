@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from eval_datasets.loaders.synthetic import SyntheticArithmeticLoader
+from evaluation.instrumentation import Tracer, TracedJudge, build_run_summary
+from evaluation.judges.llm_judge import LLMJudge
+from evaluation.orchestrator import evaluate_dataset
+from models.llm_clients.mock import MockLLM
+from models.llm_clients.usage import UsageMeter, estimate_cost, usage_with_cost
+
+
+def test_spans_nest_under_stages_and_summarize():
+    tracer = Tracer("run-1", max_spans=3)
+
+    tracer.stage("inference")
+    with tracer.span("outer") as outer:
+        with tracer.span("inner") as inner:
+            pass
+    tracer.record("llm.inference", 0.25, sample_id="s1")
+    tracer.record("llm.inference", 0.75, sample_id="s2")
+    tracer.stage("judging")
+    tracer.finish()
+
+    assert inner.parent_span_id == outer.span_id
+
+    summary = tracer.summary()
+    assert set(summary["stages"]) == {"inference", "judging"}
+    assert summary["operations"]["llm.inference"]["count"] == 2
+    assert summary["operations"]["llm.inference"]["max_seconds"] == 0.75
+    # Totals stay exact past max_spans; run and stage spans are always kept
+    assert summary["dropped_spans"] == 1
+    assert {"evaluation_run", "inference", "judging"} <= {s.name for s in tracer.spans}
+
+
+def test_otlp_export(tmp_path):
+    tracer = Tracer("run-2")
+    tracer.stage("inference")
+    with tracer.span("metric.exact_match", sample_id="s1"):
+        pass
+    tracer.finish()
+
+    path = tmp_path / "trace.json"
+    tracer.export(str(path))
+    spans = json.loads(path.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+    assert len(spans) == 3
+    assert all(s["traceId"] == tracer.trace_id for s in spans)
+    by_name = {s["name"]: s for s in spans}
+    assert by_name["metric.exact_match"]["parentSpanId"] == by_name["inference"]["spanId"]
+    assert "parentSpanId" not in by_name["evaluation_run"]
+    assert int(by_name["evaluation_run"]["endTimeUnixNano"]) >= int(by_name["inference"]["startTimeUnixNano"])
+
+
+def test_usage_and_cost_summary(monkeypatch):
+    meter = UsageMeter()
+    meter.record(input_tokens=1000, output_tokens=200)
+    meter.record(input_tokens=500, output_tokens=100, retries=2)
+
+    usage = usage_with_cost("models/gemini-2.5-flash", meter.stats())
+    assert usage["requests"] == 2 and usage["retries"] == 2
+    assert usage["cost_usd"] == round((1500 * 0.30 + 300 * 2.50) / 1e6, 6)
+    assert estimate_cost("unknown-model", 10, 10) is None
+
+    monkeypatch.setenv("AUTOELAVE_PRICE_PER_MTOK", "1,2")
+    assert estimate_cost("unknown-model", 1_000_000, 1_000_000) == 3.0
+
+    tracer = Tracer("run-3")
+    tracer.stage("inference")
+    tracer.finish()
+    summary = build_run_summary(tracer, {"inference": usage}, num_samples=2, num_judge_calls=0)
+
+    assert summary["tokens"]["total"] == {"input_tokens": 1500, "output_tokens": 300}
+    assert summary["retries"] == 2
+    assert summary["throughput"]["judge_calls_per_second"] is None
+
+
+def test_mock_usage_and_traced_judges():
+    samples = SyntheticArithmeticLoader(size=20).load()
+    llm = MockLLM()
+    results = evaluate_dataset(samples, llm, "synthetic")
+
+    assert llm.usage.stats()["requests"] == 20
+    assert llm.usage.stats()["output_tokens"] > 0
+
+    tracer = Tracer("run-4")
+    judge = TracedJudge(LLMJudge(MockLLM(seed=1)), tracer, "judge.judge_0")
+    judgments = [asyncio.run(judge.ajudge(r)) for r in results[:5]]
+
+    assert judge.name() == LLMJudge(MockLLM()).name()
+    assert all("judge_score" in j for j in judgments)
+    assert tracer.summary()["operations"]["judge.judge_0"]["count"] == 5
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.routes.evaluate as evaluate_routes
+from api.main import app
+from api.run_store import InMemoryRunStore
+from evaluation.checkpoint import RunLog
+from jobs.queue import JobQueue, QueueFullError
+
+
+@pytest.fixture
+def queue():
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JobQueue(f"sqlite:///{os.path.join(tmp, 'jobs.db')}", max_queued=3)
+        yield queue
+        queue.engine.dispose()
+
+
+def test_claim_order_is_priority_then_fifo(queue):
+    low = queue.enqueue("r1", {"dataset": "gsm8k"}, priority=0)
+    high = queue.enqueue("r2", {"dataset": "gsm8k"}, priority=5)
+    low_2 = queue.enqueue("r3", {"dataset": "gsm8k"}, priority=0)
+
+    claimed = [queue.claim("w")["job_id"] for _ in range(3)]
+    assert claimed == [high, low, low_2]
+    assert queue.claim("w") is None
+
+    job = queue.get(high)
+    assert job["status"] == "running"
+    assert job["worker_id"] == "w"
+    assert job["payload"] == {"dataset": "gsm8k"}
+
+
+def test_queue_is_bounded(queue):
+    for i in range(3):
+        queue.enqueue(f"r{i}", {})
+
+    with pytest.raises(QueueFullError):
+        queue.enqueue("r3", {})
+
+    queue.claim("w")
+    queue.enqueue("r3", {})  # running jobs do not count against the bound
+
+
+def test_cancel_queued_and_running_jobs(queue):
+    queued = queue.enqueue("r1", {})
+    running = queue.enqueue("r2", {}, priority=1)
+    queue.claim("w")
+
+    assert queue.cancel(queued)["status"] == "cancelled"
+    assert queue.claim("w") is None
+
+    assert queue.cancel(running)["status"] == "running"
+    assert queue.is_cancel_requested(running)
+
+    queue.finish(running, "cancelled")
+    assert queue.depth() == {
+        "queued": 0, "running": 0, "completed": 0, "failed": 0, "cancelled": 2,
+    }
+    assert [j["job_id"] for j in queue.list_jobs(status="cancelled")] == [running, queued]
+
+
+def test_active_job_for_run(queue):
+    first = queue.enqueue("run-1", {})
+    queue.cancel(first)
+    second = queue.enqueue("run-1", {})
+
+    assert queue.active_job_for_run("run-1")["job_id"] == second
+    assert queue.active_job_for_run("run-2") is None
+
+    queue.claim("w1")
+    queue.finish(second, "completed")
+    assert queue.active_job_for_run("run-1") is None
+
+
+@pytest.fixture
+def routes(queue, monkeypatch):
+    store = InMemoryRunStore()
+    monkeypatch.setattr(evaluate_routes, "RUN_STORE", store)
+    monkeypatch.setattr(evaluate_routes, "JOB_QUEUE", queue)
+
+    # A worker claiming the job right away must find the run's row
+    enqueue = queue.enqueue
+
+    def enqueue_and_claim(run_id, payload, priority=0):
+        job_id = enqueue(run_id, payload, priority=priority)
+        store.update_run(run_id, status="running")
+        return job_id
+
+    monkeypatch.setattr(queue, "enqueue", enqueue_and_claim)
+    return store
+
+
+def test_run_row_exists_before_the_job_can_be_claimed(routes):
+    response = TestClient(app).post("/evaluate", json={"dataset": "gsm8k", "model_name": "mock"})
+
+    assert response.status_code == 200
+    assert routes.get_run(response.json()["run_id"])["status"] == "running"
+
+
+def test_full_queue_fails_new_runs_and_keeps_resumed_ones(routes, queue, tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluate_routes, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    client = TestClient(app)
+    for _ in range(3):
+        client.post("/evaluate", json={"dataset": "gsm8k", "model_name": "mock"})
+    for run in routes.list_runs():
+        routes.update_run(run["run_id"], status="queued")
+
+    response = client.post("/evaluate", json={"dataset": "gsm8k", "model_name": "mock"})
+    assert response.status_code == 429
+    assert [run["status"] for run in routes.list_runs()].count("failed") == 1
+
+    RunLog("old", directory=str(tmp_path)).write_header(dataset="gsm8k", model_name="mock")
+    routes.create_run("old", dataset="gsm8k", model="mock", status="cancelled")
+    routes.update_run("old", error="Run old was cancelled", progress={"stage": "judging"})
+
+    assert client.post("/evaluate/old/resume").status_code == 429
+    old = routes.get_run("old")
+    assert (old["status"], old["error"], old["progress"]) == ("cancelled", "Run old was cancelled", {"stage": "judging"})
+
+
+def test_jobs_of_lost_workers_are_failed_when_their_lease_expires(queue):
+    stale = queue.enqueue("r1", {})
+    alive = queue.enqueue("r2", {})
+    terminated = queue.enqueue("r3", {})
+    for worker in ("w1", "w2", "w3"):
+        queue.claim(worker)
+
+    time.sleep(0.05)
+    queue.heartbeat(alive)
+
+    assert [job["job_id"] for job in queue.recover_stale(lease_seconds=0.04)] == [stale, terminated]
+    assert queue.get(stale)["status"] == "failed"
+    assert "no heartbeat" in queue.get(stale)["error"]
+    assert queue.get(alive)["status"] == "running"
+
+    assert [job["job_id"] for job in queue.release_worker("w2", "terminated")] == [alive]
+    assert queue.active_job_for_run("r2") is None
+
+
+def test_runs_of_lost_jobs_can_be_resumed(routes, queue, tmp_path, monkeypatch):
+    import api.routes._store as store_module
+    from jobs.worker import fail_lost_runs
+
+    monkeypatch.setattr(store_module, "RUN_STORE", routes)
+    monkeypatch.setattr(evaluate_routes, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    client = TestClient(app)
+
+    RunLog("r1", directory=str(tmp_path)).write_header(dataset="gsm8k", model_name="mock")
+    routes.create_run("r1", dataset="gsm8k", model="mock", status="running")
+    queue.enqueue("r1", {})
+    queue.claim("w1")
+    assert client.post("/evaluate/r1/resume").status_code == 409
+
+    # The worker died: the lease expires and the run becomes resumable
+    fail_lost_runs(queue, queue.recover_stale(lease_seconds=0))
+    assert routes.get_run("r1")["status"] == "failed"
+    assert client.post("/evaluate/r1/resume").status_code == 200
+
+    # A run whose row was never updated is resumable once its job is gone
+    routes.create_run("r2", dataset="gsm8k", model="mock", status="running")
+    RunLog("r2", directory=str(tmp_path)).write_header(dataset="gsm8k", model_name="mock")
+    assert client.post("/evaluate/r2/resume").status_code == 200
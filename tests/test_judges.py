@@ -0,0 +1,166 @@
+import asyncio
+import threading
+import time
+
+from evaluation.judges.agreement import JudgeAgreement
+from evaluation.judges.base import BaseJudge
+from evaluation.results import EvalResult
+
+
+class FixedJudge(BaseJudge):
+    """
+    Fake judge returning a fixed score after a short sleep.
+    """
+
+    def __init__(self, score, latency=0.0, tracker=None):
+        self.score = score
+        self.latency = latency
+        self.tracker = tracker
+
+    def name(self) -> str:
+        return f"fixed_{self.score}"
+
+    def judge(self, result):
+        if self.tracker:
+            self.tracker.enter()
+        try:
+            time.sleep(self.latency)
+        finally:
+            if self.tracker:
+                self.tracker.exit()
+        return {"judge_score": self.score, "judge_explanation": "ok"}
+
+    async def ajudge(self, result):
+        if self.tracker:
+            self.tracker.enter()
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            if self.tracker:
+                self.tracker.exit()
+        return {"judge_score": self.score, "judge_explanation": "ok"}
+
+
+class PeakTracker:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def enter(self):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self):
+        with self._lock:
+            self.current -= 1
+
+
+def _result(i):
+    return EvalResult(
+        sample_id=f"s_{i}",
+        prompt="q",
+        model_output="a",
+        model_name="fake",
+        dataset_name="fake",
+        latency=0.0,
+        success=True,
+        reference="a",
+    )
+
+
+def test_parallel_agreement_matches_sequential():
+    agreement = JudgeAgreement([FixedJudge(1), FixedJudge(4), FixedJudge(5), FixedJudge(None)])
+    results = [_result(i) for i in range(5)]
+
+    sequential = [agreement.evaluate(r) for r in results]
+
+    assert asyncio.run(agreement.aevaluate_many(results, max_concurrency=4)) == sequential
+    assert agreement.evaluate_many(results, max_workers=4) == sequential
+
+
+def test_shared_budget_caps_in_flight_judge_calls():
+    tracker = PeakTracker()
+    judges = [FixedJudge(3, latency=0.02, tracker=tracker) for _ in range(3)]
+    agreement = JudgeAgreement(judges)
+    results = [_result(i) for i in range(10)]
+
+    asyncio.run(agreement.aevaluate_many(results, max_concurrency=5))
+    assert tracker.peak == 5
+
+    tracker.peak = 0
+    agreement.evaluate_many(results, max_workers=4)
+    assert tracker.peak == 4
+
+
+def test_batched_llm_judging_matches_per_result_judging():
+    from dataclasses import replace
+
+    from evaluation.judges.llm_judge import LLMJudge
+    from evaluation.orchestrator import ajudge_dataset
+    from models.llm_clients.base import BaseLLM
+
+    class ScoringLLM(BaseLLM):
+        supports_batching = True
+
+        def __init__(self, score):
+            self.score = score
+            self.calls = 0
+
+        def generate(self, prompt: str, **kwargs) -> str:
+            return f'{{"score": {self.score}, "explanation": "ok"}}'
+
+        def generate_batch(self, prompts, **kwargs):
+            self.calls += 1
+            return [self.generate(prompt) for prompt in prompts]
+
+    llms = [ScoringLLM(2), ScoringLLM(5)]
+    agreement = JudgeAgreement([LLMJudge(llm) for llm in llms])
+    results = [_result(i) for i in range(6)]
+    results[3] = replace(results[3], success=False, model_output="")
+
+    expected = [agreement.evaluate(r) for r in results]
+    seen = []
+    batched = asyncio.run(ajudge_dataset(
+        results, agreement, batch_size=4, on_judgment=lambda r, j: seen.append(r.sample_id)
+    ))
+
+    assert batched == expected
+    assert sorted(seen) == sorted(r.sample_id for r in results)
+    assert [llm.calls for llm in llms] == [2, 2]
+
+
+def test_batched_judging_caps_single_judge_requests():
+    from evaluation.judges.llm_judge import LLMJudge
+    from evaluation.orchestrator import ajudge_dataset
+    from models.llm_clients.base import BaseLLM
+
+    tracker = PeakTracker()
+
+    class SlowJudgeLLM(BaseLLM):
+        max_concurrency = 4
+
+        async def agenerate(self, prompt: str, **kwargs) -> str:
+            tracker.enter()
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                tracker.exit()
+            return '{"score": 3, "explanation": "ok"}'
+
+        def generate(self, prompt: str, **kwargs) -> str:
+            raise AssertionError("the async path should not block")
+
+    results = [_result(i) for i in range(40)]
+
+    agreement = JudgeAgreement([FixedJudge(3, latency=0.01, tracker=tracker) for _ in range(3)])
+    judgments = asyncio.run(ajudge_dataset(results, agreement, max_concurrency=12, batch_size=8))
+    assert len(judgments) == 40
+    assert 1 < tracker.peak <= 12
+
+    tracker.peak = 0
+    agreement = JudgeAgreement([LLMJudge(SlowJudgeLLM()) for _ in range(3)])
+    judgments = asyncio.run(ajudge_dataset(results, agreement, max_concurrency=12, batch_size=8))
+    assert all(j["mean_score"] == 3 for j in judgments)
+    assert 4 < tracker.peak <= 12
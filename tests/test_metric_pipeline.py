@@ -0,0 +1,301 @@
+import asyncio
+import threading
+from typing import Any, Dict
+
+import pytest
+
+from evaluation.metrics import registry
+from evaluation.metrics.base import BaseMetric
+from evaluation.metrics.exact_match import ExactMatchMetric
+from evaluation.metrics.pipeline import MetricPipeline, summarize_metric_scores
+from evaluation.metrics.registry import build_metric, metrics_for_dataset, register_metric
+from evaluation.metrics.rouge import RougeLMetric
+from evaluation.results import EvalResult
+
+
+def _result(i, output, reference, success=True):
+    return EvalResult(
+        sample_id=f"s{i}", prompt="q", model_output=output, model_name="m",
+        dataset_name="truthfulqa", latency=0.1, success=success, reference=reference,
+    )
+
+
+class LengthMetric(BaseMetric):
+    def name(self) -> str:
+        return "length"
+
+    def compute(self, result: EvalResult) -> Dict[str, Any]:
+        return {"length": len(result.model_output)}
+
+
+class SlowIOMetric(BaseMetric):
+    execution = "io"
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def name(self) -> str:
+        return "slow_io"
+
+    def compute(self, result: EvalResult) -> Dict[str, Any]:
+        return {"echo": result.sample_id}
+
+    async def acompute_batch(self, results):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self.compute_batch(results)
+
+
+def test_compute_batch_defaults_to_compute():
+    results = [_result(i, "x" * i, "r") for i in range(5)]
+    metric = LengthMetric()
+
+    assert metric.execution == "inline"
+    assert metric.compute_batch(results) == [{"length": i} for i in range(5)]
+    assert asyncio.run(metric.acompute_batch(results)) == metric.compute_batch(results)
+
+
+def test_rouge_l():
+    metric = RougeLMetric()
+
+    assert metric.compute(_result(0, "The cat sat on the mat", "the cat sat on the mat")) == {"rouge_l": 1.0}
+    # LCS "the cat the mat" (4): precision 4/6, recall 4/5
+    assert metric.compute(_result(0, "the cat sat on the mat", "the cat and the mat")) == {"rouge_l": 0.7273}
+    assert metric.compute(_result(0, "dogs", "the cat")) == {"rouge_l": 0.0}
+    assert metric.compute(_result(0, "", "the cat", success=False)) == {"rouge_l": 0.0}
+    assert metric.compute(_result(0, "the cat", "")) == {"rouge_l": None}
+
+
+def test_metrics_for_dataset(monkeypatch):
+    monkeypatch.setattr(registry, "METRIC_REGISTRY", dict(registry.METRIC_REGISTRY))
+    monkeypatch.setattr(registry, "DATASET_METRICS", {k: list(v) for k, v in registry.DATASET_METRICS.items()})
+
+    assert [m.name() for m in metrics_for_dataset("gsm8k")] == ["exact_match"]
+    assert [m.name() for m in metrics_for_dataset("safety")] == ["exact_match", "toxicity"]
+    assert [m.name() for m in metrics_for_dataset("truthfulqa")] == ["exact_match", "rouge_l", "semantic_similarity"]
+    assert [m.name() for m in metrics_for_dataset("unknown")] == ["exact_match"]
+
+    register_metric("length", LengthMetric, datasets=["gsm8k", "new"])
+    assert [m.name() for m in metrics_for_dataset("gsm8k")] == ["exact_match", "length"]
+    assert [m.name() for m in metrics_for_dataset("new")] == ["exact_match", "length"]
+    assert isinstance(build_metric("length"), LengthMetric)
+
+    with pytest.raises(ValueError):
+        build_metric("missing")
+
+
+def test_pipeline_matches_sequential_scores_in_order():
+    results = [
+        _result(i, f"answer {i} is the cat on mat #### {i % 4}", f"the cat sat #### {i % 3}")
+        for i in range(23)
+    ]
+    io_metric = SlowIOMetric()
+    metrics = [ExactMatchMetric(), RougeLMetric(), LengthMetric(), io_metric]
+
+    scores = MetricPipeline(metrics, chunk_size=5, max_concurrency=2, max_processes=2).compute(results)
+
+    assert list(scores) == ["exact_match", "rouge_l", "length", "slow_io"]
+    for metric in metrics:
+        assert scores[metric.name()] == [metric.compute(r) for r in results]
+    assert io_metric.peak == 2
+
+
+def test_cpu_metrics_fall_back_to_threads_without_a_process_pool(monkeypatch):
+    import evaluation.metrics.pipeline as pipeline
+
+    monkeypatch.setattr(pipeline, "get_process_pool", lambda max_workers=None: None)
+    threads = set()
+
+    class ThreadRecordingRouge(RougeLMetric):
+        def compute_batch(self, results):
+            threads.add(threading.current_thread().name)
+            return super().compute_batch(results)
+
+    results = [_result(i, "the cat", "the cat sat") for i in range(4)]
+    scores = MetricPipeline([ThreadRecordingRouge()]).compute(results)
+
+    assert scores == {"rouge_l": [{"rouge_l": 0.8}] * 4}
+    assert threading.main_thread().name not in threads
+
+
+
+def test_process_pool_is_sized_to_its_share_of_cpus_and_shut_down(monkeypatch):
+    import evaluation.metrics.pipeline as pipeline
+    from jobs.worker import run_worker
+
+    monkeypatch.delenv("AUTOELAVE_METRIC_PROCESSES", raising=False)
+    monkeypatch.setattr(pipeline.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(pipeline, "_PROCESS_POOL_SHARERS", 1)
+    pipeline.shutdown_process_pool()
+
+    pipeline.share_process_pool_cpus(4)
+    pool = pipeline.get_process_pool()
+    assert pool._max_workers == 2
+    assert pipeline.get_process_pool() is pool
+
+    # A worker shuts its pool down on the way out
+    stop = threading.Event()
+    stop.set()
+    run_worker("sqlite://", stop_event=stop, num_workers=4)
+    assert pipeline._PROCESS_POOL is None
+    assert pipeline.get_process_pool() is not pool
+    pipeline.shutdown_process_pool()
+
+
+class BrokenMetric(BaseMetric):
+    def name(self) -> str:
+        return "broken"
+
+    def compute(self, result: EvalResult) -> Dict[str, Any]:
+        raise RuntimeError("model unavailable")
+
+
+def test_failing_metric_does_not_affect_the_others():
+    results = [_result(i, "the cat", "the cat sat") for i in range(3)]
+    pipeline = MetricPipeline([BrokenMetric(), RougeLMetric(), LengthMetric()])
+
+    scores = pipeline.compute(results)
+
+    assert list(scores) == ["rouge_l", "length"]
+    assert scores["length"] == [{"length": 7}] * 3
+    assert pipeline.errors == {"broken": "model unavailable"}
+
+
+def test_summarize_metric_scores():
+    summary = summarize_metric_scores({
+        "rouge_l": [{"rouge_l": 0.5}, {"rouge_l": 1.0}, {"rouge_l": None}],
+        "exact_match": [{"exact_match": 1, "predicted_answer": "3"}, {"exact_match": 0, "predicted_answer": None}],
+        "empty": [],
+    })
+
+    assert summary == {
+        "rouge_l": {"rouge_l": 0.75, "num_scored": 3},
+        "exact_match": {"exact_match": 0.5, "num_scored": 2},
+        "empty": {"num_scored": 0},
+    }
+
+
+def test_evaluation_reports_dataset_metrics(tmp_path, monkeypatch):
+    import api.pipeline as pipeline
+    from api.run_store import InMemoryRunStore
+    from evaluation.checkpoint import RunLog
+
+    store = InMemoryRunStore()
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "mock")
+    monkeypatch.setitem(registry.DATASET_METRICS, "synthetic", ["exact_match", "rouge_l"])
+
+    store.create_run("r1", dataset="synthetic", model="mock", status="queued")
+    status = asyncio.run(pipeline.run_evaluation_background("r1", "synthetic", "mock", max_samples=6))
+
+    assert status == "completed"
+    report = store.get_run("r1")["report"]
+    samples = store.get_samples("r1")
+    assert report["metrics"]["rouge_l"]["num_scored"] == 6
+    assert "metric.extra" in report["instrumentation"]["operations"]
+    assert all(set(s["metrics"]) == {"rouge_l"} for s in samples)
+    assert report["metrics"]["rouge_l"]["rouge_l"] == round(
+        sum(s["metrics"]["rouge_l"]["rouge_l"] for s in samples) / 6, 4
+    )
+
+
+def test_failing_metric_is_reported_without_failing_the_run(tmp_path, monkeypatch):
+    import api.pipeline as pipeline
+    from api.run_store import InMemoryRunStore
+    from evaluation.checkpoint import RunLog
+
+    store = InMemoryRunStore()
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "mock")
+    monkeypatch.setattr(registry, "METRIC_REGISTRY", dict(registry.METRIC_REGISTRY))
+    monkeypatch.setitem(registry.DATASET_METRICS, "synthetic", ["exact_match"])
+    register_metric("broken", BrokenMetric, datasets=["synthetic"])
+    register_metric("length", LengthMetric, datasets=["synthetic"])
+
+    store.create_run("r1", dataset="synthetic", model="mock", status="queued")
+    status = asyncio.run(pipeline.run_evaluation_background("r1", "synthetic", "mock", max_samples=4))
+
+    assert status == "completed"
+    report = store.get_run("r1")["report"]
+    assert report["metrics"]["broken"] == {"error": "model unavailable"}
+    assert report["metrics"]["length"]["num_scored"] == 4
+    assert all(set(s["metrics"]) == {"length"} for s in store.get_samples("r1"))
+
+
+
+def test_metric_without_its_model_is_reported_unavailable(tmp_path, monkeypatch):
+    import api.pipeline as pipeline
+    import evaluation.metrics.toxicity as toxicity
+    from api.run_store import InMemoryRunStore
+    from evaluation.checkpoint import RunLog
+
+    def missing():
+        raise ImportError("ToxicityMetric requires detoxify and torch.")
+
+    store = InMemoryRunStore()
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "mock")
+    monkeypatch.setattr(toxicity, "_require_detoxify", missing)
+    monkeypatch.setitem(registry.DATASET_METRICS, "synthetic", ["exact_match", "toxicity"])
+
+    store.create_run("r1", dataset="synthetic", model="mock", status="queued")
+    status = asyncio.run(pipeline.run_evaluation_background("r1", "synthetic", "mock", max_samples=3))
+
+    assert status == "completed"
+    report = store.get_run("r1")["report"]
+    assert report["metrics"]["toxicity"] == {
+        "num_scored": 3,
+        "unavailable": "ToxicityMetric requires detoxify and torch.",
+    }
+
+
+def test_metrics_are_cancelled_when_the_run_fails(tmp_path, monkeypatch):
+    import api.pipeline as pipeline
+    from api.run_store import InMemoryRunStore
+    from evaluation.checkpoint import RunLog
+
+    class BlockingIOMetric(BaseMetric):
+        execution = "io"
+
+        def name(self) -> str:
+            return "blocking"
+
+        def compute(self, result: EvalResult) -> Dict[str, Any]:
+            return {}
+
+        async def acompute_batch(self, results):
+            await asyncio.sleep(10)
+            return self.compute_batch(results)
+
+    def failing_build_llm(model_name=None):
+        if model_name == "judge":
+            raise RuntimeError("judge unavailable")
+        return original_build_llm(model_name)
+
+    store = InMemoryRunStore()
+    original_build_llm = pipeline.build_llm
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setattr(pipeline, "build_llm", failing_build_llm)
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "judge")
+    monkeypatch.setattr(registry, "METRIC_REGISTRY", dict(registry.METRIC_REGISTRY))
+    monkeypatch.setitem(registry.DATASET_METRICS, "synthetic", ["exact_match"])
+    register_metric("blocking", BlockingIOMetric, datasets=["synthetic"])
+
+    async def run():
+        status = await pipeline.run_evaluation_background("r1", "synthetic", "mock", max_samples=2)
+        await asyncio.sleep(0)
+        return status, [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    store.create_run("r1", dataset="synthetic", model="mock", status="queued")
+    status, pending = asyncio.run(run())
+
+    assert status == "failed"
+    assert store.get_run("r1")["error"] == "judge unavailable"
+    assert pending == []
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from fastapi.testclient import TestClient
+
+import api.routes.metrics as metrics_routes
+from api.main import app
+from api.metrics import RunMetrics
+from evaluation.instrumentation import Tracer
+from jobs.queue import JobQueue
+from models.llm_clients.cache import CachedLLM, ResponseCache
+from models.llm_clients.mock import MockLLM
+from models.llm_clients.rate_limit import RateLimiter
+
+
+def _value(name, **labels):
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_spans_and_judgments_feed_call_counters():
+    run_metrics = RunMetrics("metrics-test", inference_client="model-a")
+    run_metrics.add_judge("judge.judge_0", "judge-a")
+    tracer = Tracer("r1", on_span=run_metrics.observe_span)
+
+    ok = _value("autoelave_llm_calls_total", client="model-a", role="inference", outcome="success")
+    failed = _value("autoelave_llm_calls_total", client="model-a", role="inference", outcome="error")
+    judged = _value("autoelave_llm_calls_total", client="judge-a", role="judge", outcome="success")
+    unparsed = _value("autoelave_judge_parse_failures_total", judge="judge_1")
+
+    tracer.record("llm.inference", 0.2, success=True)
+    tracer.record("llm.inference", 0.4, success=False)
+    with tracer.span("judge.judge_0", batch_size=4):
+        pass
+    with tracer.span("metric.exact_match"):
+        pass
+    run_metrics.observe_judgment({"raw_judgments": [{"judge_score": 4}, {"judge_score": None}]})
+
+    assert _value("autoelave_llm_calls_total", client="model-a", role="inference", outcome="success") == ok + 1
+    assert _value("autoelave_llm_calls_total", client="model-a", role="inference", outcome="error") == failed + 1
+    assert _value("autoelave_llm_calls_total", client="judge-a", role="judge", outcome="success") == judged + 4
+    assert _value("autoelave_samples_total", dataset="metrics-test") == 2
+    assert _value("autoelave_judge_parse_failures_total", judge="judge_1") == unparsed + 1
+
+
+def test_client_counters_only_count_growth_since_the_baseline(tmp_path):
+    limiter = RateLimiter(requests_per_minute=60_000)
+    mock = MockLLM(throttle_rate=0.3, rate_limiter=limiter, retry_delay=0.001)
+    for i in range(5):
+        mock.generate(f"Before the run {i}")
+    llm = CachedLLM(mock, ResponseCache(str(tmp_path / "cache.sqlite")))
+
+    run_metrics = RunMetrics("metrics-test", inference_client="mock-throttled")
+    clients = [("mock-throttled", llm)]
+    run_metrics.observe_clients(clients)
+    throttles_before = limiter.stats()["throttles"]
+    retries_before = mock.usage.stats()["retries"]
+    hits = _value("autoelave_cache_lookups_total", result="hit")
+
+    for i in range(20):
+        llm.generate(f"What is {i} + 1?")
+    llm.generate("What is 0 + 1?")
+    run_metrics.observe_clients(clients)
+    run_metrics.observe_clients(clients)
+
+    assert limiter.stats()["throttles"] > throttles_before
+    assert _value("autoelave_llm_throttles_total", client="mock-throttled") == limiter.stats()["throttles"] - throttles_before
+    assert _value("autoelave_llm_retries_total", client="mock-throttled") == mock.usage.stats()["retries"] - retries_before
+    assert _value("autoelave_llm_tokens_total", client="mock-throttled", direction="output") > 0
+    assert _value("autoelave_cache_lookups_total", result="hit") == hits + 1
+
+
+def test_metrics_endpoint_exports_queue_gauges(tmp_path, monkeypatch):
+    queue = JobQueue(f"sqlite:///{os.path.join(tmp_path, 'jobs.db')}")
+    queue.enqueue("run-1", {})
+    queue.enqueue("run-2", {})
+    queue.claim("worker-0")
+    monkeypatch.setattr(metrics_routes, "JOB_QUEUE", queue)
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "autoelave_queue_depth 1.0" in response.text
+    assert "autoelave_active_runs 1.0" in response.text
+    assert "autoelave_llm_calls_total" in response.text
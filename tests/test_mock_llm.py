@@ -0,0 +1,81 @@
+import asyncio
+import threading
+
+import pytest
+
+from eval_datasets.loaders.synthetic import SyntheticArithmeticLoader
+from evaluation.judges.llm_judge import LLMJudge
+from evaluation.metrics.exact_match import ExactMatchMetric
+from evaluation.orchestrator import evaluate_dataset
+from models.llm_clients.mock import MockLLM, MockThrottled
+from models.llm_clients.rate_limit import RateLimiter
+from models.llm_clients.registry import build_llm
+
+
+def test_outputs_are_deterministic_and_accuracy_is_configurable():
+    samples = SyntheticArithmeticLoader(size=400).load()
+    llm = MockLLM(accuracy=0.7, seed=3)
+
+    first = evaluate_dataset(samples, llm, "synthetic", max_workers=8)
+    second = evaluate_dataset(samples, MockLLM(accuracy=0.7, seed=3), "synthetic")
+
+    assert [r.model_output for r in first] == [r.model_output for r in second]
+
+    metric = ExactMatchMetric()
+    accuracy = sum(metric.compute(r)["exact_match"] for r in first) / len(first)
+    assert 0.6 < accuracy < 0.8
+
+
+def test_judge_replies_parse_and_track_correctness():
+    samples = SyntheticArithmeticLoader(size=50).load()
+    results = evaluate_dataset(samples, MockLLM(accuracy=0.5), "synthetic")
+    judge = LLMJudge(MockLLM(seed=1))
+    metric = ExactMatchMetric()
+
+    for result in results:
+        score = judge.judge(result)["judge_score"]
+        if metric.compute(result)["exact_match"]:
+            assert score in (4, 5)
+        else:
+            assert score in (1, 2, 3)
+
+
+def test_throttles_are_retried_through_the_rate_limiter():
+    limiter = RateLimiter(requests_per_minute=60_000)
+    llm = MockLLM(throttle_rate=0.3, rate_limiter=limiter, retry_delay=0.001)
+
+    outputs = [llm.generate(f"What is {i} + 1?") for i in range(50)]
+
+    assert all(outputs)
+    assert llm.throttles > 0
+    assert limiter.stats()["throttles"] == llm.throttles
+
+    with pytest.raises(MockThrottled):
+        MockLLM(throttle_rate=1.0).generate("q")
+
+
+def test_error_injection_and_spec_parsing():
+    llm = build_llm("mock:latency=0.001,latency_distribution=exponential,error_rate=1,seed=2")
+
+    assert isinstance(llm, MockLLM)
+    assert llm.latency_distribution == "exponential" and llm.seed == 2
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(llm.agenerate("q"))
+
+
+def test_http_mock_server_matches_in_process_mock():
+    from benchmarks.mock_server import make_server
+
+    server = make_server(MockLLM(throttle_rate=0.5), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        remote = MockLLM(url=url, rate_limiter=RateLimiter(60_000), retry_delay=0.001)
+        local = MockLLM(throttle_rate=0.5, rate_limiter=RateLimiter(60_000), retry_delay=0.001)
+
+        prompts = [f"What is {i} + 2?" for i in range(10)]
+        assert [remote.generate(p) for p in prompts] == [local.generate(p) for p in prompts]
+    finally:
+        server.shutdown()
+        server.server_close()
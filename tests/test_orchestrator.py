@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+
+from eval_datasets.schemas import EvalSample
+from evaluation.orchestrator import evaluate_dataset, aevaluate_dataset
+from models.llm_clients.base import BaseLLM
+
+
+class SleepyLLM(BaseLLM):
+    """
+    Local fake client that sleeps for a fixed latency per call.
+    """
+
+    def __init__(self, latency: float = 0.05, max_concurrency=None):
+        self.latency = latency
+        self.max_concurrency = max_concurrency
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        time.sleep(self.latency)
+        return f"echo: {prompt}"
+
+
+def _samples(n):
+    return [EvalSample(id=f"s_{i}", prompt=f"q{i}", reference="1") for i in range(n)]
+
+
+def test_concurrent_results_keep_input_order():
+    samples = _samples(20)
+    results = evaluate_dataset(samples, SleepyLLM(), "fake", max_workers=8)
+
+    assert [r.sample_id for r in results] == [s.id for s in samples]
+    assert all(r.model_output == f"echo: {s.prompt}" for r, s in zip(results, samples))
+
+
+def test_concurrent_mode_is_faster_than_sequential():
+    samples = _samples(20)
+    llm = SleepyLLM(latency=0.05)
+
+    start = time.perf_counter()
+    evaluate_dataset(samples, llm, "fake", max_workers=1)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    evaluate_dataset(samples, llm, "fake", max_workers=10)
+    concurrent = time.perf_counter() - start
+
+    assert concurrent < sequential / 3
+
+
+def test_client_concurrency_limit_is_respected():
+    class CountingLLM(SleepyLLM):
+        def __init__(self):
+            super().__init__(latency=0.02, max_concurrency=2)
+            self._lock = threading.Lock()
+            self.in_flight = 0
+            self.peak = 0
+
+        def generate(self, prompt: str, **kwargs) -> str:
+            with self._lock:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+            try:
+                return super().generate(prompt, **kwargs)
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+
+    llm = CountingLLM()
+    evaluate_dataset(_samples(10), llm, "fake", max_workers=16)
+
+    assert llm.peak <= 2
+
+
+def test_async_pipeline_uses_thread_offload_for_legacy_clients():
+    samples = _samples(20)
+    llm = SleepyLLM(latency=0.05)
+
+    start = time.perf_counter()
+    results = asyncio.run(aevaluate_dataset(samples, llm, "fake", max_concurrency=20))
+    elapsed = time.perf_counter() - start
+
+    assert [r.sample_id for r in results] == [s.id for s in samples]
+    assert all(r.success for r in results)
+    assert elapsed < 0.05 * 20 / 3
+
+
+def test_async_pipeline_with_native_async_client():
+    class AsyncSleepyLLM(SleepyLLM):
+        async def agenerate(self, prompt: str, **kwargs) -> str:
+            await asyncio.sleep(self.latency)
+            return f"async: {prompt}"
+
+    samples = _samples(200)
+    results = asyncio.run(
+        aevaluate_dataset(samples, AsyncSleepyLLM(latency=0.05), "fake", max_concurrency=200)
+    )
+
+    assert [r.model_output for r in results] == [f"async: {s.prompt}" for s in samples]
+
+
+class BatchingLLM(BaseLLM):
+    """
+    Fake native-batching client: one call per batch, fails on "bad".
+    """
+
+    supports_batching = True
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        if "bad" in prompt:
+            raise ValueError("bad prompt")
+        return f"echo: {prompt}"
+
+    def generate_batch(self, prompts, **kwargs):
+        self.batch_sizes.append(len(prompts))
+        time.sleep(0.01)
+        return [self.generate(prompt) for prompt in prompts]
+
+
+def test_micro_batches_keep_order_and_attribute_latency():
+    samples = _samples(10)
+    llm = BatchingLLM()
+
+    results = evaluate_dataset(samples, llm, "fake", max_workers=2, batch_size=4)
+
+    assert sorted(llm.batch_sizes) == [2, 4, 4]
+    assert [r.sample_id for r in results] == [s.id for s in samples]
+    assert all(r.success and 0 < r.latency < 0.01 for r in results)
+
+
+def test_failed_batch_is_retried_per_prompt():
+    samples = _samples(3) + [EvalSample(id="s_bad", prompt="bad", reference="1")]
+    results = asyncio.run(aevaluate_dataset(samples, BatchingLLM(), "fake", batch_size=8))
+
+    assert [r.success for r in results] == [True, True, True, False]
+    assert results[-1].error == "bad prompt"
+
+
+def test_batches_are_token_bounded():
+    from evaluation.batching import make_batches
+
+    prompts = ["x" * 40, "x" * 40, "x" * 400, "x" * 40]
+    batches = list(make_batches(prompts, max_batch_size=10, max_batch_tokens=25))
+
+    assert [len(b) for b in batches] == [2, 1, 1]
+
+
+def test_batch_fallback_uses_concurrent_single_calls():
+    llm = SleepyLLM(latency=0.05)
+
+    start = time.perf_counter()
+    results = evaluate_dataset(_samples(8), llm, "fake", batch_size=8)
+    elapsed = time.perf_counter() - start
+
+    assert all(r.success for r in results)
+    assert elapsed < 0.05 * 8 / 3
+
+
+def test_batches_in_flight_respect_client_limit():
+    class CountingBatchLLM(BatchingLLM):
+        max_concurrency = 2
+
+        def __init__(self, supports_batching):
+            super().__init__()
+            self.supports_batching = supports_batching
+            self._lock = threading.Lock()
+            self.in_flight = 0
+            self.peak = 0
+
+        def generate(self, prompt: str, **kwargs) -> str:
+            with self._lock:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+            time.sleep(0.01)
+            with self._lock:
+                self.in_flight -= 1
+            return f"echo: {prompt}"
+
+    for supports_batching in (True, False):
+        llm = CountingBatchLLM(supports_batching)
+        results = evaluate_dataset(_samples(16), llm, "fake", max_workers=8, batch_size=2)
+        assert all(r.success for r in results)
+        assert llm.peak == 2
+
+        llm = CountingBatchLLM(supports_batching)
+        results = asyncio.run(aevaluate_dataset(_samples(16), llm, "fake", max_concurrency=8, batch_size=2))
+        assert all(r.success for r in results)
+        assert llm.peak == 2
+
+    # Without native batching, batches share the client limit rather than
+    # running one at a time
+    llm = CountingBatchLLM(False)
+    llm.max_concurrency = 4
+    results = asyncio.run(aevaluate_dataset(_samples(16), llm, "fake", max_concurrency=8, batch_size=2))
+    assert all(r.success for r in results)
+    assert llm.peak == 4
@@ -0,0 +1,125 @@
+import json
+import threading
+
+from fastapi.testclient import TestClient
+
+import api.routes.report as report_routes
+from api.main import app
+from api.run_store import InMemoryRunStore
+from evaluation.progress import ProgressTracker
+from evaluation.results import EvalResult
+
+
+def _result(success=True):
+    return EvalResult(
+        sample_id="s", prompt="q", model_output="a", model_name="m",
+        dataset_name="d", latency=0.0, success=success,
+    )
+
+
+def test_tracker_reports_running_accuracy_and_throttles_publishing():
+    published = []
+    tracker = ProgressTracker(total=4, publish=published.append, min_interval=60)
+
+    tracker.set_stage("inference")
+    tracker.record_result(_result(), {"exact_match": 1})
+    tracker.record_result(_result(success=False), {"exact_match": 0})
+    tracker.record_result(_result(), {"exact_match": 1})
+    tracker.set_stage("judging")
+    tracker.record_judgment({"agreement_success": True})
+    tracker.record_judgment({"agreement_success": False})
+
+    # Only stage changes got past the 60s throttle
+    assert [p["stage"] for p in published] == ["inference", "judging"]
+
+    snapshot = tracker.snapshot()
+    assert snapshot["inferred"] == 3
+    assert snapshot["model_failures"] == 1
+    assert snapshot["running_accuracy"] == 0.667
+    assert snapshot["judge_coverage"] == 0.5
+    assert snapshot["percent_complete"] == 62.5
+
+
+def _parse_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_pushes_progress_until_the_run_finishes(monkeypatch):
+    store = InMemoryRunStore()
+    monkeypatch.setattr(report_routes, "RUN_STORE", store)
+
+    store.create_run("r1", dataset="gsm8k", model="m", status="running")
+    store.update_run("r1", progress={"stage": "inference", "inferred": 1})
+
+    # Only move on once the stream has seen the current state
+    polled = threading.Event()
+    get_run = store.get_run
+
+    def watched_get_run(run_id):
+        run = get_run(run_id)
+        polled.set()
+        return run
+
+    monkeypatch.setattr(store, "get_run", watched_get_run)
+
+    def wait_for_poll():
+        polled.clear()
+        polled.wait(5)
+        polled.clear()
+        polled.wait(5)
+
+    def finish():
+        wait_for_poll()
+        store.update_run("r1", progress={"stage": "judging", "inferred": 2})
+        wait_for_poll()
+        store.update_run("r1", status="completed", report={
+            "model": "m", "dataset": "gsm8k", "exact_match_accuracy": 1.0,
+            "avg_judge_score": 5, "judge_coverage": 1.0, "model_failure_rate": 0.0,
+            "high_disagreement_rate": 0.0,
+        })
+
+    threading.Thread(target=finish).start()
+    response = TestClient(app).get("/report/r1/stream", params={"poll_interval": 0.02})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_events(response.text)
+    assert [e[1]["progress"]["stage"] for e in events[:-1]] == ["inference", "judging"]
+    assert events[-1][0] == "completed"
+    assert events[-1][1]["exact_match_accuracy"] == 1.0
+
+
+def test_report_includes_every_optional_section(monkeypatch):
+    store = InMemoryRunStore()
+    monkeypatch.setattr(report_routes, "RUN_STORE", store)
+
+    sections = {
+        "confidence_intervals": {"exact_match": [0.4, 0.8]},
+        "categories": {"math": {"exact_match_accuracy": 0.5}},
+        "metrics": {"toxicity": {"num_scored": 2, "unavailable": "no detoxify"}},
+        "cascade": {"judge_calls": 3},
+        "lineage": {"copied_from": {"r0": 2}},
+        "batching": {"batches": 1},
+    }
+    store.create_run("r1", dataset="gsm8k", model="m", status="completed")
+    store.update_run("r1", report={
+        "model": "m", "dataset": "gsm8k", "exact_match_accuracy": 0.6, "avg_judge_score": 4.0,
+        "judge_coverage": 1.0, "model_failure_rate": 0.0, "high_disagreement_rate": 0.0,
+        **sections,
+    })
+    store.create_run("r2", dataset="gsm8k", model="m", status="completed")
+    store.update_run("r2", report={
+        "model": "m", "dataset": "gsm8k", "exact_match_accuracy": 0.6, "avg_judge_score": 4.0,
+        "judge_coverage": 1.0, "model_failure_rate": 0.0, "high_disagreement_rate": 0.0,
+    })
+
+    client = TestClient(app)
+    body = client.get("/report/r1").json()
+    assert {name: body[name] for name in sections} == sections
+
+    # Runs without them (e.g. no cascade) still report, with null sections
+    body = client.get("/report/r2").json()
+    assert all(body[name] is None for name in sections)
@@ -0,0 +1,87 @@
+import asyncio
+import time
+
+from models.llm_clients.rate_limit import RateLimiter, get_shared_limiter, stats_delta, track_limiter_usage
+
+
+def test_requests_are_paced_to_the_configured_rate():
+    limiter = RateLimiter(requests_per_minute=1200)  # 20/s, burst of 20
+
+    start = time.monotonic()
+    for _ in range(30):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+
+    assert 0.4 <= elapsed < 1.0
+    assert limiter.stats()["throttle_wait_seconds"] > 0
+
+
+def test_async_acquire_spreads_concurrent_callers():
+    limiter = RateLimiter(requests_per_minute=600, burst_seconds=0.1)  # 10/s, burst 1
+
+    async def burst():
+        return await asyncio.gather(*(limiter.aacquire() for _ in range(5)))
+
+    waits = asyncio.run(burst())
+    assert sorted(waits) == waits
+    assert waits[-1] >= 0.35
+
+
+def test_token_budget_limits_large_requests():
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=60000)  # 1000 tok/s
+
+    assert limiter.acquire(tokens=1000) == 0
+    assert limiter.acquire(tokens=500) >= 0.45
+
+
+def test_throttles_halve_rate_and_successes_recover():
+    limiter = RateLimiter(requests_per_minute=100, min_rate_factor=0.2, recovery_step=0.1)
+
+    for _ in range(5):
+        limiter.record_throttle()
+    assert limiter.stats()["effective_requests_per_minute"] == 20
+    assert limiter.stats()["throttles"] == 5
+
+    for _ in range(3):
+        limiter.record_success()
+    assert limiter.stats()["effective_requests_per_minute"] == 50
+
+
+def test_backoff_is_jittered_and_bounded():
+    limiter = RateLimiter(max_backoff=5.0)
+    delays = [limiter.backoff_delay(10, base=1.0) for _ in range(50)]
+
+    assert all(0 <= d <= 5.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_shared_limiter_is_per_key_and_stats_delta():
+    a = get_shared_limiter("test:model", requests_per_minute=6000)
+    assert get_shared_limiter("test:model") is a
+    assert get_shared_limiter("test:other") is not a
+
+    before = a.stats()
+    a.acquire()
+    assert stats_delta(before, a.stats())["requests"] == 1
+
+
+def test_limiter_usage_is_counted_per_run():
+    limiter = RateLimiter(requests_per_minute=60_000)
+
+    async def run(calls, throttles):
+        usage = track_limiter_usage()
+        for _ in range(calls):
+            await asyncio.to_thread(limiter.acquire)
+            await asyncio.sleep(0)
+        for _ in range(throttles):
+            limiter.record_throttle()
+        return usage.stats()
+
+    async def main():
+        return await asyncio.gather(run(3, 1), run(5, 0))
+
+    first, second = asyncio.run(main())
+
+    assert (first["requests"], first["throttles"]) == (3, 1)
+    assert (second["requests"], second["throttles"]) == (5, 0)
+    assert limiter.stats()["requests"] == 8
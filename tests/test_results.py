@@ -0,0 +1,68 @@
+import os
+import tempfile
+from dataclasses import asdict
+
+from evaluation.aggregation.report import aggregate_dataset_report
+from evaluation.columnar import ResultTable
+from evaluation.comparison.diff import diff_results
+from evaluation.results import EvalResult
+
+
+def _results(n, fail_every=4, model="model-a"):
+    return [
+        EvalResult(
+            sample_id=f"s_{i}",
+            prompt=f"question {i % 3}",
+            model_output="" if i % fail_every == 0 else f"answer {i}",
+            model_name=model,
+            dataset_name="gsm8k",
+            latency=0.1 * i,
+            success=i % fail_every != 0,
+            reference="#### 1",
+            error="boom" if i % fail_every == 0 else None,
+            metadata={"dataset": "gsm8k"},
+            timestamp=1.0,
+        )
+        for i in range(n)
+    ]
+
+
+def test_table_round_trips_results_and_uses_slotted_rows():
+    results = _results(10)
+    table = ResultTable.from_results(results)
+
+    assert len(table) == 10
+    assert table.to_results() == results
+    assert table[3].model_output == "answer 3"
+    assert table[-1].sample_id == "s_9"
+    assert not hasattr(table[0], "__dict__")
+    assert table[2:5].to_results() == results[2:5]
+    assert table[0].to_dict() == asdict(results[0])
+
+
+def test_parquet_round_trip():
+    table = ResultTable.from_results(_results(10))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "run.parquet")
+        table.to_parquet(path)
+        loaded = ResultTable.from_parquet(path)
+
+    assert loaded.to_results() == table.to_results()
+
+
+def test_aggregation_and_comparison_accept_tables():
+    results = _results(8)
+    table = ResultTable.from_results(results)
+    exact = [{"exact_match": int(r.success)} for r in results]
+    judges = [{"agreement_success": True, "scores": [4, 5]} for _ in results]
+
+    from_list = aggregate_dataset_report(results, exact, judges, "gsm8k", "model-a")
+    from_table = aggregate_dataset_report(table, exact, judges, "gsm8k", "model-a")
+    assert from_table == from_list
+
+    candidate = ResultTable.from_results(_results(8, fail_every=2, model="model-b"))
+    diff = diff_results(table, candidate)
+    assert diff["num_paired"] == 8
+    assert diff["new_failures"] == 2
+    assert diff["fixed_failures"] == 0
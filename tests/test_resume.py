@@ -0,0 +1,116 @@
+import asyncio
+import json
+import tempfile
+
+import api.pipeline as pipeline
+from api.run_store import InMemoryRunStore
+from eval_datasets.schemas import EvalSample
+from evaluation.checkpoint import RunLog
+from evaluation.orchestrator import evaluate_dataset
+from models.llm_clients.base import BaseLLM
+
+
+class EchoLLM(BaseLLM):
+    model_name = "echo"
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        return f"echo: {prompt}"
+
+
+def test_run_log_replays_results_and_skips_torn_lines():
+    samples = [EvalSample(id=f"s_{i}", prompt=f"q{i}", reference="1") for i in range(3)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = RunLog("eval-test", directory=tmp)
+        log.write_header(dataset="fake", model_name="m")
+
+        results = evaluate_dataset(samples, EchoLLM(), "fake", on_result=log.append_result)
+        log.append_exact_match("s_0", {"exact_match": 1})
+        log.append_judgment("s_0", {"agreement_success": True, "scores": [5, 5]})
+        log.close()
+
+        with open(log.path, "a") as f:
+            f.write('{"type": "result", "sample_id": "s_3", "da')
+
+        checkpoint = log.load()
+
+    assert checkpoint.header["dataset"] == "fake"
+    assert list(checkpoint.completed_results()) == [r.sample_id for r in results]
+    assert checkpoint.results["s_1"] == results[1]
+    assert checkpoint.exact_match["s_0"] == {"exact_match": 1}
+    assert checkpoint.judgments["s_0"]["scores"] == [5, 5]
+
+
+def test_records_are_synced_in_the_background(monkeypatch):
+    synced = []
+    monkeypatch.setattr("evaluation.checkpoint.os.fsync", synced.append)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = RunLog("eval-test", directory=tmp, sync_interval=60)
+        for i in range(50):
+            log.append_exact_match(f"s_{i}", {"exact_match": 1})
+
+        # Readable at once, synced only on close
+        assert len(log.load().exact_match) == 50
+        assert synced == []
+        log.close()
+        assert len(synced) == 1
+
+
+class FlakyLLM(EchoLLM):
+    """
+    Fails the prompts in `failing`; records every prompt it is sent.
+    """
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.prompts = []
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        self.prompts.append(prompt)
+        if prompt in self.failing:
+            raise RuntimeError("unavailable")
+        return super().generate(prompt, **kwargs)
+
+
+def _records(log_path, kind):
+    with open(log_path) as f:
+        return [r["sample_id"] for r in map(json.loads, f) if r["type"] == kind]
+
+
+def test_resume_only_reruns_samples_whose_model_call_failed(tmp_path, monkeypatch):
+    store = InMemoryRunStore()
+    samples = pipeline.load_dataset_by_name("synthetic", limit=6)
+    failing = {samples[1].prompt, samples[4].prompt}
+    rerun = FlakyLLM()
+    clients = iter([FlakyLLM(failing), rerun])
+
+    monkeypatch.setattr(pipeline, "RUN_STORE", store)
+    monkeypatch.setattr(pipeline, "RunLog", lambda run_id: RunLog(run_id, directory=str(tmp_path)))
+    monkeypatch.setenv("AUTOELAVE_JUDGE_MODEL", "mock")
+    build_llm = pipeline.build_llm
+    monkeypatch.setattr(
+        pipeline, "build_llm", lambda name: next(clients) if name == "flaky" else build_llm(name)
+    )
+
+    store.create_run("r1", dataset="synthetic", model="flaky", status="queued")
+    first = asyncio.run(pipeline.run_evaluation_background("r1", "synthetic", "flaky", max_samples=6))
+    log_path = str(tmp_path / "r1.jsonl")
+    judged = len(_records(log_path, "judgment"))
+
+    store.update_run("r1", status="failed")
+    second = asyncio.run(
+        pipeline.run_evaluation_background("r1", "synthetic", "flaky", max_samples=6, resume=True)
+    )
+
+    assert (first, second) == ("completed", "completed")
+    retried = [samples[1].id, samples[4].id]
+    # Only the failed samples go back to the model, exact match and judges
+    assert sorted(rerun.prompts) == sorted(failing)
+    assert sorted(_records(log_path, "result")[6:]) == retried
+    assert sorted(_records(log_path, "exact_match")[6:]) == retried
+    assert sorted(_records(log_path, "judgment")[judged:]) == retried
+
+    stored = {s["sample_id"]: s for s in store.get_samples("r1")}
+    assert len(stored) == 6
+    assert all(s["result"]["success"] for s in stored.values())
@@ -0,0 +1,142 @@
+import os
+import tempfile
+
+import pytest
+
+from api.run_store import CachedRunStore, InMemoryRunStore, SQLiteRunStore, build_run_store
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request):
+    if request.param == "memory":
+        yield InMemoryRunStore()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteRunStore(f"sqlite:///{os.path.join(tmp, 'runs.db')}")
+        yield store
+        store.engine.dispose()
+
+
+def test_run_lifecycle_and_indexed_listing(store):
+    store.create_run("r1", dataset="gsm8k", model="a", created_at=1.0)
+    store.create_run("r2", dataset="gsm8k", model="b", created_at=2.0)
+    store.create_run("r3", dataset="truthfulqa", model="a", created_at=3.0)
+
+    assert "r1" in store
+    assert "missing" not in store
+    assert store.get_run("r1")["status"] == "running"
+
+    store.update_run("r1", status="completed", report={"exact_match_accuracy": 0.5})
+    run = store.get_run("r1")
+    assert run["status"] == "completed"
+    assert run["report"] == {"exact_match_accuracy": 0.5}
+
+    assert [r["run_id"] for r in store.list_runs(dataset="gsm8k")] == ["r2", "r1"]
+    assert [r["run_id"] for r in store.list_runs(model="a")] == ["r3", "r1"]
+    assert [r["run_id"] for r in store.list_runs(status="completed")] == ["r1"]
+    assert "report" not in store.list_runs()[0]
+
+
+def test_per_sample_records(store):
+    store.create_run("r1", dataset="gsm8k", model="a")
+    store.save_samples("r1", [{"sample_id": "s_0", "exact_match": {"exact_match": 1}}])
+    store.save_samples("r1", [{"sample_id": "s_1", "exact_match": {"exact_match": 0}}])
+
+    assert [s["sample_id"] for s in store.get_samples("r1")] == ["s_0", "s_1"]
+    assert store.get_samples("other") == []
+
+
+def test_find_samples_by_fingerprint(store):
+    store.create_run("old", dataset="gsm8k", model="a", status="completed", created_at=1.0)
+    store.create_run("new", dataset="gsm8k", model="a", status="completed", created_at=2.0)
+    store.create_run("failed", dataset="gsm8k", model="a", status="failed", created_at=3.0)
+    store.save_samples("old", [{"sample_id": "s_0", "fingerprint": "f0", "v": 1}])
+    store.save_samples("new", [{"sample_id": "s_0", "fingerprint": "f0", "v": 2}])
+    store.save_samples("failed", [
+        {"sample_id": "s_0", "fingerprint": "f0", "v": 3},
+        {"sample_id": "s_1", "fingerprint": "f1", "v": 3},
+    ])
+
+    found = store.find_samples(["f0", "f1", "missing"])
+
+    assert list(found) == ["f0"]
+    assert found["f0"]["v"] == 2 and found["f0"]["run_id"] == "new"
+
+
+def test_sqlite_store_migrates_old_sample_tables():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'runs.db')}"
+        store = SQLiteRunStore(url)
+        with store.engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_run_samples_fingerprint")
+            conn.exec_driver_sql("ALTER TABLE run_samples DROP COLUMN fingerprint")
+        store.engine.dispose()
+
+        store = SQLiteRunStore(url)
+        store.create_run("r1", dataset="gsm8k", model="a", status="completed")
+        store.save_samples("r1", [{"sample_id": "s_0", "fingerprint": "f0"}])
+
+        assert store.find_samples(["f0"])["f0"]["run_id"] == "r1"
+        store.engine.dispose()
+
+
+def test_lru_cache_only_holds_finished_runs():
+    class CountingStore(InMemoryRunStore):
+        reads = 0
+
+        def get_run(self, run_id):
+            CountingStore.reads += 1
+            return super().get_run(run_id)
+
+    backing = CountingStore()
+    store = CachedRunStore(backing, max_entries=2)
+
+    for run_id in ("r1", "r2", "r3"):
+        store.create_run(run_id, dataset="d", model="m")
+
+    store.get_run("r1")
+    store.get_run("r1")
+    assert CountingStore.reads == 2  # running: always read through
+
+    store.update_run("r1", status="completed", report={})
+    store.get_run("r1")
+    store.get_run("r1")
+    assert CountingStore.reads == 3
+
+    store.update_run("r2", status="completed")
+    store.update_run("r3", status="failed")
+    store.get_run("r2")
+    store.get_run("r3")  # evicts r1
+    store.get_run("r1")
+    assert CountingStore.reads == 6
+
+
+def test_cached_runs_are_revalidated_against_other_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'runs.db')}"
+        api_worker, job_worker = CachedRunStore(SQLiteRunStore(url)), SQLiteRunStore(url)
+
+        job_worker.create_run("r1", dataset="d", model="m", status="failed")
+        assert api_worker.get_run("r1")["status"] == "failed"
+
+        # Resumed and finished through another process
+        job_worker.create_run("r1", dataset="d", model="m", status="running")
+        assert api_worker.get_run("r1")["status"] == "running"
+        job_worker.update_run("r1", status="completed", report={"ok": True})
+        assert api_worker.get_run("r1")["report"] == {"ok": True}
+
+        for store in (api_worker.store, job_worker):
+            store.engine.dispose()
+
+
+def test_samples_saved_again_replace_their_records(store):
+    store.create_run("r1", dataset="d", model="m")
+    store.save_samples("r1", [{"sample_id": "a", "v": 1}, {"sample_id": "b", "v": 1}])
+    store.save_samples("r1", [{"sample_id": "a", "v": 2}])
+
+    assert sorted((s["sample_id"], s["v"]) for s in store.get_samples("r1")) == [("a", 2), ("b", 1)]
+
+
+def test_build_run_store_from_env_value():
+    assert isinstance(build_run_store("memory").store, InMemoryRunStore)
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from eval_datasets.loaders.truthfulqa import TruthfulQALoader
+from evaluation.metrics.semantic_similarity import EmbeddingCache, SemanticSimilarityMetric
+from evaluation.results import EvalResult
+
+
+class BagOfWordsEncoder:
+    """
+    Deterministic stand-in for a SentenceTransformer: normalized word counts.
+    """
+
+    VOCAB = ["cat", "dog", "sky", "blue", "green", "red", "is", "the"]
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, batch_size, normalize_embeddings, convert_to_numpy, show_progress_bar):
+        self.encoded.append(list(texts))
+        vectors = np.array([
+            [text.lower().split().count(word) for word in self.VOCAB] + [1e-3] for text in texts
+        ], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _result(i, output, reference="the sky is blue", incorrect=("the sky is green", "the sky is red"), success=True):
+    return EvalResult(
+        sample_id=f"truthfulqa_{i}", prompt="What colour is the sky?", model_output=output,
+        model_name="m", dataset_name="truthfulqa", latency=0.1, success=success,
+        reference=reference, metadata={"incorrect_answers": list(incorrect)},
+    )
+
+
+def test_scores_against_best_and_incorrect_answers(tmp_path):
+    metric = SemanticSimilarityMetric(cache_path=str(tmp_path / "emb.sqlite"), encoder=BagOfWordsEncoder())
+
+    right, wrong, failed, unreferenced = metric.compute_batch([
+        _result(0, "The sky is blue"),
+        _result(1, "the sky is red"),
+        _result(2, "", success=False),
+        _result(3, "anything", reference=None),
+    ])
+
+    assert right["similarity_best"] == pytest.approx(1.0, abs=1e-3)
+    assert right["closer_to_correct"] == 1 and right["similarity_margin"] > 0
+    assert wrong["similarity_incorrect"] == pytest.approx(1.0, abs=1e-3)
+    assert wrong["closer_to_correct"] == 0 and wrong["similarity_margin"] < 0
+    assert failed == {
+        "similarity_best": 0.0, "similarity_incorrect": None,
+        "similarity_margin": None, "closer_to_correct": 0,
+    }
+    assert set(unreferenced.values()) == {None}
+
+
+def test_later_runs_only_encode_model_outputs(tmp_path):
+    path = str(tmp_path / "emb.sqlite")
+    results = [_result(i, f"the sky is {colour}") for i, colour in enumerate(["blue", "red", "blue"])]
+
+    first = SemanticSimilarityMetric(cache_path=path, encoder=BagOfWordsEncoder(), batch_size=2)
+    scores = first.compute_batch(results)
+    # Shared references are encoded once, in one batch, then the outputs
+    assert first.encoder.encoded == [
+        ["the sky is blue", "the sky is green", "the sky is red"],
+        ["the sky is blue", "the sky is red", "the sky is blue"],
+    ]
+
+    second = SemanticSimilarityMetric(cache_path=path, encoder=BagOfWordsEncoder())
+    assert second.compute_batch(results) == scores
+    assert second.encoder.encoded == [[r.model_output for r in results]]
+    assert second.cache.stats()["hits"] == 3
+
+
+def test_cache_is_keyed_by_dataset_version(tmp_path, monkeypatch):
+    path = str(tmp_path / "emb.sqlite")
+    SemanticSimilarityMetric(cache_path=path, encoder=BagOfWordsEncoder()).compute_batch([_result(0, "blue")])
+
+    monkeypatch.setattr(TruthfulQALoader, "version", "2")
+    metric = SemanticSimilarityMetric(cache_path=path, encoder=BagOfWordsEncoder())
+    metric.compute_batch([_result(0, "blue")])
+
+    assert metric.encoder.encoded[0] == ["the sky is blue", "the sky is green", "the sky is red"]
+    assert metric.cache.stats()["hits"] == 0
+
+
+def test_embedding_cache_roundtrip(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb.sqlite"))
+    cache.put_many("m|d@1", {f"k{i}": np.full(4, i, dtype=np.float32) for i in range(600)})
+
+    found = cache.get_many("m|d@1", [f"k{i}" for i in range(0, 700, 50)])
+
+    assert sorted(found) == sorted(f"k{i}" for i in range(0, 600, 50))
+    assert found["k550"].tolist() == [550.0] * 4
+    assert cache.get_many("m|d@2", ["k1"]) == {}
+    assert cache.stats() == {"hits": 12, "misses": 3, "hit_rate": 0.8}
+
+
+def test_scores_are_none_when_the_encoder_cannot_load(tmp_path, monkeypatch):
+    import evaluation.metrics.semantic_similarity as semantic_similarity
+
+    calls = []
+
+    def offline(model_name):
+        calls.append(model_name)
+        raise OSError(f"cannot download {model_name}")
+
+    monkeypatch.setattr(semantic_similarity, "load_encoder", offline)
+    metric = SemanticSimilarityMetric(model_name="m", cache_path=str(tmp_path / "emb.sqlite"))
+
+    for _ in range(2):
+        scores = metric.compute_batch([_result(0, "blue"), _result(1, "", success=False)])
+        assert all(set(score.values()) == {None} for score in scores)
+
+    assert metric.unavailable == "cannot download m"
+    assert calls == ["m"]
+
+
+def test_pipeline_reports_why_the_encoder_is_unavailable(tmp_path, monkeypatch):
+    import evaluation.metrics.semantic_similarity as semantic_similarity
+    from evaluation.metrics.pipeline import MetricPipeline
+
+    def offline(model_name):
+        raise OSError(f"cannot download {model_name}")
+
+    monkeypatch.setattr(semantic_similarity, "load_encoder", offline)
+    pipeline = MetricPipeline([
+        SemanticSimilarityMetric(model_name="m", cache_path=str(tmp_path / "emb.sqlite"))
+    ])
+
+    scores = pipeline.compute([_result(0, "blue"), _result(1, "red")])
+
+    assert all(set(score.values()) == {None} for score in scores["semantic_similarity"])
+    assert pipeline.errors == {}
+    assert pipeline.unavailable == {"semantic_similarity": "cannot download m"}
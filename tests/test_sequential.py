@@ -0,0 +1,81 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from eval_datasets.loaders.synthetic import SyntheticArithmeticLoader
+from evaluation.comparison.sequential import (
+    ConfidenceSequence,
+    SequentialComparison,
+    asequential_compare,
+)
+from evaluation.orchestrator import evaluate_dataset
+from models.llm_clients.mock import MockLLM
+
+
+def test_confidence_sequence_covers_the_mean_at_every_step():
+    rng = np.random.default_rng(0)
+    misses = 0
+    for _ in range(40):
+        cs = ConfidenceSequence(alpha=0.05)
+        diffs = (rng.random(300) < 0.6).astype(int) - (rng.random(300) < 0.7).astype(int)
+        for d in diffs:
+            cs.update(d)
+            low, high = cs.interval
+            if not low <= -0.1 <= high:
+                misses += 1
+                break
+
+    assert misses <= 4
+    assert high - low < 0.3
+
+
+def test_undecided_comparison_falls_back_to_the_point_estimate():
+    comparison = SequentialComparison(margin=0.03)
+    for i in range(10):
+        comparison.update(1, 1 if i % 5 else 0)
+
+    assert comparison.check() is None
+    summary = comparison.summary(total_samples=10, decision=None)
+
+    assert summary["decided_early"] is False
+    assert summary["samples_saved"] == 0
+    assert summary["accuracy_delta"] == -0.2
+    assert summary["regression_passed"] is False
+
+
+def test_broken_candidate_is_rejected_early():
+    samples = SyntheticArithmeticLoader(size=1000).load()
+
+    summary = asyncio.run(asequential_compare(
+        samples,
+        candidate_llm=MockLLM(accuracy=0.2),
+        baseline_llm=MockLLM(accuracy=0.9),
+        dataset_name="synthetic",
+    ))
+
+    assert summary["regression_passed"] is False
+    assert summary["decided_early"] is True
+    assert summary["samples_evaluated"] < 200
+    assert summary["llm_calls_saved"] == 2 * summary["samples_saved"]
+
+
+def test_stored_baseline_results_are_reused():
+    samples = SyntheticArithmeticLoader(size=600).load()
+    baseline = {r.sample_id: r for r in evaluate_dataset(samples[:500], MockLLM(accuracy=0.8), "synthetic")}
+    candidate = MockLLM(accuracy=0.8)
+
+    summary = asyncio.run(asequential_compare(
+        samples,
+        candidate_llm=candidate,
+        baseline_results=baseline,
+        dataset_name="synthetic",
+        margin=0.1,
+    ))
+
+    assert summary["samples_total"] == 500
+    assert summary["regression_passed"] is True
+    assert candidate.calls == summary["samples_evaluated"]
+
+    with pytest.raises(ValueError):
+        asyncio.run(asequential_compare(samples, candidate, "synthetic"))
@@ -0,0 +1,122 @@
+from evaluation.metrics.toxicity import ToxicityMetric
+from evaluation.results import EvalResult
+
+
+class KeywordModel:
+    """
+    Stand-in for a Detoxify classifier: toxicity from a few keywords.
+    """
+
+    WORDS = {"idiot": 0.6, "stupid": 0.3}
+
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, texts):
+        self.batches.append(list(texts))
+        return {
+            "toxicity": [min(1.0, sum(v for w, v in self.WORDS.items() if w in t.lower())) for t in texts],
+            "insult": [0.0 for _ in texts],
+        }
+
+
+def _result(i, prompt, output, success=True):
+    return EvalResult(
+        sample_id=f"safety_{i}", prompt=prompt, model_output=output, model_name="m",
+        dataset_name="safety", latency=0.1, success=success, metadata={"toxicity": 0.2},
+    )
+
+
+def test_scores_continuation_and_delta_from_prompt():
+    metric = ToxicityMetric(model=KeywordModel())
+
+    worse, calmer, failed = metric.compute_batch([
+        _result(0, "He said the plan was", "stupid, what an idiot"),
+        _result(1, "You stupid", "person, I disagree politely"),
+        _result(2, "Anything", "", success=False),
+    ])
+
+    assert worse == {"toxicity": 0.9, "prompt_toxicity": 0.0, "toxicity_delta": 0.9, "toxic": 1}
+    assert calmer == {"toxicity": 0.0, "prompt_toxicity": 0.3, "toxicity_delta": -0.3, "toxic": 0}
+    assert set(failed.values()) == {None}
+
+
+def test_texts_are_classified_once_in_batches():
+    model = KeywordModel()
+    metric = ToxicityMetric(model=model, batch_size=3)
+    results = [_result(i, "Same prompt", f"reply {i % 2}") for i in range(6)]
+
+    scores = metric.compute_batch(results)
+
+    assert model.batches == [["reply 0", "reply 1", "Same prompt"]]
+    assert scores == [metric.compute(r) for r in results]
+
+    model.batches.clear()
+    metric.compute_batch([_result(i, f"prompt {i}", f"reply {i}") for i in range(4)])
+    assert [len(batch) for batch in model.batches] == [3, 3, 2]
+
+
+def test_scores_are_none_when_detoxify_cannot_load(monkeypatch):
+    import evaluation.metrics.toxicity as toxicity
+
+    calls = []
+
+    def missing():
+        calls.append(1)
+        raise ImportError("ToxicityMetric requires detoxify and torch.")
+
+    monkeypatch.setattr(toxicity, "_require_detoxify", missing)
+    metric = ToxicityMetric(model_type="missing-model")
+
+    # Nothing to classify, so no attempt to load
+    assert metric.compute_batch([_result(0, "p", "", success=False)])[0]["toxicity"] is None
+    assert calls == []
+
+    for _ in range(2):
+        assert set(metric.compute_batch([_result(0, "p", "reply")])[0].values()) == {None}
+    assert metric.unavailable == "ToxicityMetric requires detoxify and torch."
+    assert calls == [1]
+
+
+def test_torch_threads_are_set_per_prediction_and_restored(monkeypatch):
+    import evaluation.metrics.toxicity as toxicity
+
+    class FakeTorch:
+        threads = 8
+        seen = []
+
+        @classmethod
+        def get_num_threads(cls):
+            return cls.threads
+
+        @classmethod
+        def set_num_threads(cls, n):
+            cls.threads = n
+
+    class ThreadRecordingModel(KeywordModel):
+        def predict(self, texts):
+            FakeTorch.seen.append(FakeTorch.threads)
+            return super().predict(texts)
+
+    monkeypatch.setattr(toxicity, "_require_detoxify", lambda: (FakeTorch, None))
+    metric = ToxicityMetric(num_threads=2, model=ThreadRecordingModel())
+
+    metric.compute_batch([_result(0, "p", "you idiot")])
+    assert FakeTorch.seen == [2]
+    assert FakeTorch.threads == 8
+
+
+def test_models_are_cached_per_thread_count(monkeypatch):
+    import evaluation.metrics.toxicity as toxicity
+
+    class FakeDetoxify:
+        @staticmethod
+        def Detoxify(model_type, **kwargs):
+            return KeywordModel()
+
+    monkeypatch.setattr(toxicity, "_MODELS", {})
+    monkeypatch.setattr(toxicity, "_require_detoxify", lambda: (None, FakeDetoxify))
+
+    one = toxicity.load_detoxify("original", num_threads=1)
+    assert toxicity.load_detoxify("original", num_threads=1) is one
+    assert toxicity.load_detoxify("original", num_threads=4) is not one